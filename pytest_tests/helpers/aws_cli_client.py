@@ -7,12 +7,17 @@ from typing import Optional
 import allure
 from cli_helpers import _cmd_run
 from common import ASSETS_DIR
+from perf_stats import measured_methods
 
 logger = logging.getLogger("NeoLogger")
 REGULAR_TIMEOUT = 90
 LONG_TIMEOUT = 240
 
 
+@measured_methods(
+    endpoint_attr="s3gate_endpoint",
+    size_args={"put_object": "Body", "get_object": "file_path", "upload_part": "Body"},
+)
 class AwsCliClient:
     # Flags that we use for all S3 commands: disable SSL verification (as we use self-signed
     # certificate in devenv) and disable automatic pagination in CLI output
@@ -0,0 +1,121 @@
+import json
+import logging
+import threading
+from typing import Any, Optional
+
+import requests
+from neofs_testlib.blockchain import RPCClient
+from neofs_testlib.blockchain.rpc_client import NeoRPCException
+
+logger = logging.getLogger("NeoLogger")
+
+
+class ChainRPCClient(RPCClient):
+    """
+    JSON-RPC client of neo-go node that keeps HTTP connection alive between calls and can send
+    several calls with a single batch request
+
+    Example:
+        client = ChainRPCClient("http://main-chain.neofs.devenv:30333")
+        balances = client.get_nep17_balances_batch([address_1, address_2])
+    """
+
+    def __init__(self, endpoint: str, timeout: int = 10) -> None:
+        super().__init__(endpoint, timeout)
+        # Requests session keeps connection alive between calls; it is not thread-safe
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+
+    def call(self, method: str, params: Optional[list] = None) -> Any:
+        """
+        Makes a call and returns its result, raises NeoRPCException if the call failed
+        """
+        body = self._post(build_request(method, params))
+        if "error" in body:
+            raise NeoRPCException(f"Call of {method} on {self.endpoint} failed: {body['error']}")
+        return body["result"]
+
+    def call_batch(self, calls: list[tuple[str, list]]) -> list[dict]:
+        """
+        Makes several calls with a single JSON-RPC batch request
+
+        Returns:
+            responses to the calls in the same order, each with either `result` or `error` field
+        """
+        if not calls:
+            return []
+        body = self._post(
+            json.dumps(
+                [
+                    {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+                    for request_id, (method, params) in enumerate(calls)
+                ]
+            )
+        )
+        if isinstance(body, dict):
+            # Batch that is rejected as a whole gets a single error response
+            raise NeoRPCException(f"Batch call on {self.endpoint} failed: {body.get('error')}")
+        responses = {item.get("id"): item for item in body}
+        return [
+            responses.get(request_id, {"error": "no response"}) for request_id in range(len(calls))
+        ]
+
+    def get_nep17_balances_batch(self, addresses: list[str]) -> dict[str, dict]:
+        """
+        Returns NEP-17 balances of several addresses, see `get_nep17_balances`
+        """
+        results = self._get_results(
+            "getnep17balances", self.call_batch([("getnep17balances", [a, 0]) for a in addresses])
+        )
+        return dict(zip(addresses, results))
+
+    def invoke_function_batch(self, invocations: list[tuple[str, str, list]]) -> list[dict]:
+        """
+        Invokes several contract functions, see `invoke_function`
+
+        Args:
+            invocations: script hash of contract, name of function and its params per invocation
+        """
+        return self._get_results(
+            "invokefunction",
+            self.call_batch(
+                [
+                    ("invokefunction", [sc_hash, function, params, []])
+                    for sc_hash, function, params in invocations
+                ]
+            ),
+        )
+
+    def _get_results(self, method: str, responses: list[dict]) -> list[Any]:
+        errors = [response["error"] for response in responses if "error" in response]
+        if errors:
+            raise NeoRPCException(f"Calls of {method} on {self.endpoint} failed: {errors}")
+        return [response["result"] for response in responses]
+
+    def _call_endpoint(self, method, params=None) -> dict[str, Any]:
+        payload = build_request(method, params)
+        logger.info(payload)
+        try:
+            body = self._post(payload)
+            return body["result"] if "result" in body else body
+        except Exception as exc:
+            raise NeoRPCException(
+                f"Could not call method {method} "
+                f"with endpoint: {self.endpoint}: {exc}"
+                f"\nRequest sent: {payload}"
+            ) from exc
+
+    def _post(self, payload: str) -> Any:
+        with self._lock:
+            response = self._session.post(self.endpoint, data=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+def build_request(method: str, params: Optional[list] = None, request_id: int = 1) -> str:
+    """
+    Returns JSON-RPC request body, used both for HTTP calls and WebSocket subscriptions
+    """
+    return json.dumps(
+        {"jsonrpc": "2.0", "method": method, "params": params or [], "id": request_id}
+    )
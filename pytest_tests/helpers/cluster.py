@@ -1,14 +1,25 @@
 import random
 import re
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import data_formatters
 import yaml
-from neofs_testlib.blockchain import RPCClient
+from chain_rpc import ChainRPCClient
+from common import (
+    EPOCH_POLL_INTERVAL,
+    MAINNET_WEBSOCKET_ENABLED,
+    MORPH_WEBSOCKET_ENABLED,
+    STORAGE_ENDPOINT_SELECTION_POLICY,
+)
+from endpoint_selector import EndpointSelector
+from epoch_watcher import EpochWatcher
 from neofs_testlib.hosting import Host, Hosting
 from neofs_testlib.hosting.config import ServiceConfig
+from response_cache import invalidate_caches
 from test_control import wait_for_success
+from transaction_tracker import TransactionTracker
 
 
 @dataclass
@@ -25,6 +36,8 @@ class NodeBase:
         self.id = id
         self.name = name
         self.host = host
+        # Service attributes are resolved once, so that getters do not query host config
+        self._attributes = MappingProxyType(dict(host.get_service_config(name).attributes))
         self.construct()
 
     def construct(self):
@@ -49,10 +62,13 @@ class NodeBase:
     @wait_for_success(60, 1)
     def start_service(self):
         self.host.start_service(self.name)
+        # Responses of requests sent directly to the node depend on its state
+        invalidate_caches("head_object")
 
     @wait_for_success(60, 1)
     def stop_service(self):
         self.host.stop_service(self.name)
+        invalidate_caches("head_object")
 
     def get_wallet_password(self) -> str:
         return self._get_attribute(_ConfigAttributes.WALLET_PASSWORD)
@@ -90,14 +106,20 @@ class NodeBase:
         storage_wallet_pass = self.get_wallet_password()
         return data_formatters.get_wallet_public_key(storage_wallet_path, storage_wallet_pass)
 
+    @property
+    def attributes(self) -> Mapping[str, str]:
+        """
+        Returns read-only snapshot of service attributes taken when node was created
+        """
+        return self._attributes
+
     def _get_attribute(self, attribute_name: str, default_attribute_name: str = None) -> list[str]:
-        config = self.host.get_service_config(self.name)
         if default_attribute_name:
-            return config.attributes.get(
-                attribute_name, config.attributes.get(default_attribute_name)
+            return self._attributes.get(
+                attribute_name, self._attributes.get(default_attribute_name)
             )
         else:
-            return config.attributes.get(attribute_name)
+            return self._attributes.get(attribute_name)
 
     def _get_service_config(self) -> ServiceConfig:
         return self.host.get_service_config(self.name)
@@ -152,10 +174,17 @@ class MorphChain(NodeBase):
         since neofs network will still treat it as "node"
     """
 
-    rpc_client: RPCClient = None
+    rpc_client: ChainRPCClient = None
+    epoch_watcher: EpochWatcher = None
 
     def construct(self):
-        self.rpc_client = RPCClient(self.get_endpoint())
+        self.rpc_client = ChainRPCClient(self.get_endpoint())
+        self.epoch_watcher = EpochWatcher(
+            self.get_endpoint(),
+            use_websocket=MORPH_WEBSOCKET_ENABLED,
+            poll_interval=EPOCH_POLL_INTERVAL,
+            rpc_client=self.rpc_client,
+        )
 
     def get_endpoint(self) -> str:
         return self._get_attribute(_ConfigAttributes.ENDPOINT_INTERNAL)
@@ -175,10 +204,14 @@ class MainChain(NodeBase):
         since neofs network will still treat it as "node"
     """
 
-    rpc_client: RPCClient = None
+    rpc_client: ChainRPCClient = None
+    transaction_tracker: TransactionTracker = None
 
     def construct(self):
-        self.rpc_client = RPCClient(self.get_endpoint())
+        self.rpc_client = ChainRPCClient(self.get_endpoint())
+        self.transaction_tracker = TransactionTracker(
+            self.get_endpoint(), use_websocket=MAINNET_WEBSOCKET_ENABLED, rpc_client=self.rpc_client
+        )
 
     def get_endpoint(self) -> str:
         return self._get_attribute(_ConfigAttributes.ENDPOINT_INTERNAL)
@@ -223,6 +256,8 @@ class Cluster:
 
     def __init__(self, hosting: Hosting) -> None:
         self._hosting = hosting
+        self._topology: Optional[ClusterTopology] = None
+        self._endpoint_selector: Optional[EndpointSelector] = None
         self.default_rpc_endpoint = self.storage_nodes[0].get_rpc_endpoint()
         self.default_s3_gate_endpoint = self.s3gates[0].get_endpoint()
         self.default_http_gate_endpoint = self.http_gates[0].get_endpoint()
@@ -238,6 +273,36 @@ class Cluster:
     def hosting(self) -> Hosting:
         return self._hosting
 
+    @property
+    def topology(self) -> "ClusterTopology":
+        """
+        Returns snapshot of cluster services; it is built on first access and then reused
+        until invalidate_topology is called
+        """
+        if self._topology is None:
+            self._topology = ClusterTopology(self._hosting)
+        return self._topology
+
+    def invalidate_topology(self) -> None:
+        """
+        Drops cached topology snapshot and health stats of endpoints; should be called only
+        when services are added to or removed from the hosting config. Stopping or starting
+        services does not change topology, so it does not require invalidation
+        """
+        self._topology = None
+        self._endpoint_selector = None
+
+    @property
+    def endpoint_selector(self) -> EndpointSelector:
+        """
+        Returns selector of storage node RPC endpoints that tracks health of the endpoints
+        """
+        if self._endpoint_selector is None:
+            self._endpoint_selector = EndpointSelector(
+                self.get_storage_rpc_endpoints(), policy=STORAGE_ENDPOINT_SELECTION_POLICY
+            )
+        return self._endpoint_selector
+
     def _create_wallet_config(self, service: ServiceConfig) -> None:
         wallet_path = service.attributes[_ConfigAttributes.LOCAL_WALLET_CONFIG]
         wallet_password = service.attributes[_ConfigAttributes.WALLET_PASSWORD]
@@ -300,36 +365,23 @@ class Cluster:
         return self._get_nodes(_ServicesNames.INNER_RING)
 
     def _get_nodes(self, service_name) -> list[StorageNode]:
-        configs = self.hosting.find_service_configs(f"{service_name}\d*$")
-
-        class_mapping: dict[str, Any] = {
-            _ServicesNames.STORAGE: StorageNode,
-            _ServicesNames.INNER_RING: InnerRingNode,
-            _ServicesNames.MORPH_CHAIN: MorphChain,
-            _ServicesNames.S3_GATE: S3Gate,
-            _ServicesNames.HTTP_GATE: HTTPGate,
-            _ServicesNames.MAIN_CHAIN: MainChain,
-        }
+        return self.topology.get_nodes(service_name)
 
-        cls = class_mapping.get(service_name)
-        return [
-            cls(
-                self._get_id(config.name),
-                config.name,
-                self.hosting.get_host_by_service(config.name),
-            )
-            for config in configs
-        ]
+    def get_node_by_name(self, name: str) -> NodeBase:
+        return self.topology.get_node_by_name(name)
 
-    def _get_id(self, node_name) -> str:
-        pattern = "\d*$"
+    def get_node_by_endpoint(self, endpoint: str) -> NodeBase:
+        return self.topology.get_node_by_endpoint(endpoint)
 
-        matches = re.search(pattern, node_name)
-        if matches:
-            return int(matches.group())
+    def get_nodes_by_host(self, host_address: str) -> list[NodeBase]:
+        return self.topology.get_nodes_by_host(host_address)
 
     def get_random_storage_rpc_endpoint(self) -> str:
-        return random.choice(self.get_storage_rpc_endpoints())
+        """
+        Returns storage node RPC endpoint picked by endpoint selector; endpoints that keep
+        failing are skipped until their quarantine is over
+        """
+        return self.endpoint_selector.select()
 
     def get_random_storage_rpc_endpoint_mgmt(self) -> str:
         return random.choice(self.get_storage_rpc_endpoints_mgmt())
@@ -347,6 +399,96 @@ class Cluster:
         return [node.get_endpoint() for node in nodes]
 
 
+class ClusterTopology:
+    """
+    Immutable snapshot of services described in hosting configuration
+
+    Node objects are created once with all their attributes resolved and are indexed by role,
+    name, id, host address and endpoint. The snapshot does not track changes of the hosting,
+    so it should be rebuilt when services are added or removed
+    """
+
+    def __init__(self, hosting: Hosting) -> None:
+        class_mapping: dict[str, Any] = {
+            _ServicesNames.STORAGE: StorageNode,
+            _ServicesNames.INNER_RING: InnerRingNode,
+            _ServicesNames.MORPH_CHAIN: MorphChain,
+            _ServicesNames.S3_GATE: S3Gate,
+            _ServicesNames.HTTP_GATE: HTTPGate,
+            _ServicesNames.MAIN_CHAIN: MainChain,
+        }
+
+        nodes_by_role: dict[str, tuple[NodeBase, ...]] = {}
+        nodes_by_name: dict[str, NodeBase] = {}
+        nodes_by_id: dict[tuple[str, int], NodeBase] = {}
+        nodes_by_host: dict[str, list[NodeBase]] = {}
+        nodes_by_endpoint: dict[str, NodeBase] = {}
+
+        for service_name, cls in class_mapping.items():
+            configs = hosting.find_service_configs(f"{service_name}\\d*$")
+            nodes = tuple(
+                cls(
+                    self._get_id(config.name),
+                    config.name,
+                    hosting.get_host_by_service(config.name),
+                )
+                for config in configs
+            )
+            nodes_by_role[service_name] = nodes
+
+            for node in nodes:
+                nodes_by_name[node.name] = node
+                nodes_by_id[(service_name, node.id)] = node
+                nodes_by_host.setdefault(node.host.config.address, []).append(node)
+                for attribute_name in _ConfigAttributes.ENDPOINTS:
+                    endpoint = node.attributes.get(attribute_name)
+                    if endpoint:
+                        nodes_by_endpoint[endpoint] = node
+
+        self._nodes_by_role = MappingProxyType(nodes_by_role)
+        self._nodes_by_name = MappingProxyType(nodes_by_name)
+        self._nodes_by_id = MappingProxyType(nodes_by_id)
+        self._nodes_by_host = MappingProxyType(
+            {address: tuple(nodes) for address, nodes in nodes_by_host.items()}
+        )
+        self._nodes_by_endpoint = MappingProxyType(nodes_by_endpoint)
+
+    def get_nodes(self, service_name: str) -> list[NodeBase]:
+        """
+        Returns nodes of the given role; the list is a copy and can be modified by caller
+        """
+        return list(self._nodes_by_role.get(service_name, ()))
+
+    def get_node_by_name(self, name: str) -> NodeBase:
+        node = self._nodes_by_name.get(name)
+        if node is None:
+            raise ValueError(f"Unknown service name: '{name}'")
+        return node
+
+    def get_node_by_id(self, service_name: str, id: int) -> NodeBase:
+        node = self._nodes_by_id.get((service_name, id))
+        if node is None:
+            raise ValueError(f"Unknown service id: '{service_name}{id}'")
+        return node
+
+    def get_node_by_endpoint(self, endpoint: str) -> NodeBase:
+        node = self._nodes_by_endpoint.get(endpoint)
+        if node is None:
+            raise ValueError(f"Unknown service endpoint: '{endpoint}'")
+        return node
+
+    def get_nodes_by_host(self, host_address: str) -> list[NodeBase]:
+        return list(self._nodes_by_host.get(host_address, ()))
+
+    @staticmethod
+    def _get_id(node_name) -> int:
+        pattern = "\\d*$"
+
+        matches = re.search(pattern, node_name)
+        if matches:
+            return int(matches.group())
+
+
 class _ServicesNames:
     STORAGE = "s"
     S3_GATE = "s3-gate"
@@ -367,3 +509,5 @@ class _ConfigAttributes:
     ENDPOINT_INTERNAL = "endpoint_internal0"
     CONTROL_ENDPOINT = "control_endpoint"
     UN_LOCODE = "un_locode"
+
+    ENDPOINTS = (ENDPOINT_DATA, ENDPOINT_INTERNAL, CONTROL_ENDPOINT)
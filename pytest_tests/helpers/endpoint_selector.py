@@ -0,0 +1,271 @@
+import logging
+import random
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from time import monotonic
+from typing import Iterator, Optional
+
+from grpc_responses import ENDPOINT_UNAVAILABLE, error_matches_status
+
+logger = logging.getLogger("NeoLogger")
+
+
+@dataclass
+class EndpointStats:
+    """
+    Statistics collected by selector for a single endpoint
+
+    Attributes:
+        selections: how many times endpoint has been selected
+        successes: number of requests that completed successfully
+        failures: number of requests that failed because endpoint was not available
+        consecutive_failures: number of failures since the last success
+        outstanding: number of requests that are currently in progress
+        ewma_latency: exponentially weighted moving average of request latency in seconds
+        quarantined_until: monotonic time until which endpoint is excluded from selection
+    """
+
+    selections: int = 0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    outstanding: int = 0
+    ewma_latency: Optional[float] = None
+    quarantined_until: float = 0.0
+
+    def is_quarantined(self, now: float) -> bool:
+        return self.quarantined_until > now
+
+
+class SelectionPolicy(ABC):
+    """
+    Interface of a policy that picks one endpoint among healthy candidates
+    """
+
+    @abstractmethod
+    def choose(self, candidates: list[str], stats: dict[str, EndpointStats]) -> str:
+        """
+        Chooses endpoint from the list of candidates
+
+        Args:
+            candidates: non-empty list of endpoints that are not quarantined
+            stats: statistics of all endpoints known to selector
+
+        Returns:
+            chosen endpoint
+        """
+
+
+class RandomPolicy(SelectionPolicy):
+    def choose(self, candidates: list[str], stats: dict[str, EndpointStats]) -> str:
+        return random.choice(candidates)
+
+
+class RoundRobinPolicy(SelectionPolicy):
+    def __init__(self) -> None:
+        self._counter = 0
+
+    def choose(self, candidates: list[str], stats: dict[str, EndpointStats]) -> str:
+        endpoint = candidates[self._counter % len(candidates)]
+        self._counter += 1
+        return endpoint
+
+
+class LeastOutstandingPolicy(SelectionPolicy):
+    def choose(self, candidates: list[str], stats: dict[str, EndpointStats]) -> str:
+        least_outstanding = min(stats[endpoint].outstanding for endpoint in candidates)
+        return random.choice(
+            [
+                endpoint
+                for endpoint in candidates
+                if stats[endpoint].outstanding == least_outstanding
+            ]
+        )
+
+
+class EwmaLatencyPolicy(SelectionPolicy):
+    """
+    Picks endpoint with the lowest expected latency
+
+    Endpoints without latency measurements are preferred, so that every endpoint gets measured.
+    Expected latency is scaled by number of outstanding requests to spread concurrent load.
+    """
+
+    def choose(self, candidates: list[str], stats: dict[str, EndpointStats]) -> str:
+        not_measured = [endpoint for endpoint in candidates if stats[endpoint].ewma_latency is None]
+        if not_measured:
+            return random.choice(not_measured)
+        return min(
+            candidates,
+            key=lambda endpoint: stats[endpoint].ewma_latency * (stats[endpoint].outstanding + 1),
+        )
+
+
+SELECTION_POLICIES: dict[str, type[SelectionPolicy]] = {
+    "random": RandomPolicy,
+    "round-robin": RoundRobinPolicy,
+    "least-outstanding": LeastOutstandingPolicy,
+    "ewma": EwmaLatencyPolicy,
+}
+
+
+class EndpointSelector:
+    """
+    Selects endpoints according to the policy and excludes endpoints that keep failing
+
+    Each endpoint has a circuit breaker: after `failure_threshold` consecutive failures endpoint
+    is put into quarantine for `quarantine_time` seconds. When quarantine is over, endpoint is
+    given one more chance; if it fails again, quarantine time is doubled (up to
+    `max_quarantine_time`). Successful request resets the breaker.
+
+    Only failures that indicate unavailable endpoint (see `is_endpoint_failure`) are counted,
+    errors like "access denied" are expected by tests and do not affect endpoint health.
+
+    Example:
+        selector = EndpointSelector(cluster.get_storage_rpc_endpoints(), policy="ewma")
+        endpoint = selector.select()
+        with selector.track(endpoint):
+            head_object(wallet, cid, oid, shell, endpoint)
+    """
+
+    def __init__(
+        self,
+        endpoints: list[str],
+        policy: str = "random",
+        failure_threshold: int = 3,
+        quarantine_time: float = 30,
+        max_quarantine_time: float = 300,
+        ewma_alpha: float = 0.3,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("Endpoint selector requires at least one endpoint")
+        if policy not in SELECTION_POLICIES:
+            raise ValueError(
+                f"Unknown selection policy '{policy}', "
+                f"expected one of: {', '.join(SELECTION_POLICIES)}"
+            )
+        self.policy_name = policy
+        self.failure_threshold = failure_threshold
+        self.quarantine_time = quarantine_time
+        self.max_quarantine_time = max_quarantine_time
+        self.ewma_alpha = ewma_alpha
+
+        self._policy = SELECTION_POLICIES[policy]()
+        self._endpoints = list(endpoints)
+        self._stats = {endpoint: EndpointStats() for endpoint in self._endpoints}
+        self._quarantine_time = {endpoint: quarantine_time for endpoint in self._endpoints}
+        self._lock = threading.Lock()
+
+    @property
+    def endpoints(self) -> list[str]:
+        return list(self._endpoints)
+
+    def select(self, exclude: Optional[list[str]] = None) -> str:
+        """
+        Selects endpoint among endpoints that are not quarantined
+
+        If all endpoints are quarantined, endpoint with the earliest end of quarantine is
+        returned, so that caller always gets an endpoint to try.
+
+        Args:
+            exclude: endpoints that should not be selected (if there are other options)
+
+        Returns:
+            selected endpoint
+        """
+        with self._lock:
+            now = monotonic()
+            endpoints = [
+                endpoint for endpoint in self._endpoints if endpoint not in (exclude or [])
+            ] or self._endpoints
+            candidates = [
+                endpoint for endpoint in endpoints if not self._stats[endpoint].is_quarantined(now)
+            ]
+            if candidates:
+                endpoint = self._policy.choose(candidates, self._stats)
+            else:
+                endpoint = min(endpoints, key=lambda e: self._stats[e].quarantined_until)
+                logger.warning(f"All endpoints are quarantined, falling back to {endpoint}")
+            self._stats[endpoint].selections += 1
+            return endpoint
+
+    @contextmanager
+    def track(self, endpoint: str) -> Iterator[None]:
+        """
+        Context manager that measures request to the endpoint and reports its outcome
+        """
+        with self._lock:
+            self._stats[endpoint].outstanding += 1
+        start_time = monotonic()
+        try:
+            yield
+        except Exception as err:
+            if is_endpoint_failure(err):
+                self.report_failure(endpoint)
+            else:
+                self.report_success(endpoint, monotonic() - start_time)
+            raise
+        else:
+            self.report_success(endpoint, monotonic() - start_time)
+        finally:
+            with self._lock:
+                self._stats[endpoint].outstanding -= 1
+
+    def report_success(self, endpoint: str, latency: Optional[float] = None) -> None:
+        with self._lock:
+            stats = self._stats[endpoint]
+            stats.successes += 1
+            stats.consecutive_failures = 0
+            stats.quarantined_until = 0.0
+            self._quarantine_time[endpoint] = self.quarantine_time
+            if latency is not None:
+                if stats.ewma_latency is None:
+                    stats.ewma_latency = latency
+                else:
+                    stats.ewma_latency = (
+                        self.ewma_alpha * latency + (1 - self.ewma_alpha) * stats.ewma_latency
+                    )
+
+    def report_failure(self, endpoint: str) -> None:
+        with self._lock:
+            stats = self._stats[endpoint]
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            if stats.consecutive_failures < self.failure_threshold:
+                return
+
+            quarantine_time = self._quarantine_time[endpoint]
+            stats.quarantined_until = monotonic() + quarantine_time
+            # Next failure after quarantine (half-open state) extends quarantine
+            stats.consecutive_failures = self.failure_threshold - 1
+            self._quarantine_time[endpoint] = min(quarantine_time * 2, self.max_quarantine_time)
+            logger.warning(f"Endpoint {endpoint} is quarantined for {quarantine_time}s")
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """
+        Resets collected statistics for the given endpoint or for all endpoints
+        """
+        with self._lock:
+            for reset_endpoint in [endpoint] if endpoint else self._endpoints:
+                self._stats[reset_endpoint] = EndpointStats()
+                self._quarantine_time[reset_endpoint] = self.quarantine_time
+
+    def get_stats(self) -> dict[str, dict]:
+        """
+        Returns copy of collected statistics per endpoint as plain dicts
+        """
+        with self._lock:
+            now = monotonic()
+            return {
+                endpoint: {**asdict(stats), "quarantined": stats.is_quarantined(now)}
+                for endpoint, stats in self._stats.items()
+            }
+
+
+def is_endpoint_failure(error: Exception) -> bool:
+    """
+    Determines whether error means that endpoint is not available
+    """
+    return error_matches_status(error, ENDPOINT_UNAVAILABLE)
@@ -0,0 +1,221 @@
+import json
+import logging
+from time import monotonic, sleep
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+import websocket
+from chain_rpc import ChainRPCClient, build_request
+
+logger = logging.getLogger("NeoLogger")
+
+# Name of notification that is emitted by netmap contract when epoch is changed
+NEW_EPOCH_EVENT = "NewEpoch"
+
+
+class ChainWatcher:
+    """
+    Waits for new blocks of neo-go chain
+
+    Watcher subscribes to `block_added` notifications (and to notifications of contracts with
+    `notification_name`, if set) over WebSocket RPC of the chain, so waits end as soon as the
+    expected block is persisted. If WebSocket is disabled or subscription fails, watcher polls
+    block count over JSON-RPC instead (after a failure only for the current wait, the next wait
+    tries to subscribe again); state of the chain is checked only when a new block appears, as
+    it cannot change otherwise.
+    """
+
+    notification_name: Optional[str] = None
+
+    def __init__(
+        self,
+        rpc_endpoint: str,
+        ws_endpoint: Optional[str] = None,
+        use_websocket: bool = True,
+        poll_interval: float = 0.5,
+        timeout: float = 10,
+        rpc_client: Optional[ChainRPCClient] = None,
+    ) -> None:
+        self.rpc_endpoint = rpc_endpoint
+        self.ws_endpoint = ws_endpoint or _get_ws_endpoint(rpc_endpoint)
+        self.use_websocket = use_websocket
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        # Client keeps connection alive between polls, it may be shared with other users
+        self.rpc_client = rpc_client or ChainRPCClient(rpc_endpoint, timeout)
+
+    def get_block_count(self) -> int:
+        return int(self._call("getblockcount"))
+
+    def wait_for_blocks(self, count: int, timeout: float) -> int:
+        """
+        Waits until the specified number of new blocks is added to the chain
+
+        Returns:
+            block count of the chain after wait
+        """
+        target_height = self.get_block_count() + count
+        return self._wait(
+            lambda height, _: height >= target_height, timeout, f"block {target_height}"
+        )
+
+    def _wait(
+        self,
+        is_reached: Callable[[int, Optional[dict]], bool],
+        timeout: float,
+        description: str,
+    ) -> int:
+        """
+        Calls `is_reached` with block count on every new block (and with notification named
+        `notification_name`, if any) until it returns True
+
+        Returns:
+            block count of the chain when condition was reached
+        """
+        deadline = monotonic() + timeout
+        if self.use_websocket:
+            try:
+                return self._wait_with_subscription(is_reached, deadline, description)
+            except TimeoutError:
+                raise
+            except (websocket.WebSocketException, OSError) as exc:
+                logger.warning(
+                    f"Failed to subscribe to events of {self.ws_endpoint}, "
+                    f"falling back to polling: {exc}"
+                )
+        return self._wait_with_polling(is_reached, deadline, description)
+
+    def _wait_with_subscription(
+        self,
+        is_reached: Callable[[int, Optional[dict]], bool],
+        deadline: float,
+        description: str,
+    ) -> int:
+        connection = websocket.create_connection(
+            self.ws_endpoint, timeout=max(min(self.timeout, deadline - monotonic()), 0.1)
+        )
+        try:
+            subscriptions = [["block_added"]]
+            if self.notification_name:
+                subscriptions.append(
+                    ["notification_from_execution", {"name": self.notification_name}]
+                )
+            for request_id, params in enumerate(subscriptions, start=1):
+                connection.send(build_request("subscribe", params, request_id=request_id))
+            self._wait_for_subscriptions(connection, len(subscriptions))
+            # State is checked after subscription, so that no block is missed in between
+            height = self.get_block_count()
+            if is_reached(height, None):
+                return height
+
+            while True:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Timed out waiting for {description} on {self.rpc_endpoint}"
+                    )
+                connection.settimeout(remaining)
+                try:
+                    message = json.loads(connection.recv())
+                except websocket.WebSocketTimeoutException:
+                    continue
+
+                event = message.get("method")
+                params = message.get("params") or [{}]
+                if event == "block_added":
+                    height = int(params[0]["index"]) + 1
+                    if is_reached(height, None):
+                        return height
+                elif event == "notification_from_execution":
+                    if params[0].get("eventname") != self.notification_name:
+                        continue
+                    if is_reached(height, params[0]):
+                        return height
+        finally:
+            connection.close()
+
+    def _wait_for_subscriptions(self, connection: websocket.WebSocket, count: int) -> None:
+        """
+        Waits for responses to subscription requests with IDs from 1 to `count`, notifications
+        received before are skipped as state of the chain is checked after subscription
+        """
+        pending = set(range(1, count + 1))
+        while pending:
+            message = json.loads(connection.recv())
+            if message.get("id") not in pending:
+                continue
+            if "error" in message:
+                raise websocket.WebSocketException(f"Subscription failed: {message['error']}")
+            pending.discard(message["id"])
+
+    def _wait_with_polling(
+        self,
+        is_reached: Callable[[int, Optional[dict]], bool],
+        deadline: float,
+        description: str,
+    ) -> int:
+        checked_height = None
+        while True:
+            height = self.get_block_count()
+            if height != checked_height:
+                if is_reached(height, None):
+                    return height
+                checked_height = height
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timed out waiting for {description} on {self.rpc_endpoint}")
+            sleep(min(self.poll_interval, remaining))
+
+    def _call(self, method: str, params: Optional[list] = None):
+        return self.rpc_client.call(method, params)
+
+
+class EpochWatcher(ChainWatcher):
+    """
+    Waits for new blocks and epochs of morph chain
+
+    Epoch is taken from `NewEpoch` notification of netmap contract when watcher is subscribed to
+    events, otherwise it is requested from the contract on every new block.
+
+    Example:
+        watcher = EpochWatcher("http://morph-chain.neofs.devenv:30333")
+        watcher.wait_for_epoch(netmap_contract_hash, epoch=10, timeout=30)
+    """
+
+    notification_name = NEW_EPOCH_EVENT
+
+    def get_epoch(self, netmap_contract_hash: str) -> int:
+        result = self._call("invokefunction", [netmap_contract_hash, "epoch", []])
+        assert result.get("state") == "HALT", f"Failed to get epoch from netmap contract: {result}"
+        return int(result["stack"][0]["value"])
+
+    def wait_for_epoch(self, netmap_contract_hash: str, epoch: int, timeout: float) -> int:
+        """
+        Waits until epoch of the chain reaches the specified one
+
+        Returns:
+            current epoch of the chain
+        """
+        current_epoch = None
+
+        def is_reached(_: int, notification: Optional[dict]) -> bool:
+            nonlocal current_epoch
+            current_epoch = (
+                int(notification["state"]["value"][0]["value"])
+                if notification is not None
+                else self.get_epoch(netmap_contract_hash)
+            )
+            return current_epoch >= epoch
+
+        self._wait(is_reached, timeout, f"epoch {epoch}")
+        return current_epoch
+
+
+def _get_ws_endpoint(rpc_endpoint: str) -> str:
+    """
+    Returns WebSocket endpoint of neo-go node by its RPC endpoint, e.g.:
+    http://morph-chain.neofs.devenv:30333 -> ws://morph-chain.neofs.devenv:30333/ws
+    """
+    url = urlparse(rpc_endpoint if "://" in rpc_endpoint else f"http://{rpc_endpoint}")
+    scheme = "wss" if url.scheme == "https" else "ws"
+    return f"{scheme}://{url.netloc}/ws"
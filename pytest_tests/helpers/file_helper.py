@@ -6,9 +6,17 @@ from typing import Any, Optional
 
 import allure
 from common import ASSETS_DIR
+from response_cache import get_cache
 
 logger = logging.getLogger("NeoLogger")
 
+# Size of buffer that files are read with when hashing (or copying, if kernel can't copy them),
+# so that memory usage is constant
+HASH_BUFFER_SIZE = 1024 * 1024
+# Hashes that are calculated by default: sha256 is used to compare objects; other algorithms
+# (e.g. md5 that matches ETag of objects uploaded to S3 gate) are calculated only if requested
+HASH_ALGORITHMS = ("sha256",)
+
 
 def generate_file(size: int) -> str:
     """Generates a binary file with the specified size in bytes.
@@ -72,25 +80,73 @@ def get_file_hash(file_path: str, len: Optional[int] = None, offset: Optional[in
     Returns:
         Hash of the file as hex-encoded string.
     """
-    file_hash = hashlib.sha256()
-    with open(file_path, "rb") as out:
-        if len and not offset:
-            file_hash.update(out.read(len))
-        elif len and offset:
-            out.seek(offset, 0)
-            file_hash.update(out.read(len))
-        elif offset and not len:
-            out.seek(offset, 0)
-            file_hash.update(out.read())
-        else:
-            file_hash.update(out.read())
-    return file_hash.hexdigest()
+    return get_file_hashes(file_path, len, offset, ("sha256",))["sha256"]
+
+
+def get_file_hashes(
+    file_path: str,
+    len: Optional[int] = None,
+    offset: Optional[int] = None,
+    algorithms: tuple[str, ...] = HASH_ALGORITHMS,
+) -> dict[str, str]:
+    """Generates several hashes for the specified file in a single pass.
+
+    File is read with a fixed-size buffer, so memory usage does not depend on file size. Hashes
+    are cached by path, size and modification time of the file, so hashing the same file (or
+    range) again is free until the file is modified.
+
+    Args:
+        file_path: Path to the file to generate hashes for.
+        len: How many bytes to read.
+        offset: Position to start reading from.
+        algorithms: Names of hashlib algorithms, e.g. ("sha256", "md5") to compare with S3 ETag
+            as well.
+
+    Returns:
+        Hashes of the file as hex-encoded strings by algorithm name.
+    """
+    stat = os.stat(file_path)
+    cache_key = (
+        os.path.abspath(file_path),
+        stat.st_size,
+        stat.st_mtime_ns,
+        offset or 0,
+        len or None,
+        algorithms,
+    )
+    return get_cache("file_hashes", epoch_scoped=False).get_or_call(
+        cache_key, lambda: _calculate_file_hashes(file_path, len, offset, algorithms)
+    )
+
+
+def _calculate_file_hashes(
+    file_path: str, length: Optional[int], offset: Optional[int], algorithms: tuple[str, ...]
+) -> dict[str, str]:
+    hashes = [hashlib.new(algorithm) for algorithm in algorithms]
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    remaining = length or None
+    with open(file_path, "rb", buffering=0) as file:
+        if offset:
+            file.seek(offset, 0)
+        while remaining is None or remaining > 0:
+            to_read = HASH_BUFFER_SIZE if remaining is None else min(HASH_BUFFER_SIZE, remaining)
+            read_size = file.readinto(view[:to_read])
+            if not read_size:
+                break
+            for file_hash in hashes:
+                file_hash.update(view[:read_size])
+            if remaining is not None:
+                remaining -= read_size
+    return {algorithm: file_hash.hexdigest() for algorithm, file_hash in zip(algorithms, hashes)}
 
 
 @allure.step("Concatenation set of files to one file")
 def concat_files(file_paths: list, resulting_file_path: Optional[str] = None) -> str:
     """Concatenates several files into a single file.
 
+    Content is copied by the kernel (see `_copy_range`), so files are not loaded into memory.
+
     Args:
         file_paths: Paths to the files to concatenate.
         resulting_file_name: Path to the file where concatenated content should be stored.
@@ -103,40 +159,82 @@ def concat_files(file_paths: list, resulting_file_path: Optional[str] = None) ->
     with open(resulting_file_path, "wb") as f:
         for file in file_paths:
             with open(file, "rb") as part_file:
-                f.write(part_file.read())
+                _copy_range(part_file.fileno(), f.fileno(), 0, os.fstat(part_file.fileno()).st_size)
     return resulting_file_path
 
 
-def split_file(file_path: str, parts: int) -> list[str]:
-    """Splits specified file into several specified number of parts.
+def split_file(
+    file_path: str, parts: Optional[int] = None, part_size: Optional[int] = None
+) -> list[str]:
+    """Splits specified file into several specified number of parts or into parts of specified size.
 
-    Each part is saved under name `{original_file}_part_{i}`.
+    Each part is saved under name `{original_file}_part_{i}`. Content is copied by the kernel
+    (see `_copy_range`), so the file is not loaded into memory.
 
     Args:
         file_path: Path to the file that should be split.
         parts: Number of parts the file should be split into.
+        part_size: Size of each part in bytes (the last part may be smaller), e.g. to get
+            parts of S3 multipart upload.
 
     Returns:
         Paths to the part files.
     """
-    with open(file_path, "rb") as file:
-        content = file.read()
+    assert (parts is None) != (part_size is None), "Either parts or part_size should be specified"
 
-    content_size = len(content)
-    chunk_size = int((content_size + parts) / parts)
+    content_size = os.path.getsize(file_path)
+    if part_size is None:
+        chunk_size = int((content_size + parts) / parts)
+        offsets = range(0, content_size + 1, chunk_size)
+    else:
+        chunk_size = part_size
+        offsets = range(0, max(content_size, 1), chunk_size)
 
-    part_id = 1
     part_file_paths = []
-    for content_offset in range(0, content_size + 1, chunk_size):
-        part_file_name = f"{file_path}_part_{part_id}"
-        part_file_paths.append(part_file_name)
-        with open(part_file_name, "wb") as out_file:
-            out_file.write(content[content_offset : content_offset + chunk_size])
-        part_id += 1
+    with open(file_path, "rb") as file:
+        for part_id, content_offset in enumerate(offsets, start=1):
+            part_file_name = f"{file_path}_part_{part_id}"
+            part_file_paths.append(part_file_name)
+            with open(part_file_name, "wb") as out_file:
+                _copy_range(
+                    file.fileno(),
+                    out_file.fileno(),
+                    content_offset,
+                    min(chunk_size, content_size - content_offset),
+                )
 
     return part_file_paths
 
 
+def _copy_range(source_fd: int, destination_fd: int, offset: int, count: int) -> None:
+    """Copies range of source file to the current position of destination file.
+
+    Data is copied with copy_file_range (that may share blocks on filesystems with reflinks)
+    or sendfile, so it is not passed through Python buffers; if neither is supported for the
+    files, data is copied with a fixed-size buffer.
+    """
+    while count > 0:
+        copied = _copy_chunk(source_fd, destination_fd, offset, count)
+        if not copied:
+            raise EOFError(f"Unexpected end of file at offset {offset}")
+        offset += copied
+        count -= copied
+
+
+def _copy_chunk(source_fd: int, destination_fd: int, offset: int, count: int) -> int:
+    if hasattr(os, "copy_file_range"):
+        try:
+            return os.copy_file_range(source_fd, destination_fd, count, offset)
+        except OSError as err:
+            # E.g. files are on different filesystems and kernel can't copy between them
+            logger.debug(f"copy_file_range is not supported, falling back: {err}")
+    try:
+        return os.sendfile(destination_fd, source_fd, offset, count)
+    except OSError as err:
+        logger.debug(f"sendfile is not supported, falling back: {err}")
+    return os.write(destination_fd, os.pread(source_fd, min(count, HASH_BUFFER_SIZE), offset))
+
+
 def get_file_content(
     file_path: str, content_len: Optional[int] = None, mode: str = "r", offset: Optional[int] = None
 ) -> Any:
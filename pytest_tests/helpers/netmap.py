@@ -0,0 +1,175 @@
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Union
+
+NODE_STATES = ("ONLINE", "OFFLINE", "MAINTENANCE")
+
+_EPOCH_REGEX = re.compile(r"^Epoch:\s*(\d+)", re.MULTILINE)
+_NODE_REGEX = re.compile(r"^Node\s+\d+:\s+(?P<key>[0-9a-fA-F]+)\s+(?P<state>\w+)(?P<addresses>.*)$")
+_ATTRIBUTE_REGEX = re.compile(r"^\s+(?P<name>[^:]+?):\s*(?P<value>.*)$")
+
+
+@dataclass
+class NetmapNode:
+    """
+    Node of network map as printed by `neofs-cli netmap snapshot`
+
+    Attributes:
+        public_key: public key of the node in hex format
+        state: state of the node (ONLINE, OFFLINE, MAINTENANCE)
+        addresses: network addresses of the node in multiaddr format
+        attributes: attributes of the node (UN-LOCODE, Country, Capacity, Price, etc.)
+    """
+
+    public_key: str
+    state: str
+    addresses: list[str] = field(default_factory=list)
+    attributes: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def un_locode(self) -> Optional[str]:
+        return self.attributes.get("UN-LOCODE")
+
+    @property
+    def country(self) -> Optional[str]:
+        return self.attributes.get("Country")
+
+    @property
+    def capacity(self) -> int:
+        return _to_int(self.attributes.get("Capacity"))
+
+    @property
+    def price(self) -> int:
+        return _to_int(self.attributes.get("Price"))
+
+
+@dataclass
+class NetmapDiff:
+    """
+    Difference between two network maps
+
+    Attributes:
+        added: nodes that appeared in the new network map
+        removed: nodes that disappeared from the new network map
+        changed: pairs of old and new state of nodes whose state, addresses or attributes changed
+    """
+
+    added: list[NetmapNode] = field(default_factory=list)
+    removed: list[NetmapNode] = field(default_factory=list)
+    changed: list[tuple[NetmapNode, NetmapNode]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __str__(self) -> str:
+        lines = [f"+ {node.public_key}" for node in self.added]
+        lines += [f"- {node.public_key}" for node in self.removed]
+        lines += [f"~ {new.public_key}" for _, new in self.changed]
+        return "\n".join(lines) or "no changes"
+
+
+class Netmap:
+    """
+    Network map with nodes indexed by public key and by attribute values
+
+    Membership checks and lookups by key are O(1); index of an attribute is built on the
+    first lookup by this attribute. Nodes are compatible with `placement_policy`, so network
+    map can be passed directly to `PlacementEvaluator`.
+
+    Example:
+        netmap = Netmap.from_snapshot(snapshot_stdout)
+        assert node_key in netmap
+        swedish_nodes = netmap.get_nodes_by_attribute("Country", "Sweden")
+    """
+
+    def __init__(self, epoch: Optional[int], nodes: list[NetmapNode]) -> None:
+        self.epoch = epoch
+        self.nodes = nodes
+        self._nodes_by_key = {node.public_key.lower(): node for node in nodes}
+        self._attribute_indexes: dict[str, dict[str, list[NetmapNode]]] = {}
+
+    @staticmethod
+    def from_snapshot(output: str) -> "Netmap":
+        """
+        Parses output of `neofs-cli netmap snapshot` command, e.g.:
+
+            Epoch: 26
+            Node 1: 022bb4041c50...f5c9a3050 ONLINE /dns4/s01.neofs.devenv/tcp/8080
+                    Continent: Europe
+                    Country: Russia
+
+        Raises ValueError if a node line has unexpected format, so that node is not silently
+        missing from the map.
+        """
+        epoch_match = _EPOCH_REGEX.search(output)
+        epoch = int(epoch_match.group(1)) if epoch_match else None
+
+        nodes = []
+        for line in output.splitlines():
+            if line.startswith("Node "):
+                node_match = _NODE_REGEX.match(line)
+                if not node_match:
+                    raise ValueError(f"Invalid node line in netmap snapshot: {line!r}")
+                nodes.append(
+                    NetmapNode(
+                        public_key=node_match.group("key"),
+                        state=node_match.group("state").upper(),
+                        addresses=node_match.group("addresses").split(),
+                    )
+                )
+                continue
+            attribute_match = _ATTRIBUTE_REGEX.match(line)
+            if attribute_match and nodes:
+                nodes[-1].attributes[attribute_match.group("name")] = attribute_match.group(
+                    "value"
+                ).strip()
+        return Netmap(epoch, nodes)
+
+    def __contains__(self, node: Union[str, NetmapNode]) -> bool:
+        return self.get_node(node) is not None
+
+    def __iter__(self) -> Iterator[NetmapNode]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get_node(self, node: Union[str, NetmapNode]) -> Optional[NetmapNode]:
+        """
+        Returns node with the given public key (or key of the given node) if it is in the map
+        """
+        public_key = node.public_key if isinstance(node, NetmapNode) else node
+        return self._nodes_by_key.get(public_key.lower())
+
+    def get_nodes_by_attribute(self, name: str, value: str) -> list[NetmapNode]:
+        if name not in self._attribute_indexes:
+            index = defaultdict(list)
+            for node in self.nodes:
+                if name in node.attributes:
+                    index[node.attributes[name]].append(node)
+            self._attribute_indexes[name] = dict(index)
+        return list(self._attribute_indexes[name].get(value, []))
+
+    def get_nodes_by_state(self, state: str) -> list[NetmapNode]:
+        return [node for node in self.nodes if node.state == state.upper()]
+
+    def diff(self, other: "Netmap") -> NetmapDiff:
+        """
+        Returns changes that turn this network map into the other one (e.g. of the next epoch)
+        """
+        result = NetmapDiff()
+        for key, node in self._nodes_by_key.items():
+            other_node = other._nodes_by_key.get(key)
+            if other_node is None:
+                result.removed.append(node)
+            elif other_node != node:
+                result.changed.append((node, other_node))
+        result.added = [
+            node for key, node in other._nodes_by_key.items() if key not in self._nodes_by_key
+        ]
+        return result
+
+
+def _to_int(value: Optional[str]) -> int:
+    return int(value) if value and value.isdigit() else 0
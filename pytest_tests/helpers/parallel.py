@@ -0,0 +1,162 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+from common import PARALLEL_WORKERS
+from neofs_testlib.shell import CommandResult, LocalShell
+
+logger = logging.getLogger("NeoLogger")
+
+T = TypeVar("T")
+
+
+@dataclass
+class ParallelResult(Generic[T]):
+    """
+    Result of a function call for a single item processed in parallel
+
+    Attributes:
+        item: item that was passed to the function
+        index: position of the item in the input sequence
+        result: value returned by the function
+        error: exception raised by the function (or TimeoutError if deadline was exceeded)
+        elapsed: time of the function call in seconds
+    """
+
+    item: T
+    index: int
+    result: Any = None
+    error: Optional[Exception] = None
+    elapsed: Optional[float] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def iterate_parallel(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int = PARALLEL_WORKERS,
+    deadline: Optional[float] = None,
+) -> Iterator[ParallelResult[T]]:
+    """
+    Calls function for every item in a bounded thread pool and yields results as they complete
+
+    Caller may stop iteration at any moment (for example when enough results are collected),
+    calls that have not been started yet are cancelled then.
+
+    Note: allure steps are not thread-safe, so function should avoid reporting steps on its own;
+    results should be reported by the caller.
+
+    Args:
+        func: function to call with every item
+        items: items to process
+        max_workers: max number of concurrent calls
+        deadline: overall time limit in seconds; results of calls that have not completed
+            by the deadline are yielded with TimeoutError
+
+    Returns:
+        iterator over results in the order of completion
+    """
+    items = list(items)
+    if not items:
+        return
+
+    def timed_call(item: T) -> tuple[Any, float]:
+        start_time = monotonic()
+        try:
+            return func(item), monotonic() - start_time
+        except Exception as exc:
+            exc.elapsed = monotonic() - start_time
+            raise
+
+    end_time = monotonic() + deadline if deadline is not None else None
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    try:
+        futures: dict[Future, int] = {
+            executor.submit(timed_call, item): index for index, item in enumerate(items)
+        }
+        pending = set(futures)
+        while pending:
+            timeout = max(0, end_time - monotonic()) if end_time is not None else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                index = futures[future]
+                try:
+                    result, elapsed = future.result()
+                    yield ParallelResult(items[index], index, result=result, elapsed=elapsed)
+                except Exception as exc:
+                    elapsed = getattr(exc, "elapsed", None)
+                    yield ParallelResult(items[index], index, error=exc, elapsed=elapsed)
+
+        for future in pending:
+            index = futures[future]
+            logger.warning(f"Processing of {items[index]} exceeded deadline of {deadline}s")
+            yield ParallelResult(
+                items[index],
+                index,
+                error=TimeoutError(f"Deadline of {deadline}s exceeded"),
+                elapsed=deadline,
+            )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_parallel(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int = PARALLEL_WORKERS,
+    deadline: Optional[float] = None,
+) -> list[ParallelResult[T]]:
+    """
+    Calls function for every item in a bounded thread pool
+
+    Args:
+        func: function to call with every item
+        items: items to process
+        max_workers: max number of concurrent calls
+        deadline: overall time limit in seconds
+
+    Returns:
+        results in the order of input items; errors are not raised, but stored in results
+    """
+    results = list(iterate_parallel(func, items, max_workers, deadline))
+    return sorted(results, key=lambda result: result.index)
+
+
+def without_step(func: Callable) -> Callable:
+    """
+    Returns function without allure step decorator (if it has one)
+
+    Allure steps are not thread-safe, so keywords called in worker threads should be
+    called without their steps.
+    """
+    return getattr(func, "__wrapped__", func)
+
+
+class LocalShellWithoutReport(LocalShell):
+    """
+    Local shell that logs commands, but does not report them as allure steps
+
+    Allure steps are not thread-safe, so commands executed in background threads should be
+    executed by this shell.
+    """
+
+    def _report_command_result(
+        self,
+        command: str,
+        start_time: datetime,
+        end_time: datetime,
+        result: Optional[CommandResult],
+    ) -> None:
+        logger.info(
+            f"Command: {command}\n"
+            f"return code: {result.return_code if result else ''}\n"
+            f"Elapsed: {end_time - start_time}"
+        )
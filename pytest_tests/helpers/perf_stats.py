@@ -0,0 +1,309 @@
+import functools
+import inspect
+import json
+import logging
+import math
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("NeoLogger")
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations with logarithmic buckets (HDR-style)
+
+    Width of each bucket is proportional to its lower bound, so percentiles are calculated with
+    bounded relative error (`precision`) regardless of the range of recorded values, and memory
+    does not grow with number of recorded values.
+    """
+
+    MIN_VALUE = 1e-6
+
+    def __init__(self, precision: float = 0.01) -> None:
+        self.precision = precision
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._log_base = math.log(1 + precision)
+        self._buckets: dict[int, int] = defaultdict(int)
+
+    def record(self, value: float) -> None:
+        value = max(value, self.MIN_VALUE)
+        self._buckets[math.floor(math.log(value) / self._log_base)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        assert self.precision == other.precision, "Histograms should have the same precision"
+        for bucket, count in other._buckets.items():
+            self._buckets[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # Middle of the bucket, clamped to the recorded range
+                value = math.exp((bucket + 0.5) * self._log_base)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+@dataclass
+class CallStats:
+    """
+    Aggregated statistics of keyword calls
+
+    Attributes:
+        count: number of calls
+        errors: number of calls that raised an exception
+        bytes: number of bytes of files uploaded or downloaded by calls
+        durations: histogram of call durations in seconds
+    """
+
+    count: int = 0
+    errors: int = 0
+    bytes: int = 0
+    durations: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: "CallStats") -> None:
+        self.count += other.count
+        self.errors += other.errors
+        self.bytes += other.bytes
+        self.durations.merge(other.durations)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "total": self.durations.total,
+            "min": self.durations.min,
+            "mean": self.durations.mean,
+            **{f"p{percent}": self.durations.percentile(percent) for percent in PERCENTILES},
+            "max": self.durations.max,
+        }
+
+
+class PerfStatsCollector:
+    """
+    Collects durations of keyword calls per keyword, endpoint and test
+
+    Collector is thread-safe; calls made from worker threads are attributed to the test that
+    is currently running.
+    """
+
+    def __init__(self) -> None:
+        self.current_test: Optional[str] = None
+        self._stats: dict[tuple[str, str, str], CallStats] = defaultdict(CallStats)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        keyword: str,
+        duration: float,
+        endpoint: Optional[str] = None,
+        size: Optional[int] = None,
+        error: bool = False,
+        test: Optional[str] = None,
+    ) -> None:
+        key = (keyword, endpoint or "", test or self.current_test or "")
+        with self._lock:
+            stats = self._stats[key]
+            stats.count += 1
+            stats.errors += int(error)
+            stats.bytes += size or 0
+            stats.durations.record(duration)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def get_report(self) -> dict[str, list[dict]]:
+        """
+        Returns statistics aggregated by keyword, by keyword and endpoint and by test
+
+        Rows of each section are sorted by total duration, so the most expensive come first.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        def aggregate(key_names: tuple[str, ...]) -> list[dict]:
+            indexes = [("keyword", "endpoint", "test").index(name) for name in key_names]
+            aggregated: dict[tuple, CallStats] = defaultdict(CallStats)
+            for key, call_stats in stats.items():
+                aggregated[tuple(key[index] for index in indexes)].merge(call_stats)
+            rows = [
+                {**dict(zip(key_names, key)), **call_stats.to_dict()}
+                for key, call_stats in aggregated.items()
+            ]
+            return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+        return {
+            "keywords": aggregate(("keyword",)),
+            "keyword_endpoints": aggregate(("keyword", "endpoint")),
+            "tests": aggregate(("test",)),
+        }
+
+    def format_report(self, report: Optional[dict] = None, top: int = 20) -> str:
+        """
+        Formats report as human-readable tables
+        """
+        report = report or self.get_report()
+
+        def format_duration(value: Optional[float]) -> str:
+            return f"{value:.3f}" if value is not None else "-"
+
+        def format_table(title: str, key_name: str, rows: list[dict]) -> list[str]:
+            lines = [
+                f"{title} (top {min(top, len(rows))} of {len(rows)} by total time, seconds):",
+                f"{'total':>10} {'count':>7} {'errors':>6} {'p50':>8} {'p95':>8} {'p99':>8} "
+                f"{'max':>8} {'MiB':>9}  {key_name}",
+            ]
+            for row in rows[:top]:
+                lines.append(
+                    f"{row['total']:>10.2f} {row['count']:>7} {row['errors']:>6} "
+                    + " ".join(
+                        f"{format_duration(row[name]):>8}" for name in ("p50", "p95", "p99", "max")
+                    )
+                    + f" {row['bytes'] / 2**20:>9.2f}  {row[key_name] or '<none>'}"
+                )
+            return lines
+
+        lines = format_table("Keywords", "keyword", report["keywords"])
+        lines.append("")
+        lines += format_table("Tests", "test", report["tests"])
+        return "\n".join(lines)
+
+    def save_report(self, directory: str) -> tuple[str, str]:
+        """
+        Saves report into JSON file and text file in the specified directory
+
+        Returns:
+            paths to JSON report and to text report
+        """
+        report = self.get_report()
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, "perf_stats.json")
+        text_path = os.path.join(directory, "perf_stats.txt")
+        with open(json_path, "w") as file:
+            json.dump(report, file, indent=4)
+        with open(text_path, "w") as file:
+            file.write(self.format_report(report))
+        return json_path, text_path
+
+
+perf_stats_collector = PerfStatsCollector()
+
+
+def measured(
+    keyword: Optional[str] = None,
+    endpoint_arg: Optional[str] = "endpoint",
+    endpoint_attr: Optional[str] = None,
+    size_arg: Optional[str] = None,
+    size_of_result: bool = False,
+) -> Callable:
+    """
+    Decorator that records duration of every call of the keyword into `perf_stats_collector`
+
+    Args:
+        keyword: name of the keyword in report, qualified name of the function by default
+        endpoint_arg: name of the argument that holds endpoint (or node) the call is made to
+        endpoint_attr: name of the attribute of `self` that holds endpoint (for methods)
+        size_arg: name of the argument that holds path to the uploaded or downloaded file
+        size_of_result: whether the function returns path to the downloaded file
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = keyword or func.__qualname__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = monotonic()
+            result = None
+            error = False
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception:
+                error = True
+                raise
+            finally:
+                duration = monotonic() - start_time
+                try:
+                    arguments = signature.bind_partial(*args, **kwargs).arguments
+                    endpoint = arguments.get(endpoint_arg) if endpoint_arg else None
+                    if endpoint_attr and args:
+                        endpoint = getattr(args[0], endpoint_attr, None)
+                    path = result if size_of_result else arguments.get(size_arg)
+                    perf_stats_collector.record(
+                        name,
+                        duration,
+                        endpoint=str(endpoint) if endpoint is not None else None,
+                        size=_get_file_size(path),
+                        error=error,
+                    )
+                except Exception as exc:
+                    logger.warning(f"Failed to record stats of {name}: {exc}")
+
+        return wrapper
+
+    return decorator
+
+
+def measured_methods(
+    endpoint_attr: Optional[str] = None, size_args: Optional[dict[str, str]] = None
+) -> Callable[[type], type]:
+    """
+    Class decorator that applies `measured` to every public method of the class
+
+    Args:
+        endpoint_attr: name of the attribute that holds endpoint of the client
+        size_args: names of arguments that hold file paths, per method name
+    """
+
+    def decorator(cls: type) -> type:
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+            setattr(
+                cls,
+                name,
+                measured(
+                    endpoint_arg=None,
+                    endpoint_attr=endpoint_attr,
+                    size_arg=(size_args or {}).get(name),
+                )(method),
+            )
+        return cls
+
+    return decorator
+
+
+def _get_file_size(path: Any) -> Optional[int]:
+    if not isinstance(path, str) or not os.path.isfile(path):
+        return None
+    return os.path.getsize(path)
@@ -0,0 +1,514 @@
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, Protocol, Sequence, Union
+
+import base58
+import mmh3
+
+logger = logging.getLogger("NeoLogger")
+
+# Name of the filter that matches all nodes of the network map
+MAIN_FILTER_NAME = "*"
+# Container backup factor that is used if policy does not specify CBF
+DEFAULT_BACKUP_FACTOR = 3
+
+CLAUSE_SAME = "SAME"
+CLAUSE_DISTINCT = "DISTINCT"
+
+CAPACITY_ATTRIBUTE = "Capacity"
+PRICE_ATTRIBUTE = "Price"
+
+SIMPLE_OPERATIONS = ("EQ", "NE", "GT", "GE", "LT", "LE")
+_KEYWORDS = {"REP", "IN", "CBF", "SELECT", "FROM", "AS", "FILTER", "AND", "OR"}
+_TOKEN_REGEX = re.compile(r"\(|\)|@|\"[^\"]*\"|'[^']*'|[^\s()@]+")
+
+_UINT64_MASK = 2**64 - 1
+
+
+class PlacementNode(Protocol):
+    """
+    Node of network map as required by placement policy evaluator
+
+    Attributes:
+        public_key: public key of the node in hex format
+        attributes: attributes of the node from network map
+    """
+
+    public_key: str
+    attributes: dict[str, str]
+
+
+@dataclass
+class Filter:
+    """
+    Filter of placement policy
+
+    Simple filters compare attribute `key` with `value` using `op` (EQ, NE, GT, GE, LT, LE);
+    composite filters combine inner `filters` with `op` AND/OR; filter with op REF refers
+    to another named filter by its `name`.
+    """
+
+    name: str = ""
+    op: str = ""
+    key: str = ""
+    value: str = ""
+    filters: list["Filter"] = field(default_factory=list)
+
+
+@dataclass
+class Selector:
+    name: str
+    count: int
+    filter: str = MAIN_FILTER_NAME
+    clause: Optional[str] = None
+    attribute: str = ""
+
+
+@dataclass
+class Replica:
+    count: int
+    selector: str = ""
+
+
+@dataclass
+class PlacementPolicy:
+    replicas: list[Replica]
+    backup_factor: int = 0
+    selectors: list[Selector] = field(default_factory=list)
+    filters: list[Filter] = field(default_factory=list)
+
+
+class PlacementPolicyError(Exception):
+    pass
+
+
+def parse_placement_policy(policy: str) -> PlacementPolicy:
+    """
+    Parses placement policy in the same language as used by neofs-cli, e.g.:
+
+        REP 2 IN X CBF 1 SELECT 2 IN DISTINCT Country FROM EU AS X
+        FILTER Continent EQ Europe AS EU
+
+    Args:
+        policy: placement policy as a string
+
+    Returns:
+        parsed placement policy
+    """
+    return _PolicyParser(policy).parse()
+
+
+class _PolicyParser:
+    def __init__(self, policy: str) -> None:
+        self.policy = policy
+        self.tokens = _TOKEN_REGEX.findall(policy)
+        self.position = 0
+
+    def parse(self) -> PlacementPolicy:
+        replicas = []
+        while self._peek() == "REP":
+            self._next()
+            replica = Replica(count=self._number())
+            if self._accept("IN"):
+                replica.selector = self._identifier()
+            replicas.append(replica)
+        if not replicas:
+            self._fail("policy should start with at least one REP statement")
+
+        backup_factor = self._number() if self._accept("CBF") else 0
+
+        selectors = []
+        while self._accept("SELECT"):
+            count = self._number()
+            clause, attribute = None, ""
+            if self._accept("IN"):
+                if self._peek() in (CLAUSE_SAME, CLAUSE_DISTINCT):
+                    clause = self._next()
+                attribute = self._identifier()
+            self._expect("FROM")
+            filter_name = self._next()
+            name = self._identifier() if self._accept("AS") else ""
+            selectors.append(Selector(name, count, filter_name, clause, attribute))
+
+        filters = []
+        while self._accept("FILTER"):
+            filter = self._parse_or()
+            self._expect("AS")
+            filter.name = self._identifier()
+            filters.append(filter)
+
+        if self._peek() is not None:
+            self._fail(f"unexpected token '{self._peek()}'")
+
+        policy = PlacementPolicy(replicas, backup_factor, selectors, filters)
+        _validate_policy(policy)
+        return policy
+
+    def _parse_or(self) -> Filter:
+        filters = [self._parse_and()]
+        while self._accept("OR"):
+            filters.append(self._parse_and())
+        return filters[0] if len(filters) == 1 else Filter(op="OR", filters=filters)
+
+    def _parse_and(self) -> Filter:
+        filters = [self._parse_expression()]
+        while self._accept("AND"):
+            filters.append(self._parse_expression())
+        return filters[0] if len(filters) == 1 else Filter(op="AND", filters=filters)
+
+    def _parse_expression(self) -> Filter:
+        if self._accept("("):
+            filter = self._parse_or()
+            self._expect(")")
+            return filter
+        if self._accept("@"):
+            return Filter(name=self._identifier(), op="REF")
+        key = self._value()
+        op = self._next()
+        if op not in SIMPLE_OPERATIONS:
+            self._fail(f"unknown filter operation '{op}'")
+        return Filter(op=op, key=key, value=self._value())
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            self._fail("unexpected end of policy")
+        self.position += 1
+        return token
+
+    def _accept(self, token: str) -> bool:
+        if self._peek() == token:
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, token: str) -> None:
+        if not self._accept(token):
+            self._fail(f"expected '{token}', got '{self._peek()}'")
+
+    def _number(self) -> int:
+        token = self._next()
+        if not token.isdigit() or int(token) == 0:
+            self._fail(f"expected positive number, got '{token}'")
+        return int(token)
+
+    def _identifier(self) -> str:
+        token = self._next()
+        if token in _KEYWORDS or token in ("(", ")", "@"):
+            self._fail(f"expected identifier, got '{token}'")
+        return token
+
+    def _value(self) -> str:
+        token = self._identifier()
+        if len(token) > 1 and token[0] == token[-1] and token[0] in "'\"":
+            return token[1:-1]
+        return token
+
+    def _fail(self, message: str) -> None:
+        raise PlacementPolicyError(f"Invalid placement policy '{self.policy}': {message}")
+
+
+def _validate_policy(policy: PlacementPolicy) -> None:
+    filter_names = {filter.name for filter in policy.filters}
+    selector_names = {selector.name for selector in policy.selectors}
+
+    def check_references(filter: Filter) -> None:
+        if filter.op == "REF" and filter.name not in filter_names:
+            raise PlacementPolicyError(f"Filter '{filter.name}' is not defined")
+        for inner in filter.filters:
+            check_references(inner)
+
+    for filter in policy.filters:
+        check_references(filter)
+    for selector in policy.selectors:
+        if selector.filter != MAIN_FILTER_NAME and selector.filter not in filter_names:
+            raise PlacementPolicyError(f"Filter '{selector.filter}' is not defined")
+    for replica in policy.replicas:
+        if replica.selector and replica.selector not in selector_names:
+            raise PlacementPolicyError(f"Selector '{replica.selector}' is not defined")
+
+
+def hrw_hash(data: bytes) -> int:
+    """
+    Returns 64-bit murmur3 hash of data, the same as used by storage nodes for HRW
+    """
+    return mmh3.hash64(data, signed=False)[0]
+
+
+def hrw_distance(x: int, y: int) -> int:
+    """
+    Returns distance between two hashes (murmur3 64-bit finalizer of their XOR)
+    """
+    acc = x ^ y
+    acc ^= acc >> 33
+    acc = (acc * 0xFF51AFD7ED558CCD) & _UINT64_MASK
+    acc ^= acc >> 33
+    acc = (acc * 0xC4CEB9FE1A85EC53) & _UINT64_MASK
+    acc ^= acc >> 33
+    return acc
+
+
+def hrw_sort(
+    items: Sequence, hashes: Sequence[int], pivot: int, weights: Optional[Sequence[float]] = None
+) -> list:
+    """
+    Sorts items by rendezvous (HRW) distance between their hashes and pivot
+
+    If weights differ, items are sorted by distance scaled by their weights instead, so that
+    items with larger weight are more likely to come first.
+    """
+    if weights and len(set(weights)) > 1:
+        scores = [
+            float(_UINT64_MASK - hrw_distance(item_hash, pivot)) * weight
+            for item_hash, weight in zip(hashes, weights)
+        ]
+        order = sorted(range(len(items)), key=lambda index: scores[index], reverse=True)
+    else:
+        distances = [hrw_distance(item_hash, pivot) for item_hash in hashes]
+        order = sorted(range(len(items)), key=lambda index: distances[index])
+    return [items[index] for index in order]
+
+
+class PlacementEvaluator:
+    """
+    Evaluates placement policy against network map the same way as storage nodes do
+
+    Evaluator builds container nodes (nodes selected by policy for container) and placement
+    vectors for objects (container nodes ordered by HRW distance to object ID). Hashes of node
+    keys and normalized weights of nodes are calculated once per evaluator, so it can be reused
+    for many containers and objects of the same network map.
+
+    Example:
+        evaluator = PlacementEvaluator(netmap_nodes)
+        nodes = evaluator.get_object_holders("REP 2 CBF 1 SELECT 2 FROM *", cid, oid)
+    """
+
+    def __init__(self, nodes: Iterable[PlacementNode]) -> None:
+        self.nodes = list(nodes)
+        self._node_hashes = {
+            id(node): hrw_hash(bytes.fromhex(node.public_key)) for node in self.nodes
+        }
+        self._weight_func = _default_weight_func(self.nodes)
+        self._node_weights = {id(node): self._weight_func(node) for node in self.nodes}
+
+    def get_container_nodes(
+        self, policy: Union[str, PlacementPolicy], cid: str
+    ) -> list[list[PlacementNode]]:
+        """
+        Returns nodes selected for container, one vector of nodes per REP statement of policy
+
+        Args:
+            policy: placement policy of the container
+            cid: ID of the container
+
+        Returns:
+            vectors of nodes of the container
+        """
+        if isinstance(policy, str):
+            policy = parse_placement_policy(policy)
+        pivot = hrw_hash(base58.b58decode(cid))
+        backup_factor = policy.backup_factor or DEFAULT_BACKUP_FACTOR
+
+        filters = {filter.name: filter for filter in policy.filters}
+        if not policy.selectors:
+            return [
+                self._flatten(
+                    self._select(Selector("", replica.count), filters, backup_factor, pivot)
+                )
+                for replica in policy.replicas
+            ]
+
+        selections = {
+            selector.name: self._select(selector, filters, backup_factor, pivot)
+            for selector in policy.selectors
+        }
+        result = []
+        for replica in policy.replicas:
+            if replica.selector:
+                result.append(self._flatten(selections[replica.selector]))
+            else:
+                result.append(
+                    [
+                        node
+                        for selector in policy.selectors
+                        for node in self._flatten(selections[selector.name])
+                    ]
+                )
+        return result
+
+    def get_placement_vectors(
+        self, policy: Union[str, PlacementPolicy], cid: str, oid: str
+    ) -> list[list[PlacementNode]]:
+        """
+        Returns container nodes ordered by priority of storing the object, per REP statement
+        """
+        pivot = hrw_hash(base58.b58decode(oid))
+        return [self._sort(vector, pivot) for vector in self.get_container_nodes(policy, cid)]
+
+    def get_object_holders(
+        self, policy: Union[str, PlacementPolicy], cid: str, oid: str
+    ) -> list[PlacementNode]:
+        """
+        Returns nodes that are expected to store copies of the object
+
+        For each REP statement the first nodes of placement vector (as many as replicas are
+        required) are taken, nodes are returned without duplicates in order of priority.
+        """
+        if isinstance(policy, str):
+            policy = parse_placement_policy(policy)
+        holders = {}
+        for replica, vector in zip(policy.replicas, self.get_placement_vectors(policy, cid, oid)):
+            for node in vector[: replica.count]:
+                holders.setdefault(id(node), node)
+        return list(holders.values())
+
+    def _select(
+        self, selector: Selector, filters: dict[str, Filter], backup_factor: int, pivot: int
+    ) -> list[list[PlacementNode]]:
+        if selector.clause == CLAUSE_SAME:
+            buckets_count, nodes_in_bucket = 1, selector.count
+        else:
+            buckets_count, nodes_in_bucket = selector.count, 1
+        max_nodes_in_bucket = nodes_in_bucket * backup_factor
+
+        # Order of buckets does not matter here: suitable ones are sorted by HRW below
+        result, fallback = [], []
+        for bucket in self._get_buckets(selector, filters, pivot):
+            if len(bucket) >= max_nodes_in_bucket:
+                result.append(bucket[:max_nodes_in_bucket])
+            elif len(bucket) >= nodes_in_bucket:
+                fallback.append(bucket)
+        if len(result) < buckets_count:
+            result += fallback
+            if len(result) < buckets_count:
+                logger.warning(
+                    f"Not enough nodes to select {selector.count} node(s) for selector "
+                    f"'{selector.name}': only {len(result)} bucket(s) are suitable"
+                )
+
+        result_weights = [
+            _mean_iqr([self._node_weights[id(node)] for node in bucket]) for bucket in result
+        ]
+        result = hrw_sort(result, [self._bucket_hash(b) for b in result], pivot, result_weights)
+        buckets_count = min(buckets_count, len(result))
+
+        if not selector.attribute:
+            # Each node is a separate bucket without attribute, so to take backup factor into
+            # account remaining nodes are distributed among selected buckets one by one
+            result, fallback = [list(b) for b in result[:buckets_count]], result[buckets_count:]
+            for index, bucket in enumerate(fallback):
+                selected_bucket = result[index % buckets_count]
+                if len(selected_bucket) >= max_nodes_in_bucket:
+                    break
+                selected_bucket += bucket
+        return result[:buckets_count]
+
+    def _get_buckets(
+        self, selector: Selector, filters: dict[str, Filter], pivot: int
+    ) -> list[list[PlacementNode]]:
+        if selector.filter == MAIN_FILTER_NAME:
+            nodes = self.nodes
+        else:
+            nodes = [node for node in self.nodes if _match(filters[selector.filter], node, filters)]
+
+        if selector.attribute:
+            # Nodes are grouped by value of attribute, nodes without attribute go to one bucket
+            buckets_by_value = defaultdict(list)
+            for node in nodes:
+                buckets_by_value[node.attributes.get(selector.attribute, "")].append(node)
+            buckets = list(buckets_by_value.values())
+        else:
+            # Without attribute each node is a separate bucket
+            buckets = [[node] for node in nodes]
+        return [self._sort(bucket, pivot) for bucket in buckets]
+
+    def _sort(self, nodes: list[PlacementNode], pivot: int) -> list[PlacementNode]:
+        return hrw_sort(
+            nodes,
+            [self._node_hashes[id(node)] for node in nodes],
+            pivot,
+            [self._node_weights[id(node)] for node in nodes],
+        )
+
+    def _bucket_hash(self, bucket: list[PlacementNode]) -> int:
+        return self._node_hashes[id(bucket[0])] if bucket else 0
+
+    @staticmethod
+    def _flatten(buckets: list[list[PlacementNode]]) -> list[PlacementNode]:
+        return [node for bucket in buckets for node in bucket]
+
+
+def _match(filter: Filter, node: PlacementNode, filters: dict[str, Filter]) -> bool:
+    if filter.op == "REF":
+        return _match(filters[filter.name], node, filters)
+    if filter.op == "AND":
+        return all(_match(inner, node, filters) for inner in filter.filters)
+    if filter.op == "OR":
+        return any(_match(inner, node, filters) for inner in filter.filters)
+
+    value = node.attributes.get(filter.key, "")
+    if filter.op == "EQ":
+        return value == filter.value
+    if filter.op == "NE":
+        return value != filter.value
+
+    # Other operations compare numeric values, nodes with non-numeric attribute do not match
+    if not value.isdigit() or not filter.value.isdigit():
+        return False
+    compare: dict[str, Callable[[int, int], bool]] = {
+        "GT": int.__gt__,
+        "GE": int.__ge__,
+        "LT": int.__lt__,
+        "LE": int.__le__,
+    }
+    return compare[filter.op](int(value), int(filter.value))
+
+
+def _get_numeric_attribute(node: PlacementNode, name: str) -> int:
+    value = node.attributes.get(name, "")
+    return int(value) if value.isdigit() else 0
+
+
+def _default_weight_func(nodes: list[PlacementNode]) -> Callable[[PlacementNode], float]:
+    """
+    Returns weight function of nodes: sigmoid-normalized capacity multiplied by reverse
+    min-normalized price, both are normalized relative to all nodes of network map
+    """
+    capacity_scale = _mean([_get_numeric_attribute(node, CAPACITY_ATTRIBUTE) for node in nodes])
+    prices = [_get_numeric_attribute(node, PRICE_ATTRIBUTE) for node in nodes]
+    min_price = min(prices) if prices else 0
+
+    def weight(node: PlacementNode) -> float:
+        capacity = _get_numeric_attribute(node, CAPACITY_ATTRIBUTE)
+        price = _get_numeric_attribute(node, PRICE_ATTRIBUTE)
+        if capacity_scale == 0:
+            capacity_norm = 0.0
+        else:
+            ratio = capacity / capacity_scale
+            capacity_norm = ratio / (1 + ratio)
+        return capacity_norm * (min_price + 1) / (price + 1)
+
+    return weight
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def _mean_iqr(values: list[float]) -> float:
+    """
+    Returns mean of values that belong to interquartile range
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    if len(values) < 4:
+        low, high = values[0], values[-1]
+    else:
+        low, high = values[len(values) // 4], values[len(values) * 3 // 4 - 1]
+    return _mean([value for value in values if low <= value <= high])
@@ -0,0 +1,151 @@
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger("NeoLogger")
+
+# Caches created with `get_cache` indexed by name, so that modules that are imported under
+# different names share the same cache and all caches can be invalidated on epoch tick at once
+_caches: dict[str, "ResponseCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of responses to idempotent requests
+
+    Epoch-scoped cache is cleared on every epoch tick (see `invalidate_epoch_caches`), so
+    responses are reused only within the epoch when they were received. Cached values are
+    copied on read and write, so callers may modify returned values safely. Exceptions are
+    never cached. Entries of cache with `ttl` expire after the specified number of seconds,
+    this is useful for responses that may change without explicit invalidation.
+
+    Example:
+        cache = get_cache("head_object")
+        response = cache.get_or_call(key, lambda: make_request())
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = 1024,
+        enabled: bool = True,
+        epoch_scoped: bool = True,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.enabled = enabled
+        self.epoch_scoped = epoch_scoped
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # Values with monotonic time of their expiration (or None if they don't expire)
+        self._entries: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+        # Number of invalidations, so that response requested before invalidation is not cached
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_call(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Returns cached response for the key or calls function and caches its result
+
+        If cache is disabled, function is always called and result is not cached.
+        """
+        if not self.enabled:
+            return func()
+
+        with self._lock:
+            if key in self._entries:
+                value, expires_at = self._entries[key]
+                if expires_at is None or expires_at > monotonic():
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return copy.deepcopy(value)
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        value = func()
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if generation != self._generation:
+                # Cache was invalidated while request was in progress, so response may be stale
+                return value
+            self._entries[key] = (copy.deepcopy(value), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """
+        Removes entries whose keys match predicate, or all entries if predicate is not specified
+        """
+        with self._lock:
+            self._generation += 1
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
+
+
+def get_cache(
+    name: str,
+    max_size: int = 1024,
+    enabled: bool = True,
+    epoch_scoped: bool = True,
+    ttl: Optional[float] = None,
+) -> ResponseCache:
+    """
+    Returns cache with the given name, cache is created on the first call
+    """
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = ResponseCache(name, max_size, enabled, epoch_scoped, ttl)
+        return _caches[name]
+
+
+def invalidate_epoch_caches() -> None:
+    """
+    Clears all epoch-scoped caches, must be called when epoch is changed
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        if cache.epoch_scoped:
+            cache.invalidate()
+
+
+def invalidate_caches(*names: str) -> None:
+    """
+    Clears caches with the given names (or all caches) if they have been created
+    """
+    with _caches_lock:
+        caches = [cache for name, cache in _caches.items() if not names or name in names]
+    for cache in caches:
+        cache.invalidate()
+
+
+def get_caches_stats() -> dict[str, dict[str, Any]]:
+    """
+    Returns hit/miss statistics of all caches
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {cache.name: cache.get_stats() for cache in caches}
@@ -0,0 +1,246 @@
+import logging
+import socket
+import threading
+from typing import Optional
+
+from common import SSH_KEEPALIVE_INTERVAL, SSH_MAX_SESSIONS
+from neofs_testlib.hosting import Host
+from neofs_testlib.shell import CommandOptions, CommandResult, Shell, SSHShell
+from neofs_testlib.shell.interfaces import CommandInspector
+from neofs_testlib.shell.ssh_shell import HostIsNotAvailable, log_command
+from paramiko import SSHClient, SSHException
+from paramiko.ssh_exception import NoValidConnectionsError
+
+logger = logging.getLogger("NeoLogger")
+
+
+class PooledSSHShell(SSHShell):
+    """
+    SSH shell that is shared between callers and keeps its connection open
+
+    Commands are multiplexed as separate channels of a single SSH connection. Number of
+    concurrently open channels is limited by `max_sessions` (it should not exceed MaxSessions
+    setting of the remote sshd). Connection is kept alive with keep-alive packets and is
+    re-established before the next command if it has been dropped. Failure of a single channel
+    (e.g. command timeout) fails only that command, connection is closed only when its transport
+    is not active anymore.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        login: str,
+        password: Optional[str] = None,
+        private_key_path: Optional[str] = None,
+        private_key_passphrase: Optional[str] = None,
+        port: str = "22",
+        command_inspectors: Optional[list[CommandInspector]] = None,
+        max_sessions: int = SSH_MAX_SESSIONS,
+        keepalive_interval: int = SSH_KEEPALIVE_INTERVAL,
+    ) -> None:
+        super().__init__(
+            host=host,
+            login=login,
+            password=password,
+            private_key_path=private_key_path,
+            private_key_passphrase=private_key_passphrase,
+            port=port,
+            command_inspectors=command_inspectors,
+        )
+        self.keepalive_interval = keepalive_interval
+        self._sessions = threading.BoundedSemaphore(max_sessions)
+        # Connection is created and replaced only under the lock, so that concurrent callers
+        # don't create duplicate connections
+        self._connection_lock = threading.Lock()
+        self._pooled_connection: Optional[SSHClient] = None
+
+    def exec(self, command: str, options: Optional[CommandOptions] = None) -> CommandResult:
+        with self._sessions:
+            return super().exec(command, options)
+
+    def drop(self) -> None:
+        with self._connection_lock:
+            self._close_connection()
+
+    @property
+    def _connection(self) -> SSHClient:
+        with self._connection_lock:
+            if not _is_active(self._pooled_connection):
+                if self._pooled_connection is not None:
+                    logger.info(f"SSH connection to {self.host} has been lost, reconnecting")
+                self._close_connection()
+                self._pooled_connection = self._create_connection()
+            return self._pooled_connection
+
+    @log_command
+    def _exec_non_interactive(self, command: str, options: CommandOptions) -> CommandResult:
+        channel = None
+        try:
+            stdin, stdout, stderr = self._connection.exec_command(command, timeout=options.timeout)
+            channel = stdout.channel
+
+            if options.close_stdin:
+                stdin.close()
+
+            decoded_stdout, decoded_stderr = self._read_channels(stdout.channel, stderr.channel)
+            return_code = stdout.channel.recv_exit_status()
+
+            return CommandResult(
+                stdout=decoded_stdout,
+                stderr=decoded_stderr,
+                return_code=return_code,
+            )
+        except (
+            SSHException,
+            TimeoutError,
+            NoValidConnectionsError,
+            ConnectionResetError,
+            AttributeError,
+            socket.timeout,
+        ) as exc:
+            if channel is not None:
+                channel.close()
+            if _is_active(self._pooled_connection):
+                # Channel failed (e.g. command timed out), connection is still used by
+                # other commands, so only this command fails
+                logger.exception(f"Can't execute command {command} on host: {self.host}")
+                raise
+            logger.exception(f"Connection to host {self.host} has been lost")
+            self._reset_connection()
+            raise HostIsNotAvailable(self.host) from exc
+
+    def _reset_connection(self) -> None:
+        # Connection is shared by concurrent commands, so it is closed only if it is broken
+        with self._connection_lock:
+            if not _is_active(self._pooled_connection):
+                self._close_connection()
+
+    def _close_connection(self) -> None:
+        # Must be called with connection lock acquired
+        if self._pooled_connection is not None:
+            self._pooled_connection.close()
+        self._pooled_connection = None
+
+    def _create_connection(self, attempts: int = SSHShell.SSH_CONNECTION_ATTEMPTS) -> SSHClient:
+        connection = super()._create_connection(attempts)
+        if self.keepalive_interval:
+            connection.get_transport().set_keepalive(self.keepalive_interval)
+        return connection
+
+
+def _is_active(connection: Optional[SSHClient]) -> bool:
+    transport = connection.get_transport() if connection is not None else None
+    return transport is not None and transport.is_active()
+
+
+class SSHConnectionPool:
+    """
+    Pool of persistent SSH connections, one connection per address, port, login, credentials
+    and command inspectors
+
+    Example:
+        shell = ssh_connection_pool.get_host_shell(node.host)
+        shell.exec("uptime")
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = SSH_MAX_SESSIONS,
+        keepalive_interval: int = SSH_KEEPALIVE_INTERVAL,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.keepalive_interval = keepalive_interval
+        self._shells: dict[tuple, PooledSSHShell] = {}
+        self._lock = threading.Lock()
+
+    def get_host_shell(self, host: Host) -> Shell:
+        """
+        Returns shell to the host; SSH shells are taken from the pool, other shells
+        (for example local shell of docker host) are returned as is
+        """
+        shell = host.get_shell()
+        if not isinstance(shell, SSHShell):
+            return shell
+        return self._get_pooled_shell(
+            host=shell.host,
+            login=shell.login,
+            password=shell.password,
+            private_key_path=shell.private_key_path,
+            private_key_passphrase=shell.private_key_passphrase,
+            port=shell.port,
+            command_inspectors=shell.command_inspectors,
+        )
+
+    def get_ssh_shell(
+        self,
+        host: str,
+        login: str,
+        password: Optional[str] = None,
+        private_key_path: Optional[str] = None,
+        private_key_passphrase: Optional[str] = None,
+        port: str = "22",
+    ) -> Shell:
+        """
+        Returns pooled SSH shell to the machine that is not a part of hosting (e.g. load node)
+        """
+        return self._get_pooled_shell(
+            host=host,
+            login=login,
+            password=password,
+            private_key_path=private_key_path,
+            private_key_passphrase=private_key_passphrase,
+            port=port,
+        )
+
+    def close(self) -> None:
+        """
+        Closes all connections of the pool
+        """
+        with self._lock:
+            for shell in self._shells.values():
+                shell.drop()
+            self._shells.clear()
+
+    def _get_pooled_shell(
+        self,
+        host: str,
+        login: str,
+        port: str,
+        command_inspectors: Optional[list[CommandInspector]] = None,
+        **credentials,
+    ) -> PooledSSHShell:
+        inspectors = command_inspectors or []
+        # Connections differ not only by address, but by credentials and inspectors (e.g. sudo
+        # with different passwords), so all of them are part of the key
+        key = (
+            host,
+            str(port),
+            login,
+            tuple(sorted(credentials.items())),
+            tuple(_get_inspector_key(inspector) for inspector in inspectors),
+        )
+        with self._lock:
+            shell = self._shells.get(key)
+            if shell is None:
+                shell = PooledSSHShell(
+                    host=host,
+                    login=login,
+                    port=port,
+                    command_inspectors=inspectors,
+                    max_sessions=self.max_sessions,
+                    keepalive_interval=self.keepalive_interval,
+                    **credentials,
+                )
+                self._shells[key] = shell
+            return shell
+
+
+def _get_inspector_key(inspector: CommandInspector) -> tuple:
+    """
+    Returns key of inspector by its type and configuration
+    """
+    attributes = sorted((name, repr(value)) for name, value in vars(inspector).items())
+    return (type(inspector), tuple(attributes))
+
+
+ssh_connection_pool = SSHConnectionPool()
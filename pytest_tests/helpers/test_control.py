@@ -1,8 +1,12 @@
 import logging
+import random
+from dataclasses import dataclass
 from functools import wraps
-from time import sleep, time
+from time import monotonic, sleep, time
+from typing import Any, Callable
 
 from _pytest.outcomes import Failed
+from perf_stats import perf_stats_collector
 from pytest import fail
 
 logger = logging.getLogger("NeoLogger")
@@ -78,3 +82,95 @@ def wait_for_success(max_wait_time: int = 60, interval: int = 1):
         return impl
 
     return wrapper
+
+
+@dataclass
+class ConvergenceResult:
+    """
+    Result of waiting for convergence
+
+    Attributes:
+        value: value returned by the last check
+        elapsed: time in seconds until the check has succeeded (time-to-converge)
+        attempts: number of checks that were made
+    """
+
+    value: Any
+    elapsed: float
+    attempts: int
+
+
+class ConvergenceTimeoutError(AssertionError):
+    def __init__(self, message: str, last_value: Any = None, elapsed: float = 0) -> None:
+        super().__init__(message)
+        self.last_value = last_value
+        self.elapsed = elapsed
+
+
+def wait_for_convergence(
+    check: Callable[[], Any],
+    is_converged: Callable[[Any], bool] = bool,
+    timeout: float = 300,
+    initial_interval: float = 1,
+    max_interval: float = 15,
+    backoff_factor: float = 2,
+    jitter: float = 0.2,
+    ignore_errors: bool = False,
+    description: str = "condition",
+) -> ConvergenceResult:
+    """
+    Calls check function until its result is converged or the deadline is exceeded.
+
+    Intervals between checks grow exponentially from `initial_interval` up to `max_interval`
+    and are randomized by `jitter` (fraction of interval), so that first checks are made soon
+    after the condition might become true and later checks do not load the cluster. Time
+    spent on converging is recorded in perf stats as "Converge <description>".
+
+    Args:
+        check: function that returns current state
+        is_converged: predicate that tells whether the state is the expected one
+        timeout: overall time limit in seconds
+        initial_interval: interval in seconds before the second check
+        max_interval: max interval in seconds between checks
+        backoff_factor: multiplier of interval after every failed check
+        jitter: max random deviation of interval as a fraction of interval
+        ignore_errors: whether exceptions raised by check should be treated as not converged
+            state instead of being raised
+        description: description of the condition for logs and perf stats
+
+    Returns:
+        result with the converged value and time-to-converge
+    """
+    start_time = monotonic()
+    deadline = start_time + timeout
+    interval = initial_interval
+    attempts = 0
+    value = None
+    while True:
+        attempts += 1
+        try:
+            value = check()
+            converged = is_converged(value)
+        except Exception as exc:
+            if not ignore_errors:
+                raise
+            logger.debug(f"Check of {description} failed: {exc}")
+            converged = False
+
+        elapsed = monotonic() - start_time
+        if converged:
+            logger.info(f"{description} converged in {elapsed:.1f}s after {attempts} check(s)")
+            perf_stats_collector.record(f"Converge {description}", elapsed)
+            return ConvergenceResult(value, elapsed, attempts)
+
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            perf_stats_collector.record(f"Converge {description}", elapsed, error=True)
+            raise ConvergenceTimeoutError(
+                f"{description} has not converged in {timeout}s ({attempts} check(s))",
+                last_value=value,
+                elapsed=elapsed,
+            )
+
+        sleep(min(interval * random.uniform(1 - jitter, 1 + jitter), remaining))
+        interval = min(interval * backoff_factor, max_interval)
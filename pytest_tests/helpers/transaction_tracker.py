@@ -0,0 +1,68 @@
+import logging
+from typing import Optional
+
+from epoch_watcher import ChainWatcher
+
+logger = logging.getLogger("NeoLogger")
+
+# Codes of JSON-RPC errors that mean malformed request rather than unknown transaction
+_REQUEST_ERROR_CODES = range(-32700, -32599)
+
+
+class TransactionTracker(ChainWatcher):
+    """
+    Waits for transactions to be persisted in neo-go chain
+
+    Tracker checks pending transactions on every new block (see `ChainWatcher`), heights of all
+    pending transactions are requested with a single batched JSON-RPC call, so waiting for many
+    transactions costs one request per block and ends as soon as the last of them is persisted.
+
+    Example:
+        tracker = TransactionTracker("http://main-chain.neofs.devenv:30333")
+        tracker.wait_for_transactions([tx_id_1, tx_id_2], timeout=15)
+    """
+
+    def get_transaction_heights(self, tx_ids: list[str]) -> dict[str, Optional[int]]:
+        """
+        Returns heights of blocks that contain the transactions, None for unknown transactions
+        """
+        responses = self.rpc_client.call_batch(
+            [("gettransactionheight", [tx_id]) for tx_id in tx_ids]
+        )
+        heights = {}
+        for tx_id, response in zip(tx_ids, responses):
+            error = response.get("error")
+            if error is None:
+                heights[tx_id] = int(response["result"])
+                continue
+            if isinstance(error, dict) and error.get("code") in _REQUEST_ERROR_CODES:
+                raise RuntimeError(f"Failed to get height of transaction {tx_id}: {error}")
+            # Transaction that is not persisted yet is reported as unknown
+            heights[tx_id] = None
+        return heights
+
+    def wait_for_transactions(
+        self, tx_ids: list[str], timeout: Optional[float] = None
+    ) -> dict[str, int]:
+        """
+        Waits until all transactions are persisted
+
+        Returns:
+            heights of blocks that contain the transactions
+        """
+        pending = set(tx_ids)
+        heights = {}
+
+        def is_reached(*_) -> bool:
+            for tx_id, height in self.get_transaction_heights(sorted(pending)).items():
+                if height is not None:
+                    logger.info(f"TX {tx_id} is accepted in block: {height}")
+                    heights[tx_id] = height
+                    pending.discard(tx_id)
+            return not pending
+
+        try:
+            self._wait(is_reached, timeout or self.timeout, f"{len(pending)} transaction(s)")
+        except TimeoutError as exc:
+            raise TimeoutError(f"{exc}, not persisted: {', '.join(sorted(pending))}") from exc
+        return heights
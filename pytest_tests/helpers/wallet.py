@@ -1,12 +1,18 @@
+import logging
 import os
+import threading
 import uuid
 from dataclasses import dataclass
+from typing import Callable, Optional
 
 from cluster import Cluster, NodeBase
-from common import FREE_STORAGE, WALLET_CONFIG, WALLET_PASS
-from neofs_testlib.shell import Shell
+from common import FREE_STORAGE, WALLET_CONFIG, WALLET_PASS, WALLET_POOL_SIZE
+from neofs_testlib.shell import LocalShell, Shell
 from neofs_testlib.utils.wallet import get_last_address_from_wallet, init_wallet
-from python_keywords.payment_neogo import deposit_gas, transfer_gas
+from parallel import LocalShellWithoutReport, without_step
+from python_keywords.payment_neogo import deposit_gas_from_many, transfer_gas_to_many
+
+logger = logging.getLogger("NeoLogger")
 
 
 @dataclass
@@ -32,10 +38,38 @@ class WalletFile:
 
 
 class WalletFactory:
-    def __init__(self, wallets_dir: str, shell: Shell, cluster: Cluster) -> None:
+    """
+    Creates wallets funded with GAS and NeoFS deposit
+
+    Wallets with default password are taken from a pool of pre-funded wallets: the pool is
+    funded with a single multi-recipient GAS transfer followed by deposits that are submitted
+    concurrently, so cost of waiting for transactions is paid once per pool rather than once per
+    wallet. Pool is refilled in background thread once half of it is used.
+
+    Pool is sized to demand: it starts with a single wallet and is doubled (up to `pool_size`)
+    every time a wallet is requested while the pool is empty, so that sessions that need few
+    wallets do not fund unused ones.
+    """
+
+    def __init__(
+        self, wallets_dir: str, shell: Shell, cluster: Cluster, pool_size: int = WALLET_POOL_SIZE
+    ) -> None:
         self.shell = shell
         self.wallets_dir = wallets_dir
         self.cluster = cluster
+        self.pool_size = pool_size
+        # Allure is not thread-safe, so commands of background refill are not reported
+        self._refill_shell = (
+            LocalShellWithoutReport(shell.command_inspectors)
+            if isinstance(shell, LocalShell)
+            else None
+        )
+        self._pool: list[WalletFile] = []
+        self._pool_target_size = 0
+        self._pool_condition = threading.Condition()
+        self._refill_thread: Optional[threading.Thread] = None
+        self._refill_error: Optional[Exception] = None
+        self._closed = False
 
     def create_wallet(self, password: str = WALLET_PASS) -> WalletFile:
         """
@@ -46,25 +80,111 @@ class WalletFactory:
         Returns:
             WalletFile object of new wallet
         """
-        wallet_path = os.path.join(self.wallets_dir, f"{str(uuid.uuid4())}.json")
-        init_wallet(wallet_path, password)
+        if (
+            FREE_STORAGE
+            or password != WALLET_PASS
+            or self.pool_size <= 0
+            or self._refill_shell is None
+        ):
+            return self._create_wallets(1, password)[0]
+
+        with self._pool_condition:
+            wallet = None
+            if not self._pool:
+                # Demand for wallets has exceeded the pool
+                self._pool_target_size = min(max(self._pool_target_size * 2, 1), self.pool_size)
+                if self._is_refilling():
+                    while not self._pool and self._refill_error is None and self._is_refilling():
+                        self._pool_condition.wait()
+                    if self._refill_error is not None:
+                        error, self._refill_error = self._refill_error, None
+                        raise error
+            if self._pool:
+                wallet = self._pool.pop(0)
+
+        if wallet is None:
+            # Nothing is prepared, so the wallet is created right away rather than via the pool
+            wallet = self._create_wallets(1, password)[0]
+
+        with self._pool_condition:
+            # Pool is refilled when half of it is used, so that wallets are funded in batches
+            if len(self._pool) * 2 <= self._pool_target_size:
+                self._start_refill()
+        return wallet
+
+    def close(self) -> None:
+        """
+        Stops refilling of the pool and waits for the current refill to finish
+        """
+        with self._pool_condition:
+            self._closed = True
+            refill_thread = self._refill_thread
+        if refill_thread is not None:
+            refill_thread.join()
+
+    def _is_refilling(self) -> bool:
+        return self._refill_thread is not None and self._refill_thread.is_alive()
+
+    def _start_refill(self) -> None:
+        # Must be called with pool condition acquired
+        if self._closed or self._is_refilling():
+            return
+        count = self._pool_target_size - len(self._pool)
+        if count <= 0:
+            return
+        self._refill_error = None
+        self._refill_thread = threading.Thread(
+            target=self._refill, args=(count,), name="wallet-pool-refill", daemon=True
+        )
+        self._refill_thread.start()
+
+    def _refill(self, count: int) -> None:
+        try:
+            wallets = self._create_wallets(
+                count,
+                WALLET_PASS,
+                shell=self._refill_shell,
+                transfer=without_step(transfer_gas_to_many),
+                deposit=without_step(deposit_gas_from_many),
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to fill wallet pool: {exc}")
+            with self._pool_condition:
+                self._refill_error = exc
+                self._pool_condition.notify_all()
+            return
+        with self._pool_condition:
+            self._pool.extend(wallets)
+            self._pool_condition.notify_all()
+
+    def _create_wallets(
+        self,
+        count: int,
+        password: str,
+        shell: Optional[Shell] = None,
+        transfer: Callable = transfer_gas_to_many,
+        deposit: Callable = deposit_gas_from_many,
+    ) -> list[WalletFile]:
+        shell = shell or self.shell
+        wallets = []
+        for _ in range(count):
+            wallet_path = os.path.join(self.wallets_dir, f"{str(uuid.uuid4())}.json")
+            init_wallet(wallet_path, password)
+            wallets.append(WalletFile(wallet_path, password))
 
         if not FREE_STORAGE:
             main_chain = self.cluster.main_chain_nodes[0]
-            deposit = 30
-            transfer_gas(
-                shell=self.shell,
-                amount=deposit + 1,
+            deposit_amount = 30
+            transfer(
+                shell=shell,
                 main_chain=main_chain,
-                wallet_to_path=wallet_path,
-                wallet_to_password=password,
+                amounts={wallet.get_address(): deposit_amount + 1 for wallet in wallets},
             )
-            deposit_gas(
-                shell=self.shell,
-                amount=deposit,
+            deposit(
+                shell=shell,
                 main_chain=main_chain,
-                wallet_from_path=wallet_path,
-                wallet_from_password=password,
+                amount=deposit_amount,
+                wallets=[(wallet.path, wallet.password) for wallet in wallets],
             )
 
-        return WalletFile(wallet_path, password)
+        return wallets
@@ -18,8 +18,7 @@ class ClusterTestBase:
 
     @allure.title("Tick {epochs_to_tick} epochs")
     def tick_epochs(self, epochs_to_tick: int):
-        for _ in range(epochs_to_tick):
-            self.tick_epoch()
+        return epoch.tick_epochs(self.shell, self.cluster, epochs_to_tick)
 
     def tick_epoch(self):
         epoch.tick_epoch(self.shell, self.cluster)
@@ -8,8 +8,9 @@ from k6 import K6, LoadParams, LoadResults
 from neofs_testlib.cli.neofs_authmate import NeofsAuthmate
 from neofs_testlib.cli.neogo import NeoGo
 from neofs_testlib.hosting import Hosting
-from neofs_testlib.shell import CommandOptions, SSHShell
+from neofs_testlib.shell import CommandOptions
 from neofs_testlib.shell.interfaces import InteractiveInput
+from ssh_pool import ssh_connection_pool
 
 NEOFS_AUTHMATE_PATH = "neofs-s3-authmate"
 STOPPED_HOSTS = []
@@ -46,13 +47,17 @@ def init_s3_client(
     host = hosting.get_host_by_service(service_configs[0].name)
     wallet_path = service_configs[0].attributes["wallet_path"]
     neogo_cli_config = host.get_cli_config("neo-go")
-    neogo_wallet = NeoGo(shell=host.get_shell(), neo_go_exec_path=neogo_cli_config.exec_path).wallet
+    neogo_wallet = NeoGo(
+        shell=ssh_connection_pool.get_host_shell(host), neo_go_exec_path=neogo_cli_config.exec_path
+    ).wallet
     dump_keys_output = neogo_wallet.dump_keys(wallet=wallet_path, wallet_config=None).stdout
     public_key = str(re.search(r":\n(?P<public_key>.*)", dump_keys_output).group("public_key"))
     node_endpoint = service_configs[0].attributes["rpc_endpoint"]
     # prompt_pattern doesn't work at the moment
     for load_node in load_nodes:
-        ssh_client = SSHShell(host=load_node, login=login, private_key_path=pkey)
+        ssh_client = ssh_connection_pool.get_ssh_shell(
+            host=load_node, login=login, private_key_path=pkey
+        )
         path = ssh_client.exec(r"sudo find . -name 'k6' -exec dirname {} \; -quit").stdout.strip(
             "\n"
         )
@@ -109,7 +114,9 @@ def prepare_k6_instances(
 ) -> list[K6]:
     k6_load_objects = []
     for load_node in load_nodes:
-        ssh_client = SSHShell(host=load_node, login=login, private_key_path=pkey)
+        ssh_client = ssh_connection_pool.get_ssh_shell(
+            host=load_node, login=login, private_key_path=pkey
+        )
         k6_load_object = K6(load_params, ssh_client)
         k6_load_objects.append(k6_load_object)
     for k6_load_object in k6_load_objects:
@@ -1,13 +1,13 @@
 import logging
+from collections import defaultdict
 from time import sleep
 
 import allure
-import pytest
 from cluster import Cluster
 from epoch import tick_epoch
-from grpc_responses import OBJECT_ALREADY_REMOVED
+from grpc_responses import OBJECT_ALREADY_REMOVED, error_matches_status
 from neofs_testlib.shell import Shell
-from python_keywords.neofs_verbs import delete_object, get_object
+from python_keywords import neofs_verbs
 from storage_object_info import StorageObjectInfo
 from tombstone import verify_head_tombstone
 
@@ -27,35 +27,46 @@ def delete_objects(
         storage_objects: list of objects to delete
         shell: executor for cli command
     """
+    # Objects are deleted in batches, one batch per wallet and container
+    batches: dict[tuple[str, str], list[StorageObjectInfo]] = defaultdict(list)
+    for storage_object in storage_objects:
+        batches[(storage_object.wallet_file_path, storage_object.cid)].append(storage_object)
 
     with allure.step("Delete objects"):
-        for storage_object in storage_objects:
-            storage_object.tombstone = delete_object(
-                storage_object.wallet_file_path,
-                storage_object.cid,
-                storage_object.oid,
-                shell=shell,
-                endpoint=cluster.default_rpc_endpoint,
-            )
-            verify_head_tombstone(
-                wallet_path=storage_object.wallet_file_path,
-                cid=storage_object.cid,
-                oid_ts=storage_object.tombstone,
-                oid=storage_object.oid,
+        for (wallet, cid), batch in batches.items():
+            results = neofs_verbs.delete_objects(
+                wallet,
+                cid,
+                [storage_object.oid for storage_object in batch],
                 shell=shell,
                 endpoint=cluster.default_rpc_endpoint,
             )
+            for storage_object, result in zip(batch, results):
+                if not result.succeeded:
+                    raise result.error
+                storage_object.tombstone = result.result
+                verify_head_tombstone(
+                    wallet_path=wallet,
+                    cid=cid,
+                    oid_ts=storage_object.tombstone,
+                    oid=storage_object.oid,
+                    shell=shell,
+                    endpoint=cluster.default_rpc_endpoint,
+                )
 
     tick_epoch(shell, cluster)
     sleep(CLEANUP_TIMEOUT)
 
     with allure.step("Get objects and check errors"):
-        for storage_object in storage_objects:
-            with pytest.raises(Exception, match=OBJECT_ALREADY_REMOVED):
-                get_object(
-                    storage_object.wallet_file_path,
-                    storage_object.cid,
-                    storage_object.oid,
-                    shell=shell,
-                    endpoint=cluster.default_rpc_endpoint,
-                )
+        for (wallet, cid), batch in batches.items():
+            results = neofs_verbs.get_objects(
+                wallet,
+                cid,
+                [storage_object.oid for storage_object in batch],
+                shell=shell,
+                endpoint=cluster.default_rpc_endpoint,
+            )
+            for result in results:
+                assert not result.succeeded and error_matches_status(
+                    result.error, OBJECT_ALREADY_REMOVED
+                ), f"Expected {OBJECT_ALREADY_REMOVED} for object {result.item}, got: {result}"
@@ -250,9 +250,7 @@ class TestStorageGroup(ClusterTestBase):
             objects,
             lifetime=1,
         )
-        with allure.step("Tick two epochs"):
-            for _ in range(2):
-                self.tick_epoch()
+        self.tick_epochs(2)
         with pytest.raises(Exception, match=OBJECT_NOT_FOUND):
             get_storagegroup(
                 shell=self.shell,
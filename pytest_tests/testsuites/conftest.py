@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import re
@@ -14,11 +15,10 @@ from common import (
     ASSETS_DIR,
     COMPLEX_OBJECT_CHUNKS_COUNT,
     COMPLEX_OBJECT_TAIL_SIZE,
-    FREE_STORAGE,
     HOSTING_CONFIG_FILE,
+    PERF_REPORT_DIR,
     SIMPLE_OBJECT_SIZE,
     STORAGE_NODE_SERVICE_NAME_REGEX,
-    WALLET_PASS,
 )
 from env_properties import save_env_properties
 from k6 import LoadParams
@@ -35,15 +35,19 @@ from load_params import (
 from neofs_testlib.hosting import Hosting
 from neofs_testlib.reporter import AllureHandler, get_reporter
 from neofs_testlib.shell import LocalShell, Shell
-from neofs_testlib.utils.wallet import init_wallet
-from payment_neogo import deposit_gas, transfer_gas
+from perf_stats import perf_stats_collector
 from python_keywords.neofs_verbs import get_netmap_netinfo
-from python_keywords.node_management import storage_node_healthcheck
+from python_keywords.node_management import storage_nodes_healthcheck
+from response_cache import get_caches_stats
+from ssh_pool import ssh_connection_pool
 
 from helpers.wallet import WalletFactory
 
 logger = logging.getLogger("NeoLogger")
 
+# Time limit in seconds for health check of all storage nodes before test session
+HEALTHCHECK_DEADLINE = 120
+
 
 def pytest_collection_modifyitems(items):
     # Make network tests last based on @pytest.mark.node_mgmt
@@ -54,6 +58,29 @@ def pytest_collection_modifyitems(items):
     items.sort(key=lambda item: priority(item))
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item):
+    # Attribute durations of keyword calls to the test that is running
+    perf_stats_collector.current_test = item.nodeid
+    yield
+    perf_stats_collector.current_test = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def perf_report():
+    """Saves report with durations of keyword calls at the end of test session."""
+    yield perf_stats_collector
+
+    with allure.step("Attach keyword performance report"):
+        json_path, text_path = perf_stats_collector.save_report(PERF_REPORT_DIR)
+        logger.info(f"Keyword performance report:\n{perf_stats_collector.format_report()}")
+        allure.attach.file(json_path, "Keyword performance report", allure.attachment_type.JSON)
+        allure.attach.file(text_path, "Keyword performance summary", allure.attachment_type.TEXT)
+        allure.attach(
+            json.dumps(get_caches_stats(), indent=4), "Cache stats", allure.attachment_type.JSON
+        )
+
+
 @pytest.fixture(scope="session")
 def configure_testlib():
     get_reporter().register_handler(AllureHandler())
@@ -76,6 +103,13 @@ def hosting(configure_testlib) -> Hosting:
     yield hosting_instance
 
 
+@pytest.fixture(scope="session", autouse=True)
+def ssh_connections():
+    """Closes pooled SSH connections at the end of test session."""
+    yield ssh_connection_pool
+    ssh_connection_pool.close()
+
+
 @pytest.fixture(scope="session")
 def require_multiple_hosts(hosting: Hosting):
     """Designates tests that require environment with multiple hosts.
@@ -111,7 +145,9 @@ def complex_object_size(max_object_size: int) -> int:
 
 @pytest.fixture(scope="session")
 def wallet_factory(temp_directory: str, client_shell: Shell, cluster: Cluster) -> WalletFactory:
-    return WalletFactory(temp_directory, client_shell, cluster)
+    wallet_factory = WalletFactory(temp_directory, client_shell, cluster)
+    yield wallet_factory
+    wallet_factory.close()
 
 
 @pytest.fixture(scope="session")
@@ -121,6 +157,12 @@ def cluster(temp_directory: str, hosting: Hosting) -> Cluster:
         cluster.create_wallet_configs(hosting)
     yield cluster
 
+    with allure.step("Attach storage endpoints selection stats"):
+        stats = cluster.endpoint_selector.get_stats()
+        allure.attach(
+            json.dumps(stats, indent=4), "Endpoint selection stats", allure.attachment_type.JSON
+        )
+
 
 @pytest.fixture(scope="session", autouse=True)
 @allure.title("Check binary versions")
@@ -163,11 +205,8 @@ def collect_logs(temp_directory, hosting: Hosting):
 @pytest.fixture(scope="session", autouse=True)
 @allure.title("Run health check for all storage nodes")
 def run_health_check(collect_logs, cluster: Cluster):
-    failed_nodes = []
-    for node in cluster.storage_nodes:
-        health_check = storage_node_healthcheck(node)
-        if health_check.health_status != "READY" or health_check.network_status != "ONLINE":
-            failed_nodes.append(node)
+    results = storage_nodes_healthcheck(cluster.storage_nodes, deadline=HEALTHCHECK_DEADLINE)
+    failed_nodes = [result.node for result in results if not result.is_healthy]
 
     if failed_nodes:
         raise AssertionError(f"Nodes {failed_nodes} are not healthy")
@@ -240,29 +279,9 @@ def background_grpc_load(client_shell: Shell, hosting: Hosting):
 
 @pytest.fixture(scope="session")
 @allure.title("Prepare wallet and deposit")
-def default_wallet(client_shell: Shell, temp_directory: str, cluster: Cluster):
-    wallet_path = os.path.join(os.getcwd(), ASSETS_DIR, f"{str(uuid.uuid4())}.json")
-    init_wallet(wallet_path, WALLET_PASS)
+def default_wallet(wallet_factory: WalletFactory):
+    wallet_path = wallet_factory.create_wallet().path
     allure.attach.file(wallet_path, os.path.basename(wallet_path), allure.attachment_type.JSON)
-
-    if not FREE_STORAGE:
-        main_chain = cluster.main_chain_nodes[0]
-        deposit = 30
-        transfer_gas(
-            shell=client_shell,
-            amount=deposit + 1,
-            main_chain=main_chain,
-            wallet_to_path=wallet_path,
-            wallet_to_password=WALLET_PASS,
-        )
-        deposit_gas(
-            shell=client_shell,
-            main_chain=main_chain,
-            amount=deposit,
-            wallet_from_path=wallet_path,
-            wallet_from_password=WALLET_PASS,
-        )
-
     return wallet_path
 
 
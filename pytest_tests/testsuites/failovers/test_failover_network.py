@@ -10,6 +10,7 @@ from file_helper import generate_file, get_file_hash
 from iptables_helper import IpTablesHelper
 from python_keywords.container import create_container
 from python_keywords.neofs_verbs import get_object, put_object_to_random_node
+from ssh_pool import ssh_connection_pool
 from wellknown_acl import PUBLIC_ACL
 
 from steps.cluster_test_base import ClusterTestBase
@@ -32,7 +33,9 @@ class TestFailoverNetwork(ClusterTestBase):
         not_empty = len(blocked_nodes) != 0
         for node in list(blocked_nodes):
             with allure.step(f"Restore network at host for {node.label}"):
-                IpTablesHelper.restore_input_traffic_to_port(node.host.get_shell(), PORTS_TO_BLOCK)
+                IpTablesHelper.restore_input_traffic_to_port(
+                    ssh_connection_pool.get_host_shell(node.host), PORTS_TO_BLOCK
+                )
             blocked_nodes.remove(node)
         if not_empty:
             wait_all_storage_nodes_returned(self.cluster)
@@ -76,7 +79,9 @@ class TestFailoverNetwork(ClusterTestBase):
             with allure.step(f"Block incoming traffic at node {node} on port {PORTS_TO_BLOCK}"):
                 blocked_nodes.append(node)
                 excluded_nodes.append(node)
-                IpTablesHelper.drop_input_traffic_to_port(node.host.get_shell(), PORTS_TO_BLOCK)
+                IpTablesHelper.drop_input_traffic_to_port(
+                    ssh_connection_pool.get_host_shell(node.host), PORTS_TO_BLOCK
+                )
                 sleep(wakeup_node_timeout)
 
             with allure.step(f"Check object is not stored on node {node}"):
@@ -97,7 +102,9 @@ class TestFailoverNetwork(ClusterTestBase):
 
         for node in nodes_to_block:
             with allure.step(f"Unblock incoming traffic at host {node} on port {PORTS_TO_BLOCK}"):
-                IpTablesHelper.restore_input_traffic_to_port(node.host.get_shell(), PORTS_TO_BLOCK)
+                IpTablesHelper.restore_input_traffic_to_port(
+                    ssh_connection_pool.get_host_shell(node.host), PORTS_TO_BLOCK
+                )
                 blocked_nodes.remove(node)
                 sleep(wakeup_node_timeout)
 
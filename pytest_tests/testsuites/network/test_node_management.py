@@ -31,11 +31,13 @@ from python_keywords.node_management import (
     include_node_to_network_map,
     node_shard_list,
     node_shard_set_mode,
+    node_shards_set_mode,
     start_storage_nodes,
     storage_node_healthcheck,
     storage_node_set_status,
 )
 from storage_policy import get_nodes_with_object, get_simple_object_copies
+from test_control import ConvergenceTimeoutError
 from utility import parse_time, placement_policy_from_container, wait_for_gc_pass_on_storage_nodes
 from wellknown_acl import PUBLIC_ACL
 
@@ -74,8 +76,7 @@ class TestNodeManagement(ClusterTestBase):
         shards = node_shard_list(node)
         assert shards
 
-        for shard in shards:
-            node_shard_set_mode(node, shard, "read-write")
+        node_shards_set_mode(node, shards, "read-write")
 
         node_shard_list(node)
 
@@ -84,7 +85,7 @@ class TestNodeManagement(ClusterTestBase):
         for attempt in range(attempts):
             try:
                 self.tick_epoch()
-            except RuntimeError:
+            except (RuntimeError, TimeoutError, ConvergenceTimeoutError):
                 sleep(timeout)
                 if attempt >= attempts - 1:
                     raise
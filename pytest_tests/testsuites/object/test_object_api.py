@@ -23,7 +23,9 @@ from python_keywords.neofs_verbs import (
     get_range_hash,
     head_object,
     put_object_to_random_node,
+    put_objects,
     search_object,
+    verify_search_result,
 )
 from python_keywords.storage_policy import get_complex_object_copies, get_simple_object_copies
 
@@ -107,26 +109,27 @@ def storage_objects(
 
     storage_objects = []
 
-    with allure.step("Put objects"):
-        # We need to upload objects multiple times with different attributes
-        for attributes in OBJECT_ATTRIBUTES:
-            storage_object_id = put_object_to_random_node(
-                wallet=wallet,
-                path=file_path,
-                cid=cid,
-                shell=client_shell,
-                cluster=cluster,
-                attributes=attributes,
-            )
+    # We need to upload objects multiple times with different attributes
+    results = put_objects(
+        wallet=wallet,
+        paths=[file_path] * len(OBJECT_ATTRIBUTES),
+        cid=cid,
+        shell=client_shell,
+        endpoint=cluster.get_storage_rpc_endpoints(),
+        attributes=OBJECT_ATTRIBUTES,
+    )
+    for result in results:
+        if not result.succeeded:
+            raise result.error
 
-            storage_object = StorageObjectInfo(cid, storage_object_id)
-            storage_object.size = request.param
-            storage_object.wallet_file_path = wallet
-            storage_object.file_path = file_path
-            storage_object.file_hash = file_hash
-            storage_object.attributes = attributes
+        storage_object = StorageObjectInfo(cid, result.result)
+        storage_object.size = request.param
+        storage_object.wallet_file_path = wallet
+        storage_object.file_path = file_path
+        storage_object.file_hash = file_hash
+        storage_object.attributes = OBJECT_ATTRIBUTES[result.index]
 
-            storage_objects.append(storage_object)
+        storage_objects.append(storage_object)
 
     yield storage_objects
 
@@ -247,7 +250,7 @@ class TestObjectApi(ClusterTestBase):
                 expected_objects_list=oids,
                 root=True,
             )
-            assert sorted(oids) == sorted(result)
+            assert verify_search_result(result, oids), f"Expected {oids}, got {result}"
 
             # search by test table
             for filter, expected_oids in test_table:
@@ -260,7 +263,9 @@ class TestObjectApi(ClusterTestBase):
                     expected_objects_list=expected_oids,
                     root=True,
                 )
-                assert sorted(expected_oids) == sorted(result)
+                assert verify_search_result(
+                    result, expected_oids
+                ), f"Expected {expected_oids}, got {result}"
 
     @allure.title("Validate object search with removed items")
     @pytest.mark.parametrize(
@@ -7,7 +7,7 @@ from cluster import Cluster
 from cluster_test_base import ClusterTestBase
 from common import STORAGE_GC_TIME
 from complex_object_actions import get_link_object, get_storage_object_chunks
-from epoch import ensure_fresh_epoch, get_epoch, tick_epoch
+from epoch import advance_to_epoch, ensure_fresh_epoch
 from grpc_responses import (
     LIFETIME_REQUIRED,
     LOCK_NON_REGULAR_OBJECT,
@@ -92,13 +92,7 @@ def locked_storage_object(
     yield storage_object
 
     with allure.step("Delete created locked object"):
-        current_epoch = get_epoch(client_shell, cluster)
-        epoch_diff = expiration_epoch - current_epoch + 1
-
-        if epoch_diff > 0:
-            with allure.step(f"Tick {epoch_diff} epochs"):
-                for _ in range(epoch_diff):
-                    tick_epoch(client_shell, cluster)
+        advance_to_epoch(client_shell, cluster, expiration_epoch + 1)
         try:
             delete_object(
                 storage_object.wallet_file_path,
@@ -384,9 +378,7 @@ class TestObjectLockWithGrpc(ClusterTestBase):
                         self.cluster.default_rpc_endpoint,
                     )
 
-        with allure.step("Tick two epochs"):
-            self.tick_epoch()
-            self.tick_epoch()
+        self.tick_epochs(2)
 
         with expect_not_raises():
             delete_objects(storage_objects, self.shell, self.cluster)
@@ -11,6 +11,7 @@ from cluster import Cluster, StorageNode
 from common import WALLET_CONFIG
 from configobj import ConfigObj
 from neofs_testlib.cli import NeofsCli
+from ssh_pool import ssh_connection_pool
 
 SHARD_PREFIX = "NEOFS_STORAGE_SHARD_"
 BLOBSTOR_PREFIX = "_BLOBSTOR_"
@@ -117,7 +118,7 @@ class TestControlShard:
     def get_shards_from_config(node: StorageNode) -> list[Shard]:
         config_file = node.get_remote_config_path()
         file_type = pathlib.Path(config_file).suffix
-        contents = node.host.get_shell().exec(f"cat {config_file}").stdout
+        contents = ssh_connection_pool.get_host_shell(node.host).exec(f"cat {config_file}").stdout
 
         parser_method = {
             ".env": shards_from_env,
@@ -136,7 +137,9 @@ class TestControlShard:
 
         cli_config = node.host.get_cli_config("neofs-cli")
 
-        cli = NeofsCli(node.host.get_shell(), cli_config.exec_path, WALLET_CONFIG)
+        cli = NeofsCli(
+            ssh_connection_pool.get_host_shell(node.host), cli_config.exec_path, WALLET_CONFIG
+        )
         result = cli.shards.list(
             endpoint=control_endpoint,
             wallet=wallet_path,
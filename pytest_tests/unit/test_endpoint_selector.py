@@ -0,0 +1,174 @@
+import endpoint_selector
+import pytest
+from endpoint_selector import EndpointSelector
+
+ENDPOINTS = ["s01:8080", "s02:8080", "s03:8080"]
+QUARANTINE_TIME = 30
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(endpoint_selector, "monotonic", clock.monotonic)
+    return clock
+
+
+def _fail(selector: EndpointSelector, endpoint: str, times: int) -> None:
+    for _ in range(times):
+        selector.report_failure(endpoint)
+
+
+def test_round_robin_policy():
+    selector = EndpointSelector(ENDPOINTS, policy="round-robin")
+
+    assert [selector.select() for _ in range(6)] == ENDPOINTS * 2
+    assert [stats["selections"] for stats in selector.get_stats().values()] == [2, 2, 2]
+
+
+def test_round_robin_policy_with_exclude():
+    selector = EndpointSelector(ENDPOINTS, policy="round-robin")
+
+    assert {selector.select(exclude=ENDPOINTS[:2]) for _ in range(3)} == {ENDPOINTS[2]}
+    # If all endpoints are excluded, there is nothing better than to ignore exclusion
+    assert selector.select(exclude=ENDPOINTS) in ENDPOINTS
+
+
+def test_least_outstanding_policy():
+    selector = EndpointSelector(ENDPOINTS, policy="least-outstanding")
+
+    with selector.track(ENDPOINTS[0]), selector.track(ENDPOINTS[1]):
+        assert {selector.select() for _ in range(10)} == {ENDPOINTS[2]}
+        with selector.track(ENDPOINTS[2]), selector.track(ENDPOINTS[2]):
+            assert {selector.select() for _ in range(10)} == set(ENDPOINTS[:2])
+    assert [stats["outstanding"] for stats in selector.get_stats().values()] == [0, 0, 0]
+
+
+def test_ewma_policy_prefers_not_measured_endpoints():
+    selector = EndpointSelector(ENDPOINTS, policy="ewma")
+    selector.report_success(ENDPOINTS[0], 0.1)
+    selector.report_success(ENDPOINTS[1], 0.1)
+
+    assert selector.select() == ENDPOINTS[2]
+
+
+def test_ewma_policy_picks_lowest_expected_latency():
+    selector = EndpointSelector(ENDPOINTS, policy="ewma", ewma_alpha=0.5)
+    for endpoint, latency in zip(ENDPOINTS, [1.0, 0.4, 0.5]):
+        selector.report_success(endpoint, latency)
+
+    assert selector.select() == ENDPOINTS[1]
+
+    # 0.5 * 1.0 + 0.5 * 0.4 = 0.7
+    selector.report_success(ENDPOINTS[1], 1.0)
+    assert selector.get_stats()[ENDPOINTS[1]]["ewma_latency"] == pytest.approx(0.7)
+    assert selector.select() == ENDPOINTS[2]
+
+    # Expected latency is scaled by outstanding requests: 0.5 * 2 > 0.7
+    with selector.track(ENDPOINTS[2]):
+        assert selector.select() == ENDPOINTS[1]
+
+
+def test_quarantine_after_failure_threshold(clock: FakeClock):
+    selector = EndpointSelector(
+        ENDPOINTS, policy="round-robin", failure_threshold=3, quarantine_time=QUARANTINE_TIME
+    )
+
+    _fail(selector, ENDPOINTS[0], 2)
+    assert ENDPOINTS[0] in {selector.select() for _ in range(3)}
+
+    selector.report_failure(ENDPOINTS[0])
+    assert ENDPOINTS[0] not in {selector.select() for _ in range(6)}
+    stats = selector.get_stats()[ENDPOINTS[0]]
+    assert stats["quarantined"] and stats["failures"] == 3
+    assert stats["quarantined_until"] == clock.now + QUARANTINE_TIME
+
+    clock.now += QUARANTINE_TIME
+    assert ENDPOINTS[0] in {selector.select() for _ in range(3)}
+
+
+def test_failure_after_quarantine_doubles_it(clock: FakeClock):
+    selector = EndpointSelector(
+        ENDPOINTS, failure_threshold=3, quarantine_time=QUARANTINE_TIME, max_quarantine_time=100
+    )
+
+    _fail(selector, ENDPOINTS[0], 3)
+    for quarantine_time in [2 * QUARANTINE_TIME, 100, 100]:
+        clock.now += QUARANTINE_TIME * 4
+        # A single failure is enough after quarantine is over
+        selector.report_failure(ENDPOINTS[0])
+        assert selector.get_stats()[ENDPOINTS[0]]["quarantined_until"] == (
+            clock.now + quarantine_time
+        )
+
+
+def test_success_resets_breaker(clock: FakeClock):
+    selector = EndpointSelector(ENDPOINTS, failure_threshold=3, quarantine_time=QUARANTINE_TIME)
+    _fail(selector, ENDPOINTS[0], 3)
+
+    selector.report_success(ENDPOINTS[0])
+
+    stats = selector.get_stats()[ENDPOINTS[0]]
+    assert not stats["quarantined"] and stats["consecutive_failures"] == 0
+    # Breaker is closed again, so threshold applies and quarantine time is not doubled
+    _fail(selector, ENDPOINTS[0], 2)
+    assert not selector.get_stats()[ENDPOINTS[0]]["quarantined"]
+    selector.report_failure(ENDPOINTS[0])
+    assert selector.get_stats()[ENDPOINTS[0]]["quarantined_until"] == clock.now + QUARANTINE_TIME
+
+
+def test_all_quarantined_falls_back_to_earliest_release(clock: FakeClock):
+    selector = EndpointSelector(ENDPOINTS, failure_threshold=1, quarantine_time=QUARANTINE_TIME)
+    for endpoint in [ENDPOINTS[1], ENDPOINTS[0], ENDPOINTS[2]]:
+        selector.report_failure(endpoint)
+        clock.now += 1
+
+    assert [selector.select() for _ in range(3)] == [ENDPOINTS[1]] * 3
+    assert selector.select(exclude=[ENDPOINTS[1]]) == ENDPOINTS[0]
+
+
+def test_track_counts_only_endpoint_failures(clock: FakeClock):
+    selector = EndpointSelector(ENDPOINTS, failure_threshold=1)
+
+    with pytest.raises(RuntimeError):
+        with selector.track(ENDPOINTS[0]):
+            raise RuntimeError("status: code = 2048 message = access to object operation denied")
+    with pytest.raises(RuntimeError):
+        with selector.track(ENDPOINTS[1]):
+            raise RuntimeError("rpc error: code = Unavailable desc = connection refused")
+
+    stats = selector.get_stats()
+    assert (stats[ENDPOINTS[0]]["successes"], stats[ENDPOINTS[0]]["quarantined"]) == (1, False)
+    assert (stats[ENDPOINTS[1]]["failures"], stats[ENDPOINTS[1]]["quarantined"]) == (1, True)
+
+
+def test_reset(clock: FakeClock):
+    selector = EndpointSelector(ENDPOINTS, failure_threshold=1, quarantine_time=QUARANTINE_TIME)
+    _fail(selector, ENDPOINTS[0], 2)
+    _fail(selector, ENDPOINTS[1], 1)
+
+    selector.reset(ENDPOINTS[0])
+
+    stats = selector.get_stats()
+    assert not stats[ENDPOINTS[0]]["quarantined"] and stats[ENDPOINTS[0]]["failures"] == 0
+    assert stats[ENDPOINTS[1]]["quarantined"]
+    # Quarantine time of reset endpoint is not doubled anymore
+    selector.report_failure(ENDPOINTS[0])
+    assert selector.get_stats()[ENDPOINTS[0]]["quarantined_until"] == clock.now + QUARANTINE_TIME
+
+    selector.reset()
+    assert not any(stats["quarantined"] for stats in selector.get_stats().values())
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="at least one endpoint"):
+        EndpointSelector([])
+    with pytest.raises(ValueError, match="Unknown selection policy 'fastest'"):
+        EndpointSelector(ENDPOINTS, policy="fastest")
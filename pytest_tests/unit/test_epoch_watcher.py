@@ -0,0 +1,293 @@
+import base64
+import hashlib
+import json
+import struct
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import pytest
+from epoch_watcher import NEW_EPOCH_EVENT, EpochWatcher
+from transaction_tracker import TransactionTracker
+
+NETMAP_CONTRACT_HASH = "0x1"
+WAIT_TIMEOUT = 5
+# Magic string of WebSocket handshake, see RFC 6455
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+# JSON-RPC error code of neo-go for unknown transaction
+_UNKNOWN_TX_ERROR = -100
+
+
+class Chain:
+    """
+    State of a neo-go chain as seen by its RPC clients
+    """
+
+    def __init__(self) -> None:
+        self.height = 10
+        self.epoch = 5
+        self.transactions: dict[str, int] = {}
+        self.mempool: set[str] = set()
+        self.calls = Counter()
+        self.subscriptions: list[list] = []
+        self.rejected_ws_connections = 0
+        self._subscribers: list["_ChainRequestHandler"] = []
+        self._condition = threading.Condition()
+
+    def add_block(self, new_epoch: bool = False) -> None:
+        with self._condition:
+            index = self.height
+            self.height += 1
+            for tx_id in self.mempool:
+                self.transactions[tx_id] = index
+            self.mempool.clear()
+            if new_epoch:
+                self.epoch += 1
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            subscriber.notify("block_added", {"index": index})
+            if new_epoch:
+                subscriber.notify(
+                    "notification_from_execution",
+                    {
+                        "contract": NETMAP_CONTRACT_HASH,
+                        "eventname": NEW_EPOCH_EVENT,
+                        "state": {
+                            "type": "Array",
+                            "value": [{"type": "Integer", "value": str(self.epoch)}],
+                        },
+                    },
+                )
+
+    def wait_for_calls(self, method: str, count: int) -> None:
+        """
+        Waits until the method is called the specified number of times
+        """
+        with self._condition:
+            assert self._condition.wait_for(lambda: self.calls[method] >= count, WAIT_TIMEOUT)
+
+    def call(self, method: str, params: list) -> dict:
+        with self._condition:
+            self.calls[method] += 1
+            self._condition.notify_all()
+            if method == "getblockcount":
+                return {"result": self.height}
+            if method == "invokefunction":
+                return {
+                    "result": {
+                        "state": "HALT",
+                        "stack": [{"type": "Integer", "value": str(self.epoch)}],
+                    }
+                }
+            if method == "gettransactionheight":
+                if params[0] not in self.transactions:
+                    return {"error": {"code": _UNKNOWN_TX_ERROR, "message": "Unknown transaction"}}
+                return {"result": self.transactions[params[0]]}
+        return {"error": {"code": -32601, "message": "Method not found"}}
+
+    def subscribe(self, subscriber: "_ChainRequestHandler", params: list) -> None:
+        with self._condition:
+            self.subscriptions.append(params)
+            if subscriber not in self._subscribers:
+                self._subscribers.append(subscriber)
+            self._condition.notify_all()
+
+    def unsubscribe(self, subscriber: "_ChainRequestHandler") -> None:
+        with self._condition:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+
+class _ChainRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves JSON-RPC over HTTP (including batches) and subscriptions over WebSocket
+    """
+
+    protocol_version = "HTTP/1.1"
+    chain: Chain
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if isinstance(request, list):
+            response = [self._handle_call(call) for call in request]
+        else:
+            response = self._handle_call(request)
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.chain.rejected_ws_connections > 0:
+            self.chain.rejected_ws_connections -= 1
+            self.send_error(503)
+            return
+
+        accept = hashlib.sha1((self.headers["Sec-WebSocket-Key"] + _WS_GUID).encode()).digest()
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", base64.b64encode(accept).decode())
+        self.end_headers()
+        self.wfile.flush()
+        self._send_lock = threading.Lock()
+        try:
+            while True:
+                message = self._read_frame()
+                if message is None:
+                    break
+                request = json.loads(message)
+                assert request["method"] == "subscribe"
+                # Subscription is active when the response is sent, as it is in neo-go
+                self.chain.subscribe(self, request["params"])
+                self._send_frame(
+                    {"jsonrpc": "2.0", "id": request["id"], "result": str(request["id"])}
+                )
+        finally:
+            self.chain.unsubscribe(self)
+        self.close_connection = True
+
+    def notify(self, event: str, payload: dict) -> None:
+        try:
+            self._send_frame({"jsonrpc": "2.0", "method": event, "params": [payload]})
+        except OSError:
+            self.chain.unsubscribe(self)
+
+    def _handle_call(self, request: dict) -> dict:
+        response = self.chain.call(request["method"], request.get("params") or [])
+        return {"jsonrpc": "2.0", "id": request["id"], **response}
+
+    def _read_frame(self) -> Optional[bytes]:
+        header = self.rfile.read(2)
+        if len(header) < 2 or header[0] & 0x0F == 0x8:
+            return None
+        length = header[1] & 0x7F
+        if length == 126:
+            (length,) = struct.unpack(">H", self.rfile.read(2))
+        elif length == 127:
+            (length,) = struct.unpack(">Q", self.rfile.read(8))
+        mask = self.rfile.read(4)
+        return bytes(byte ^ mask[i % 4] for i, byte in enumerate(self.rfile.read(length)))
+
+    def _send_frame(self, message: dict) -> None:
+        data = json.dumps(message).encode()
+        if len(data) < 126:
+            header = bytes([0x81, len(data)])
+        else:
+            header = bytes([0x81, 126]) + struct.pack(">H", len(data))
+        with self._send_lock:
+            self.connection.sendall(header + data)
+
+
+@pytest.fixture
+def chain():
+    chain = Chain()
+    handler = type("ChainRequestHandler", (_ChainRequestHandler,), {"chain": chain})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    chain.endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    yield chain
+    server.shutdown()
+    server.server_close()
+
+
+def _in_background(func, *args) -> threading.Thread:
+    thread = threading.Thread(target=func, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+def _add_blocks_after_check(chain: Chain, checks: int, blocks: int, new_epoch: bool = False):
+    """
+    Adds blocks after watcher has checked the chain the specified number of times, so that
+    blocks can only be noticed via notifications or polling
+    """
+    chain.wait_for_calls("getblockcount", checks)
+    for _ in range(blocks):
+        chain.add_block(new_epoch)
+
+
+def test_wait_for_blocks_with_subscription(chain: Chain):
+    watcher = EpochWatcher(chain.endpoint)
+    # The first check is done by wait_for_blocks and the second one after subscription
+    _in_background(_add_blocks_after_check, chain, 2, 3)
+
+    assert watcher.wait_for_blocks(2, WAIT_TIMEOUT) == 12
+    assert chain.calls["getblockcount"] == 2
+    assert chain.subscriptions[0] == ["block_added"]
+
+
+def test_wait_for_epoch_with_subscription(chain: Chain):
+    watcher = EpochWatcher(chain.endpoint)
+    _in_background(_add_blocks_after_check, chain, 1, 2, True)
+
+    assert watcher.wait_for_epoch(NETMAP_CONTRACT_HASH, 7, WAIT_TIMEOUT) == 7
+    assert ["notification_from_execution", {"name": NEW_EPOCH_EVENT}] in chain.subscriptions
+    # Epoch is requested only once after subscription, then it is taken from notifications
+    assert chain.calls["invokefunction"] == 1
+
+
+def test_wait_for_epoch_that_is_reached(chain: Chain):
+    watcher = EpochWatcher(chain.endpoint)
+
+    assert watcher.wait_for_epoch(NETMAP_CONTRACT_HASH, 5, WAIT_TIMEOUT) == 5
+
+
+def test_wait_for_blocks_with_polling(chain: Chain):
+    watcher = EpochWatcher(chain.endpoint, use_websocket=False, poll_interval=0.05)
+    _in_background(_add_blocks_after_check, chain, 2, 2)
+
+    assert watcher.wait_for_blocks(2, WAIT_TIMEOUT) == 12
+    assert not chain.subscriptions
+
+
+def test_subscription_failure_falls_back_to_polling_once(chain: Chain):
+    watcher = EpochWatcher(chain.endpoint, poll_interval=0.05)
+    chain.rejected_ws_connections = 1
+    _in_background(_add_blocks_after_check, chain, 2, 1)
+
+    assert watcher.wait_for_blocks(1, WAIT_TIMEOUT) == 11
+    assert not chain.subscriptions
+
+    # Failure of a single subscription does not disable subscriptions for next waits
+    _in_background(_add_blocks_after_check, chain, chain.calls["getblockcount"] + 2, 1)
+
+    assert watcher.wait_for_blocks(1, WAIT_TIMEOUT) == 12
+    assert chain.subscriptions[0] == ["block_added"]
+    assert watcher.use_websocket
+
+
+def test_wait_for_blocks_timeout(chain: Chain):
+    watcher = EpochWatcher(chain.endpoint)
+
+    with pytest.raises(TimeoutError, match="block 11"):
+        watcher.wait_for_blocks(1, 0.3)
+
+
+@pytest.mark.parametrize("use_websocket", [True, False])
+def test_wait_for_transactions(chain: Chain, use_websocket: bool):
+    tracker = TransactionTracker(chain.endpoint, use_websocket=use_websocket, poll_interval=0.05)
+    chain.transactions["persisted"] = 3
+    chain.mempool.add("pending")
+    _in_background(_add_blocks_after_check, chain, 1, 1)
+
+    assert tracker.wait_for_transactions(["persisted", "pending"], WAIT_TIMEOUT) == {
+        "persisted": 3,
+        "pending": 10,
+    }
+
+
+def test_wait_for_unknown_transaction(chain: Chain):
+    tracker = TransactionTracker(chain.endpoint)
+    chain.transactions["persisted"] = 3
+
+    with pytest.raises(TimeoutError, match="not persisted: unknown$"):
+        tracker.wait_for_transactions(["persisted", "unknown"], 0.3)
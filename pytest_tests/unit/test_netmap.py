@@ -0,0 +1,85 @@
+import pytest
+from netmap import Netmap, NetmapNode
+
+NODE1_KEY = "022bb4041c50d607ff871dec7e4cd7778388e0ea6849d84ccbd9aa8f32e16a8131"
+NODE2_KEY = "02ac920cd7df0b61b289072e6b946e2da4e1a31b9ab1c621bb475e30fa4ab102c3"
+NODE3_KEY = "038c862959e56b43e20f79187c4fe9e0bc7c8c66c1603e6cf0ec7f87ab6b08dc35"
+
+# Output of `neofs-cli netmap snapshot`: node line ends with a space after the last address and
+# attributes are indented with a tab
+SNAPSHOT = (
+    "Epoch: 26\n"
+    f"Node 1: {NODE1_KEY} ONLINE /dns4/s01.neofs.devenv/tcp/8080 "
+    "/dns4/s01.neofs.devenv/tcp/8082/tls \n"
+    "\tContinent: Europe\n"
+    "\tCountry: Russia\n"
+    "\tCountryCode: RU\n"
+    "\tLocation: Moskva\n"
+    "\tCapacity: 10\n"
+    "\tPrice: 22\n"
+    "\tUN-LOCODE: RU MOW\n"
+    "\tExternalAddr: /dns4/s01.neofs.devenv/tcp/8080\n"
+    f"Node 2: {NODE2_KEY} MAINTENANCE /dns4/s02.neofs.devenv/tcp/8080 \n"
+    "\tContinent: Europe\n"
+    "\tCountry: Saint Martin (French Part)\n"
+    "\tComment: group: a, rack: 3\n"
+    "\tUN-LOCODE: MF MAR\n"
+)
+
+
+@pytest.fixture
+def netmap() -> Netmap:
+    return Netmap.from_snapshot(SNAPSHOT)
+
+
+def test_from_snapshot(netmap: Netmap):
+    assert netmap.epoch == 26
+    assert [(node.public_key, node.state) for node in netmap] == [
+        (NODE1_KEY, "ONLINE"),
+        (NODE2_KEY, "MAINTENANCE"),
+    ]
+
+    node = netmap.get_node(NODE1_KEY.upper())
+    assert node.addresses == [
+        "/dns4/s01.neofs.devenv/tcp/8080",
+        "/dns4/s01.neofs.devenv/tcp/8082/tls",
+    ]
+    assert (node.un_locode, node.country, node.capacity, node.price) == ("RU MOW", "Russia", 10, 22)
+    assert node.attributes["ExternalAddr"] == "/dns4/s01.neofs.devenv/tcp/8080"
+    assert netmap.get_node(NODE2_KEY).attributes["Comment"] == "group: a, rack: 3"
+
+
+def test_from_snapshot_with_invalid_node_line():
+    snapshot = SNAPSHOT.replace(f"Node 2: {NODE2_KEY}", "Node 2: not-a-key")
+
+    with pytest.raises(ValueError, match="Node 2: not-a-key"):
+        Netmap.from_snapshot(snapshot)
+
+
+def test_get_nodes(netmap: Netmap):
+    assert NODE1_KEY in netmap and NODE3_KEY not in netmap
+    assert [node.public_key for node in netmap.get_nodes_by_attribute("Continent", "Europe")] == [
+        NODE1_KEY,
+        NODE2_KEY,
+    ]
+    assert netmap.get_nodes_by_attribute("Country", "Sweden") == []
+    assert [node.public_key for node in netmap.get_nodes_by_state("maintenance")] == [NODE2_KEY]
+
+
+def test_diff(netmap: Netmap):
+    nodes = [
+        NetmapNode(
+            NODE2_KEY, "ONLINE", ["/dns4/s02.neofs.devenv/tcp/8080"], {"Continent": "Europe"}
+        ),
+        NetmapNode(NODE3_KEY, "ONLINE", ["/dns4/s03.neofs.devenv/tcp/8080"]),
+    ]
+    next_netmap = Netmap(27, nodes)
+
+    diff = netmap.diff(next_netmap)
+
+    assert [node.public_key for node in diff.added] == [NODE3_KEY]
+    assert [node.public_key for node in diff.removed] == [NODE1_KEY]
+    assert [(old.state, new.state) for old, new in diff.changed] == [("MAINTENANCE", "ONLINE")]
+    assert str(diff) == f"+ {NODE3_KEY}\n- {NODE1_KEY}\n~ {NODE2_KEY}"
+    assert not netmap.diff(Netmap.from_snapshot(SNAPSHOT))
+    assert str(netmap.diff(netmap)) == "no changes"
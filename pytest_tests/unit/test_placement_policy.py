@@ -0,0 +1,237 @@
+import hashlib
+import random
+from dataclasses import dataclass, field
+
+import base58
+import pytest
+from placement_policy import (
+    PlacementEvaluator,
+    PlacementPolicyError,
+    hrw_distance,
+    hrw_hash,
+    hrw_sort,
+    parse_placement_policy,
+)
+from storage_policy import get_expected_nodes_with_object
+
+CONTAINERS_COUNT = 20
+
+_random = random.Random(0)
+
+
+@dataclass
+class NetmapNode:
+    public_key: str
+    attributes: dict[str, str] = field(default_factory=dict)
+
+
+class ClusterNode:
+    """
+    Storage node of the cluster as required by get_expected_nodes_with_object
+    """
+
+    def __init__(self, public_key: str) -> None:
+        self.public_key = public_key
+
+    def get_wallet_public_key(self) -> str:
+        return self.public_key
+
+
+def _make_id(seed: str) -> str:
+    return base58.b58encode(hashlib.sha256(seed.encode()).digest()).decode()
+
+
+def _make_node(index: int, **attributes: str) -> NetmapNode:
+    public_key = "02" + hashlib.sha256(f"node{index}".encode()).hexdigest()
+    return NetmapNode(public_key, {"Capacity": "100", "Price": "1", **attributes})
+
+
+def _keys(nodes) -> list[str]:
+    return [node.public_key for node in nodes]
+
+
+@pytest.fixture
+def netmap() -> list[NetmapNode]:
+    """
+    Network map with 8 nodes: 4 in Germany, 2 in France, 1 in Sweden and 1 without country
+    """
+    countries = ["Germany"] * 4 + ["France"] * 2 + ["Sweden"]
+    nodes = [_make_node(index, Country=country) for index, country in enumerate(countries)]
+    return nodes + [_make_node(len(countries))]
+
+
+@pytest.fixture(params=range(CONTAINERS_COUNT))
+def cid(request) -> str:
+    return _make_id(f"container{request.param}")
+
+
+def test_parse_placement_policy():
+    policy = parse_placement_policy(
+        "REP 1 IN X REP 2 CBF 2 SELECT 2 IN SAME Country FROM DE AS X "
+        "FILTER Country EQ Germany AND (Capacity GT 10 OR @LOW) AS DE FILTER Price LE 5 AS LOW"
+    )
+
+    assert [(replica.count, replica.selector) for replica in policy.replicas] == [(1, "X"), (2, "")]
+    assert policy.backup_factor == 2
+    assert [(s.name, s.count, s.filter, s.clause, s.attribute) for s in policy.selectors] == [
+        ("X", 2, "DE", "SAME", "Country")
+    ]
+    assert [(f.name, f.op, len(f.filters)) for f in policy.filters] == [
+        ("DE", "AND", 2),
+        ("LOW", "LE", 0),
+    ]
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        "SELECT 2 FROM *",
+        "REP 0",
+        "REP 1 IN X",
+        "REP 1 SELECT 1 FROM F",
+        "REP 1 FILTER Country XX Germany AS F",
+    ],
+)
+def test_parse_invalid_placement_policy(policy: str):
+    with pytest.raises(PlacementPolicyError):
+        parse_placement_policy(policy)
+
+
+def test_hrw_hash_known_answer():
+    # The first half of reference MurmurHash3_x64_128("hello") digest cbd8a7b341bd9b02...
+    assert hrw_hash(b"hello") == 0xCBD8A7B341BD9B02
+    assert hrw_hash(b"") == 0
+    # fmix64 finalizer of murmur3 applied to XOR of hashes
+    assert hrw_distance(1, 0) == 0xB456BCFC34C2CB2C
+    assert hrw_distance(hrw_hash(b"hello"), 1) == 0xADD584E5B352E0E4
+
+
+def test_hrw_sort_puts_pivot_first():
+    hashes = [_random.getrandbits(64) for _ in range(16)]
+    items = list(range(len(hashes)))
+
+    for pivot_index in items:
+        assert hrw_sort(items, hashes, hashes[pivot_index])[0] == pivot_index
+    assert hrw_distance(hashes[0], hashes[0]) == 0
+
+
+def test_hrw_sort_puts_zero_weight_last():
+    hashes = [_random.getrandbits(64) for _ in range(16)]
+    weights = [1.0] * (len(hashes) - 1) + [0.0]
+
+    assert hrw_sort(list(range(len(hashes))), hashes, hashes[-1], weights)[-1] == len(hashes) - 1
+
+
+@pytest.mark.parametrize(
+    "policy, nodes_count",
+    [
+        ("REP 1 CBF 1 SELECT 2 FROM * AS X", 2),
+        ("REP 1 CBF 2 SELECT 2 FROM * AS X", 4),
+        ("REP 1 CBF 3 SELECT 2 FROM * AS X", 6),
+        ("REP 1 CBF 5 SELECT 2 FROM * AS X", 8),
+        ("REP 3 CBF 2", 6),
+        ("REP 3", 8),
+    ],
+)
+def test_selector_without_attribute_takes_backup_factor(
+    netmap: list[NetmapNode], cid: str, policy: str, nodes_count: int
+):
+    # Without attribute every node is a separate bucket, nodes above selector count are
+    # distributed among selected buckets until each of them has count * CBF nodes
+    (container_nodes,) = PlacementEvaluator(netmap).get_container_nodes(policy, cid)
+
+    assert len(container_nodes) == nodes_count
+    assert len(set(_keys(container_nodes))) == nodes_count
+
+
+def test_selector_without_attribute_does_not_depend_on_netmap_order(
+    netmap: list[NetmapNode], cid: str
+):
+    policy = "REP 2 CBF 2 SELECT 3 FROM * AS X"
+    expected = PlacementEvaluator(netmap).get_container_nodes(policy, cid)
+
+    shuffled = _random.sample(netmap, len(netmap))
+    assert PlacementEvaluator(shuffled).get_container_nodes(policy, cid) == expected
+
+
+def test_same_selector_uses_single_bucket(netmap: list[NetmapNode], cid: str):
+    # Only Germany has 2 * 2 nodes, other buckets are too small for backup factor
+    (container_nodes,) = PlacementEvaluator(netmap).get_container_nodes(
+        "REP 2 IN X CBF 2 SELECT 2 IN SAME Country FROM * AS X", cid
+    )
+
+    assert sorted(_keys(container_nodes)) == sorted(
+        _keys(node for node in netmap if node.attributes.get("Country") == "Germany")
+    )
+
+
+def test_same_selector_falls_back_to_minimal_backup_factor(netmap: list[NetmapNode], cid: str):
+    # No bucket has 3 * 2 nodes, buckets with at least 3 nodes are used as a fallback
+    (container_nodes,) = PlacementEvaluator(netmap).get_container_nodes(
+        "REP 3 IN X CBF 2 SELECT 3 IN SAME Country FROM * AS X", cid
+    )
+
+    assert sorted(_keys(container_nodes)) == sorted(
+        _keys(node for node in netmap if node.attributes.get("Country") == "Germany")
+    )
+
+
+def test_same_selector_truncates_bucket_to_backup_factor(netmap: list[NetmapNode], cid: str):
+    (container_nodes,) = PlacementEvaluator(netmap).get_container_nodes(
+        "REP 1 IN X CBF 1 SELECT 2 IN SAME Country FROM * AS X", cid
+    )
+
+    assert len(container_nodes) == 2
+    countries = {node.attributes.get("Country") for node in container_nodes}
+    assert len(countries) == 1 and countries <= {"Germany", "France"}
+
+
+def test_distinct_selector_takes_one_node_per_bucket(netmap: list[NetmapNode], cid: str):
+    (container_nodes,) = PlacementEvaluator(netmap).get_container_nodes(
+        "REP 3 IN X CBF 1 SELECT 3 IN DISTINCT Country FROM * AS X", cid
+    )
+
+    assert len(container_nodes) == 3
+    assert len({node.attributes.get("Country", "") for node in container_nodes}) == 3
+
+
+def test_selector_with_filter(netmap: list[NetmapNode], cid: str):
+    (container_nodes,) = PlacementEvaluator(netmap).get_container_nodes(
+        "REP 2 IN X CBF 1 SELECT 2 FROM EU AS X "
+        "FILTER Country EQ France OR Country EQ Sweden AS EU",
+        cid,
+    )
+
+    assert {node.attributes.get("Country") for node in container_nodes} <= {"France", "Sweden"}
+    assert len(container_nodes) == 2
+
+
+def test_node_without_capacity_is_last(netmap: list[NetmapNode], cid: str):
+    netmap[0].attributes["Capacity"] = "0"
+    evaluator = PlacementEvaluator(netmap)
+
+    for index in range(CONTAINERS_COUNT):
+        (vector,) = evaluator.get_placement_vectors("REP 3", cid, _make_id(f"object{index}"))
+        assert vector[-1] is netmap[0]
+
+
+def test_get_expected_nodes_with_object(netmap: list[NetmapNode], cid: str):
+    cluster_nodes = [ClusterNode(node.public_key) for node in reversed(netmap)]
+    policy = "REP 1 IN X REP 2 IN Y CBF 1 SELECT 1 FROM * AS X SELECT 2 IN SAME Country FROM * AS Y"
+    evaluator = PlacementEvaluator(netmap)
+
+    for index in range(CONTAINERS_COUNT):
+        oid = _make_id(f"object{index}")
+        x_vector, y_vector = evaluator.get_placement_vectors(policy, cid, oid)
+        expected_keys = list(dict.fromkeys(_keys(x_vector[:1] + y_vector[:2])))
+
+        holders = get_expected_nodes_with_object(cid, oid, policy, netmap, cluster_nodes)
+
+        assert [node.get_wallet_public_key() for node in holders] == expected_keys
+
+
+def test_get_expected_nodes_with_object_outside_of_cluster(netmap: list[NetmapNode], cid: str):
+    cluster_nodes = [ClusterNode(node.public_key) for node in netmap[1:]]
+
+    with pytest.raises(AssertionError, match="not found in the cluster"):
+        get_expected_nodes_with_object(cid, _make_id("object"), "REP 8", netmap, cluster_nodes)
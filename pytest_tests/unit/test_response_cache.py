@@ -0,0 +1,142 @@
+import threading
+from time import sleep
+
+import pytest
+from response_cache import ResponseCache, get_cache, invalidate_caches, invalidate_epoch_caches
+
+
+class Backend:
+    """
+    Source of responses that counts requests
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.requests = 0
+
+    def request(self, key) -> dict:
+        self.requests += 1
+        return {"key": key, "version": self.version}
+
+
+@pytest.fixture
+def backend() -> Backend:
+    return Backend()
+
+
+def test_responses_are_reused(backend: Backend):
+    cache = ResponseCache("test", max_size=4)
+
+    first = cache.get_or_call("a", lambda: backend.request("a"))
+    second = cache.get_or_call("a", lambda: backend.request("a"))
+
+    assert first == second == {"key": "a", "version": 0}
+    assert backend.requests == 1
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+
+
+def test_cached_values_are_copied(backend: Backend):
+    cache = ResponseCache("test")
+
+    cache.get_or_call("a", lambda: backend.request("a"))["version"] = 100
+
+    assert cache.get_or_call("a", lambda: backend.request("a"))["version"] == 0
+
+
+def test_disabled_cache_calls_function(backend: Backend):
+    cache = ResponseCache("test", enabled=False)
+
+    for _ in range(3):
+        cache.get_or_call("a", lambda: backend.request("a"))
+
+    assert backend.requests == 3
+    assert cache.get_stats()["size"] == 0
+
+
+def test_exceptions_are_not_cached(backend: Backend):
+    cache = ResponseCache("test")
+
+    def fail():
+        raise RuntimeError("request failed")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_call("a", fail)
+
+    assert cache.get_or_call("a", lambda: backend.request("a")) == {"key": "a", "version": 0}
+
+
+def test_least_recently_used_entry_is_evicted(backend: Backend):
+    cache = ResponseCache("test", max_size=2)
+    cache.get_or_call("a", lambda: backend.request("a"))
+    cache.get_or_call("b", lambda: backend.request("b"))
+    # Use of "a" makes "b" the least recently used entry
+    cache.get_or_call("a", lambda: backend.request("a"))
+    cache.get_or_call("c", lambda: backend.request("c"))
+    assert backend.requests == 3
+
+    cache.get_or_call("a", lambda: backend.request("a"))
+    assert backend.requests == 3
+    cache.get_or_call("b", lambda: backend.request("b"))
+    assert backend.requests == 4
+    assert cache.get_stats()["size"] == 2
+
+
+def test_entries_expire_after_ttl(backend: Backend):
+    cache = ResponseCache("test", ttl=0.2)
+    cache.get_or_call("a", lambda: backend.request("a"))
+    backend.version = 1
+
+    assert cache.get_or_call("a", lambda: backend.request("a"))["version"] == 0
+    sleep(0.3)
+    assert cache.get_or_call("a", lambda: backend.request("a"))["version"] == 1
+
+
+def test_invalidate_by_predicate(backend: Backend):
+    cache = ResponseCache("test")
+    for key in ("a", "b"):
+        cache.get_or_call(key, lambda: backend.request(key))
+    backend.version = 1
+
+    cache.invalidate(lambda key: key == "a")
+
+    assert cache.get_or_call("a", lambda: backend.request("a"))["version"] == 1
+    assert cache.get_or_call("b", lambda: backend.request("b"))["version"] == 0
+
+
+def test_response_received_before_invalidation_is_not_cached(backend: Backend):
+    cache = ResponseCache("test")
+    request_started = threading.Event()
+    invalidated = threading.Event()
+
+    def slow_request():
+        response = backend.request("a")
+        request_started.set()
+        invalidated.wait(5)
+        return response
+
+    thread = threading.Thread(target=cache.get_or_call, args=("a", slow_request))
+    thread.start()
+    request_started.wait(5)
+    # Object is changed and cache is invalidated while the request is in progress
+    backend.version = 1
+    cache.invalidate()
+    invalidated.set()
+    thread.join(5)
+
+    assert cache.get_or_call("a", lambda: backend.request("a"))["version"] == 1
+
+
+def test_epoch_scoped_caches_are_invalidated_on_epoch_change(backend: Backend):
+    epoch_cache = get_cache("test_epoch_scoped")
+    persistent_cache = get_cache("test_persistent", epoch_scoped=False)
+    try:
+        for cache in (epoch_cache, persistent_cache):
+            cache.get_or_call("a", lambda: backend.request("a"))
+        backend.version = 1
+
+        invalidate_epoch_caches()
+
+        assert epoch_cache.get_or_call("a", lambda: backend.request("a"))["version"] == 1
+        assert persistent_cache.get_or_call("a", lambda: backend.request("a"))["version"] == 0
+    finally:
+        invalidate_caches("test_epoch_scoped", "test_persistent")
@@ -0,0 +1,176 @@
+import socket
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import paramiko
+import pytest
+from neofs_testlib.shell import CommandOptions
+from neofs_testlib.shell.interfaces import CommandInspector
+from ssh_pool import PooledSSHShell, SSHConnectionPool
+
+LOGIN = "tester"
+PASSWORD = "password"
+# Commands that are rejected by the server, so that their channels fail
+REJECTED_COMMAND = "reject"
+
+
+class _PasswordSudoInspector(CommandInspector):
+    def __init__(self, password: str) -> None:
+        self.password = password
+
+    def inspect(self, command: str) -> str:
+        return f"echo {self.password} | sudo -S {command}"
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        if (username, password) == (LOGIN, PASSWORD):
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_exec_request(self, channel, command):
+        command = command.decode()
+        if command == REJECTED_COMMAND:
+            return False
+        threading.Thread(target=_run_command, args=(channel, command), daemon=True).start()
+        return True
+
+
+def _run_command(channel: paramiko.Channel, command: str) -> None:
+    result = subprocess.run(["bash", "-c", command], capture_output=True)
+    channel.sendall(result.stdout)
+    channel.sendall_stderr(result.stderr)
+    channel.send_exit_status(result.returncode)
+    # Channel is closed by client: if server closed it before reply to exec request is sent,
+    # client would fail the command
+    channel.shutdown_write()
+
+
+class SSHServer:
+    """
+    In-process SSH server that executes commands with local bash
+    """
+
+    host_key = paramiko.RSAKey.generate(2048)
+
+    def __init__(self) -> None:
+        self.transports: list[paramiko.Transport] = []
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen()
+        self.port = self._socket.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def drop_connections(self) -> None:
+        for transport in self.transports:
+            transport.close()
+
+    def close(self) -> None:
+        self.drop_connections()
+        self._socket.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                client, _ = self._socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(client)
+            transport.add_server_key(self.host_key)
+            transport.start_server(server=_ServerInterface())
+            self.transports.append(transport)
+
+
+@pytest.fixture
+def ssh_server():
+    server = SSHServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def shell(ssh_server: SSHServer):
+    shell = PooledSSHShell(
+        host="127.0.0.1", login=LOGIN, password=PASSWORD, port=str(ssh_server.port)
+    )
+    yield shell
+    shell.drop()
+
+
+def test_concurrent_commands_share_connection(ssh_server: SSHServer, shell: PooledSSHShell):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: shell.exec(f"echo {i}"), range(16)))
+
+    assert [result.stdout.strip() for result in results] == [str(i) for i in range(16)]
+    assert len(ssh_server.transports) == 1
+
+
+def test_channel_failure_does_not_break_other_commands(
+    ssh_server: SSHServer, shell: PooledSSHShell
+):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        slow_command = executor.submit(shell.exec, "sleep 1; echo done")
+        with pytest.raises(paramiko.SSHException):
+            shell.exec(REJECTED_COMMAND)
+        assert slow_command.result().stdout.strip() == "done"
+
+    assert shell.exec("echo after").stdout.strip() == "after"
+    assert len(ssh_server.transports) == 1
+
+
+def test_lost_connection_is_reestablished_once(ssh_server: SSHServer, shell: PooledSSHShell):
+    shell.exec("true")
+    ssh_server.drop_connections()
+    # Let client transport notice that connection was closed
+    time.sleep(0.5)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: shell.exec(f"echo {i}"), range(8)))
+
+    assert [result.stdout.strip() for result in results] == [str(i) for i in range(8)]
+    assert len(ssh_server.transports) == 2
+
+
+def test_failed_command_return_code(shell: PooledSSHShell):
+    result = shell.exec("echo out; echo err >&2; exit 3", CommandOptions(check=False))
+
+    assert (result.stdout.strip(), result.stderr.strip(), result.return_code) == ("out", "err", 3)
+
+
+def test_pool_shells_differ_by_credentials_and_inspectors(ssh_server: SSHServer):
+    pool = SSHConnectionPool()
+    shell = pool.get_ssh_shell("127.0.0.1", LOGIN, password=PASSWORD, port=str(ssh_server.port))
+
+    assert pool.get_ssh_shell("127.0.0.1", LOGIN, password=PASSWORD, port=ssh_server.port) is shell
+    assert (
+        pool.get_ssh_shell("127.0.0.1", LOGIN, password="other", port=ssh_server.port) is not shell
+    )
+    assert (
+        pool.get_ssh_shell("127.0.0.1", LOGIN, private_key_path="/key", port=ssh_server.port)
+        is not shell
+    )
+
+    sudo_shells = [
+        pool._get_pooled_shell(
+            "127.0.0.1",
+            LOGIN,
+            str(ssh_server.port),
+            [_PasswordSudoInspector(sudo_password)],
+            password=PASSWORD,
+        )
+        for sudo_password in ["first", "second", "first"]
+    ]
+    assert sudo_shells[0] is sudo_shells[2]
+    assert len({id(shell), *map(id, sudo_shells)}) == 3
+    pool.close()
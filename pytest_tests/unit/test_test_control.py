@@ -0,0 +1,100 @@
+import pytest
+import test_control
+from test_control import ConvergenceTimeoutError, wait_for_convergence
+
+
+class FakeClock:
+    """
+    Clock that is advanced only by sleeps, so that waits take no real time
+    """
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(test_control, "monotonic", clock.monotonic)
+    monkeypatch.setattr(test_control, "sleep", clock.sleep)
+    return clock
+
+
+def _values(*values):
+    iterator = iter(values)
+    return lambda: next(iterator)
+
+
+def test_wait_for_convergence_with_backoff(clock: FakeClock):
+    result = wait_for_convergence(
+        _values(0, 0, 0, 0, 1), timeout=60, max_interval=5, jitter=0, description="test"
+    )
+
+    assert clock.sleeps == [1, 2, 4, 5]
+    assert (result.value, result.elapsed, result.attempts) == (1, 12, 5)
+
+
+def test_wait_for_convergence_with_predicate(clock: FakeClock):
+    result = wait_for_convergence(
+        _values(1, 2, 3), lambda value: value >= 3, initial_interval=0.5, jitter=0
+    )
+
+    assert clock.sleeps == [0.5, 1]
+    assert result.value == 3
+
+
+def test_wait_for_convergence_with_jitter(clock: FakeClock):
+    wait_for_convergence(_values(*[False] * 5, True), max_interval=8, jitter=0.2)
+
+    for delay, interval in zip(clock.sleeps, [1, 2, 4, 8, 8]):
+        assert interval * 0.8 <= delay <= interval * 1.2
+
+
+def test_wait_for_convergence_does_not_sleep_past_deadline(clock: FakeClock):
+    with pytest.raises(ConvergenceTimeoutError, match="in 10s \\(5 check\\(s\\)\\)") as error:
+        wait_for_convergence(lambda: "stale", lambda value: value == "fresh", timeout=10, jitter=0)
+
+    assert clock.sleeps == [1, 2, 4, 3]
+    assert (error.value.last_value, error.value.elapsed) == ("stale", 10)
+
+
+def test_wait_for_convergence_raises_errors(clock: FakeClock):
+    def check():
+        raise RuntimeError("node is unavailable")
+
+    with pytest.raises(RuntimeError, match="node is unavailable"):
+        wait_for_convergence(check)
+    assert clock.sleeps == []
+
+
+def test_wait_for_convergence_ignores_errors(clock: FakeClock):
+    values = iter([RuntimeError("node is unavailable"), RuntimeError("node is starting"), 7])
+
+    def check():
+        value = next(values)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    result = wait_for_convergence(check, jitter=0, ignore_errors=True)
+
+    assert (result.value, result.attempts) == (7, 3)
+
+
+def test_wait_for_convergence_times_out_on_errors(clock: FakeClock):
+    def check():
+        raise RuntimeError("node is unavailable")
+
+    with pytest.raises(ConvergenceTimeoutError) as error:
+        wait_for_convergence(check, timeout=3, jitter=0, ignore_errors=True)
+
+    assert error.value.last_value is None
+    assert clock.sleeps == [1, 2]
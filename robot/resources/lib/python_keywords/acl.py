@@ -14,6 +14,7 @@ from common import ASSETS_DIR, NEOFS_CLI_EXEC, WALLET_CONFIG
 from data_formatters import get_wallet_public_key
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import Shell
+from python_keywords.container import invalidate_container_cache
 
 logger = logging.getLogger("NeoLogger")
 EACL_LIFETIME = 100500
@@ -147,6 +148,7 @@ def set_eacl(
         await_mode=True,
         session=session_token,
     )
+    invalidate_container_cache(cid)
 
 
 def _encode_cid_for_eacl(cid: str) -> str:
@@ -7,10 +7,11 @@
     https://github.com/nspcc-dev/neofs-node/issues/1304. Therefore, the reliable
     retrieval of the aforementioned objects must be done this way: send direct
     "raw" HEAD request to the every Storage Node and return the desired OID on
-    first non-null response.
+    first non-null response. Requests to the nodes are sent concurrently.
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Optional, Tuple
 
 import allure
@@ -18,11 +19,49 @@ import neofs_verbs
 from cluster import Cluster, StorageNode
 from common import WALLET_CONFIG
 from neofs_testlib.shell import Shell
-from neofs_verbs import head_object
+from parallel import iterate_parallel, without_step
+from response_cache import get_cache
 from storage_object import StorageObjectInfo
 
 logger = logging.getLogger("NeoLogger")
 
+# Time limit in seconds for raw HEAD requests that are sent to all nodes concurrently
+# to find split info of a complex object
+SPLIT_INFO_HEAD_TIMEOUT = 30
+
+
+@dataclass
+class ComplexObjectChunk:
+    oid: str
+    offset: int
+    length: int
+
+
+@dataclass
+class ComplexObjectLayout:
+    """
+    Layout of a complex object: its link object and chunks in order of their payload
+
+    Attributes:
+        cid: ID of the container
+        oid: ID of the complex object
+        link_oid: ID of the link object
+        chunks: chunks of the object with their offsets and lengths in the object payload
+    """
+
+    cid: str
+    oid: str
+    link_oid: str
+    chunks: list[ComplexObjectChunk]
+
+    @property
+    def chunk_ids(self) -> list[str]:
+        return [chunk.oid for chunk in self.chunks]
+
+    @property
+    def ranges(self) -> list[Tuple[int, int]]:
+        return [(chunk.offset, chunk.length) for chunk in self.chunks]
+
 
 def get_storage_object_chunks(
     storage_object: StorageObjectInfo, shell: Shell, cluster: Cluster
@@ -40,7 +79,7 @@ def get_storage_object_chunks(
     """
 
     with allure.step(f"Get complex object chunks (f{storage_object.oid})"):
-        split_object_id = get_link_object(
+        return get_complex_object_children(
             storage_object.wallet_file_path,
             storage_object.cid,
             storage_object.oid,
@@ -48,19 +87,6 @@ def get_storage_object_chunks(
             cluster.storage_nodes,
             is_direct=False,
         )
-        head = head_object(
-            storage_object.wallet_file_path,
-            storage_object.cid,
-            split_object_id,
-            shell,
-            cluster.default_rpc_endpoint,
-        )
-
-        chunks_object_ids = []
-        if "split" in head["header"] and "children" in head["header"]["split"]:
-            chunks_object_ids = head["header"]["split"]["children"]
-
-        return chunks_object_ids
 
 
 def get_complex_object_split_ranges(
@@ -82,24 +108,201 @@ def get_complex_object_split_ranges(
     list of object ids of complex object chunks
     """
 
-    ranges: list = []
+    return get_complex_object_layout(
+        storage_object.wallet_file_path,
+        storage_object.cid,
+        storage_object.oid,
+        shell,
+        cluster.storage_nodes,
+    ).ranges
+
+
+@allure.step("Get Complex Object Children")
+def get_complex_object_children(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    bearer: str = "",
+    wallet_config: str = WALLET_CONFIG,
+    is_direct: bool = True,
+) -> list[str]:
+    """
+    Args:
+        wallet (str): path to the wallet on whose behalf the Storage Nodes
+                        are requested
+        cid (str): Container ID which stores the Large Object
+        oid (str): Large Object ID
+        shell: executor for cli command
+        nodes: list of nodes to do search on
+        bearer (optional, str): path to Bearer token file
+        wallet_config (optional, str): path to the neofs-cli config file
+        is_direct: send requests for split info directly to the nodes or not; this flag
+                   turns into `--ttl 1` key
+    Returns:
+        (list): IDs of chunks of the Large Object in order of their payload
+        Only the link object is requested, so unlike get_complex_object_layout headers of
+        chunks are not. Objects are immutable, so children are cached and reused by
+        subsequent calls.
+    """
+    cache = get_cache("complex_object_children", epoch_scoped=False)
+    return cache.get_or_call(
+        (cid, oid, wallet, bearer, wallet_config),
+        lambda: _get_complex_object_children(
+            wallet, cid, oid, shell, nodes, bearer, wallet_config, is_direct
+        ),
+    )
+
+
+@allure.step("Get Complex Object Layout")
+def get_complex_object_layout(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    bearer: str = "",
+    wallet_config: str = WALLET_CONFIG,
+) -> ComplexObjectLayout:
+    """
+    Args:
+        wallet (str): path to the wallet on whose behalf the Storage Nodes
+                        are requested
+        cid (str): Container ID which stores the Large Object
+        oid (str): Large Object ID
+        shell: executor for cli command
+        nodes: list of nodes to do search on
+        bearer (optional, str): path to Bearer token file
+        wallet_config (optional, str): path to the neofs-cli config file
+    Returns:
+        (ComplexObjectLayout): link object and chunks of the Large Object
+        Link object is found by sending raw HEAD requests to all Storage Nodes
+        concurrently, headers of chunks are requested concurrently as well.
+        Objects are immutable, so layout is cached and reused by subsequent calls.
+    """
+    cache = get_cache("complex_object_layout", epoch_scoped=False)
+    return cache.get_or_call(
+        (cid, oid, wallet, bearer, wallet_config),
+        lambda: _get_complex_object_layout(wallet, cid, oid, shell, nodes, bearer, wallet_config),
+    )
+
+
+def _get_link_object_head(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    bearer: str,
+    wallet_config: str,
+    is_direct: bool,
+) -> tuple[str, dict]:
+    split_info = _race_split_info(
+        wallet, cid, oid, shell, nodes, "link", bearer, wallet_config, is_direct
+    )
+    assert split_info, f"No Link Object for {cid}/{oid} found among all Storage Nodes"
+    link_oid, node = split_info
+
+    link_head = neofs_verbs.head_object(
+        wallet,
+        cid,
+        link_oid,
+        shell,
+        node.get_rpc_endpoint(),
+        bearer=bearer,
+        wallet_config=wallet_config,
+    )
+    return link_oid, link_head
+
+
+def _get_complex_object_children(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    bearer: str,
+    wallet_config: str,
+    is_direct: bool,
+) -> list[str]:
+    _, link_head = _get_link_object_head(
+        wallet, cid, oid, shell, nodes, bearer, wallet_config, is_direct
+    )
+    return link_head["header"].get("split", {}).get("children") or []
+
+
+def _get_complex_object_layout(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    bearer: str,
+    wallet_config: str,
+) -> ComplexObjectLayout:
+    link_oid, link_head = _get_link_object_head(
+        wallet, cid, oid, shell, nodes, bearer, wallet_config, is_direct=False
+    )
+    chunk_ids = link_head["header"].get("split", {}).get("children") or []
+
+    # Headers of chunks are requested from all nodes, so that requests are spread evenly
+    results = neofs_verbs.head_objects(
+        wallet,
+        cid,
+        chunk_ids,
+        shell,
+        [node.get_rpc_endpoint() for node in nodes],
+        bearer=bearer,
+        wallet_config=wallet_config,
+    )
+    chunks = []
     offset = 0
-    chunks_ids = get_storage_object_chunks(storage_object, shell, cluster)
-    for chunk_id in chunks_ids:
-        head = head_object(
-            storage_object.wallet_file_path,
-            storage_object.cid,
-            chunk_id,
-            shell,
-            cluster.default_rpc_endpoint,
-        )
+    for result in results:
+        if not result.succeeded:
+            raise result.error
+        length = int(result.result["header"]["payloadLength"])
+        chunks.append(ComplexObjectChunk(result.item, offset, length))
+        offset += length
+    return ComplexObjectLayout(cid, oid, link_oid, chunks)
 
-        length = int(head["header"]["payloadLength"])
-        ranges.append((offset, length))
 
-        offset = offset + length
+def _race_split_info(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    field: str,
+    bearer: str = "",
+    wallet_config: str = WALLET_CONFIG,
+    is_direct: bool = True,
+) -> Optional[tuple[str, StorageNode]]:
+    """
+    Sends raw HEAD request to all nodes concurrently and returns the first non-null value
+    of the split info field along with the node that returned it.
+    """
 
-    return ranges
+    def head(node: StorageNode) -> dict:
+        return without_step(neofs_verbs.head_object)(
+            wallet,
+            cid,
+            oid,
+            shell=shell,
+            endpoint=node.get_rpc_endpoint(),
+            is_raw=True,
+            is_direct=is_direct,
+            bearer=bearer,
+            wallet_config=wallet_config,
+        )
+
+    for result in iterate_parallel(
+        head, nodes, max_workers=len(nodes), deadline=SPLIT_INFO_HEAD_TIMEOUT
+    ):
+        if result.succeeded and result.result and result.result.get(field):
+            return result.result[field], result.item
+        logger.info(f"No {field} object found on {result.item}: {result.error}")
+    return None
 
 
 @allure.step("Get Link Object")
@@ -130,24 +333,11 @@ def get_link_object(
         When no Link Object ID is found after all Storage Nodes polling,
         the function throws an error.
     """
-    for node in nodes:
-        endpoint = node.get_rpc_endpoint()
-        try:
-            resp = neofs_verbs.head_object(
-                wallet,
-                cid,
-                oid,
-                shell=shell,
-                endpoint=endpoint,
-                is_raw=True,
-                is_direct=is_direct,
-                bearer=bearer,
-                wallet_config=wallet_config,
-            )
-            if resp["link"]:
-                return resp["link"]
-        except Exception:
-            logger.info(f"No Link Object found on {endpoint}; continue")
+    split_info = _race_split_info(
+        wallet, cid, oid, shell, nodes, "link", bearer, wallet_config, is_direct
+    )
+    if split_info:
+        return split_info[0]
     logger.error(f"No Link Object for {cid}/{oid} found among all Storage Nodes")
     return None
 
@@ -169,15 +359,8 @@ def get_last_object(
         When no Last Object ID is found after all Storage Nodes polling,
         the function throws an error.
     """
-    for node in nodes:
-        endpoint = node.get_rpc_endpoint()
-        try:
-            resp = neofs_verbs.head_object(
-                wallet, cid, oid, shell=shell, endpoint=endpoint, is_raw=True, is_direct=True
-            )
-            if resp["lastPart"]:
-                return resp["lastPart"]
-        except Exception:
-            logger.info(f"No Last Object found on {endpoint}; continue")
+    split_info = _race_split_info(wallet, cid, oid, shell, nodes, "lastPart")
+    if split_info:
+        return split_info[0]
     logger.error(f"No Last Object for {cid}/{oid} found among all Storage Nodes")
     return None
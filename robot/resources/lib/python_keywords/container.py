@@ -11,9 +11,11 @@ from typing import Optional, Union
 
 import allure
 import json_transformers
-from common import NEOFS_CLI_EXEC, WALLET_CONFIG
+from common import CONTAINER_CACHE_TTL, NEOFS_CLI_EXEC, WALLET_CONFIG
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import Shell
+from perf_stats import measured
+from response_cache import ResponseCache, get_cache
 
 logger = logging.getLogger("NeoLogger")
 
@@ -21,8 +23,13 @@ DEFAULT_PLACEMENT_RULE = "REP 2 IN X CBF 1 SELECT 4 FROM * AS X"
 SINGLE_PLACEMENT_RULE = "REP 1 IN X CBF 1 SELECT 4 FROM * AS X"
 REP_2_FOR_3_NODES_PLACEMENT_RULE = "REP 2 IN X CBF 1 SELECT 3 FROM * AS X"
 
+# Containers that were requested to be deleted: deletion is asynchronous, so info of these
+# containers is not cached, otherwise it may be cached again before container is removed
+_pending_deletions: set[str] = set()
+
 
 @allure.step("Create Container")
+@measured()
 def create_container(
     wallet: str,
     shell: Shell,
@@ -104,6 +111,7 @@ def wait_for_container_deletion(
 ):
     for _ in range(attempts):
         try:
+            invalidate_container_cache(cid)
             get_container(wallet, cid, shell=shell, endpoint=endpoint)
             sleep(sleep_interval)
             continue
@@ -115,6 +123,7 @@ def wait_for_container_deletion(
 
 
 @allure.step("List Containers")
+@measured()
 def list_containers(wallet: str, shell: Shell, endpoint: str) -> list[str]:
     """
     A wrapper for `neofs-cli container list` call. It returns all the
@@ -133,6 +142,7 @@ def list_containers(wallet: str, shell: Shell, endpoint: str) -> list[str]:
 
 
 @allure.step("Get Container")
+@measured()
 def get_container(
     wallet: str,
     cid: str,
@@ -152,7 +162,30 @@ def get_container(
     Returns:
         (dict, str): dict of container attributes
     """
+    # Container info is cached until container is deleted or its eACL is changed, but not longer
+    # than CONTAINER_CACHE_TTL
+    if cid in _pending_deletions:
+        return _get_container(wallet, cid, shell, endpoint, json_mode)
+    return _get_container_cache().get_or_call(
+        (cid, endpoint, wallet, json_mode),
+        lambda: _get_container(wallet, cid, shell, endpoint, json_mode),
+    )
+
+
+def invalidate_container_cache(cid: Optional[str] = None) -> None:
+    """
+    Removes cached info of the container (or of all containers).
+    """
+    _get_container_cache().invalidate((lambda key: key[0] == cid) if cid else None)
+
+
+def _get_container_cache() -> ResponseCache:
+    return get_cache("get_container", epoch_scoped=False, ttl=CONTAINER_CACHE_TTL)
 
+
+def _get_container(
+    wallet: str, cid: str, shell: Shell, endpoint: str, json_mode: bool
+) -> Union[dict, str]:
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
     result = cli.container.get(rpc_endpoint=endpoint, wallet=wallet, cid=cid, json_mode=json_mode)
 
@@ -171,6 +204,7 @@ def get_container(
 @allure.step("Delete Container")
 # TODO: make the error message about a non-found container more user-friendly
 # https://github.com/nspcc-dev/neofs-contract/issues/121
+@measured()
 def delete_container(
     wallet: str,
     cid: str,
@@ -192,6 +226,8 @@ def delete_container(
     This function doesn't return anything.
     """
 
+    _pending_deletions.add(cid)
+    invalidate_container_cache(cid)
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, WALLET_CONFIG)
     cli.container.delete(
         wallet=wallet,
@@ -230,6 +266,7 @@ def _parse_cid(output: str) -> str:
 
 
 @allure.step("Search container by name")
+@measured()
 def search_container_by_name(wallet: str, name: str, shell: Shell, endpoint: str):
     list_cids = list_containers(wallet, shell, endpoint)
     for cid in list_cids:
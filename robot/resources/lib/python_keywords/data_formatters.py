@@ -1,9 +1,24 @@
 import base64
+import fcntl
+import hashlib
 import json
+import logging
+import os
+import stat
+import threading
+import time
+from typing import Optional
 
 import base58
+from common import WALLET_KEYS_CACHE_FILE, WALLET_KEYS_CACHE_SIZE, WALLET_KEYS_CACHE_TTL
 from neo3 import wallet
 
+logger = logging.getLogger("NeoLogger")
+
+# Keys derived from wallets, indexed by hash of wallet content
+_wallet_keys_cache: dict[str, list[dict[str, str]]] = {}
+_wallet_keys_lock = threading.Lock()
+
 
 def dict_to_attrs(attrs: dict) -> str:
     """
@@ -31,12 +46,7 @@ def __fix_wallet_schema(wallet: dict) -> None:
 
 def get_wallet_public_key(wallet_path: str, wallet_password: str, format: str = "hex") -> str:
     #  Get public key from wallet file
-    with open(wallet_path, "r") as file:
-        wallet_content = json.load(file)
-    __fix_wallet_schema(wallet_content)
-
-    wallet_from_json = wallet.Wallet.from_json(wallet_content, password=wallet_password)
-    public_key_hex = str(wallet_from_json.accounts[0].public_key)
+    public_key_hex = get_wallet_keys(wallet_path, wallet_password)[0]["public_key"]
 
     # Convert public key to specified format
     if format == "hex":
@@ -48,3 +58,149 @@ def get_wallet_public_key(wallet_path: str, wallet_password: str, format: str =
         public_key_base64 = base64.b64encode(bytes.fromhex(public_key_hex))
         return public_key_base64.decode("utf-8")
     raise ValueError(f"Invalid public key format: {format}")
+
+
+def get_wallet_script_hash(wallet_path: str, wallet_password: str, account_index: int = -1) -> str:
+    """
+    Returns script hash of wallet account (the last account by default).
+    """
+    return get_wallet_keys(wallet_path, wallet_password)[account_index]["script_hash"]
+
+
+def get_wallet_address(wallet_path: str, wallet_password: str, account_index: int = -1) -> str:
+    """
+    Returns address of wallet account (the last account by default).
+    """
+    return get_wallet_keys(wallet_path, wallet_password)[account_index]["address"]
+
+
+def get_wallet_keys(wallet_path: str, wallet_password: str) -> list[dict[str, str]]:
+    """
+    Returns public keys, script hashes and addresses of all wallet accounts.
+
+    Wallet decryption runs scrypt and takes noticeable time, so derived keys are cached in memory
+    and in the file WALLET_KEYS_CACHE_FILE (shared between processes of the current user). Cache
+    is keyed by hash of wallet content only, as derived keys are public data of the wallet: no
+    secrets are stored, and modified wallet is decrypted again.
+
+    Args:
+        wallet_path (str): path to the wallet file
+        wallet_password (str): password of the wallet
+
+    Returns:
+        (list): dicts with `public_key` (hex), `script_hash` and `address` of each account
+    """
+    with open(wallet_path, "rb") as file:
+        wallet_content = file.read()
+    cache_key = hashlib.sha256(wallet_content).hexdigest()
+
+    with _wallet_keys_lock:
+        keys = _wallet_keys_cache.get(cache_key)
+        if keys is None:
+            keys = _read_wallet_keys_file(cache_key)
+            if keys is None:
+                keys = _derive_wallet_keys(wallet_content, wallet_password)
+            # Entry is written on every first use in session, so that its expiration is renewed
+            _write_wallet_keys_file(cache_key, keys)
+        _wallet_keys_cache[cache_key] = keys
+    return [dict(account_keys) for account_keys in keys]
+
+
+def _derive_wallet_keys(wallet_content: bytes, wallet_password: str) -> list[dict[str, str]]:
+    wallet_json = json.loads(wallet_content)
+    __fix_wallet_schema(wallet_json)
+
+    wallet_from_json = wallet.Wallet.from_json(wallet_json, password=wallet_password)
+    return [
+        {
+            "public_key": str(account.public_key),
+            "script_hash": str(account.script_hash),
+            "address": account.address,
+        }
+        for account in wallet_from_json.accounts
+    ]
+
+
+def _get_wallet_keys_cache_dir() -> Optional[str]:
+    """
+    Returns directory of wallet keys cache file, directory is created accessible to the current
+    user only; None is returned if cache is disabled or directory is accessible to other users
+    """
+    if not WALLET_KEYS_CACHE_FILE:
+        return None
+    cache_dir = os.path.dirname(os.path.abspath(WALLET_KEYS_CACHE_FILE))
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        dir_stat = os.stat(cache_dir)
+    except OSError as err:
+        logger.warning(f"Failed to create wallet keys cache directory {cache_dir}: {err}")
+        return None
+    if dir_stat.st_uid != os.getuid() or dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        logger.warning(
+            f"Wallet keys cache directory {cache_dir} is writable by other users, cache is not used"
+        )
+        return None
+    return cache_dir
+
+
+def _load_wallet_keys_file() -> dict[str, dict]:
+    with open(WALLET_KEYS_CACHE_FILE, "r") as file:
+        fcntl.flock(file, fcntl.LOCK_SH)
+        entries = json.load(file)
+    # Entries of unknown format (e.g. of previous versions of cache) are skipped
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict) and isinstance(entry.get("keys"), list)
+    }
+
+
+def _read_wallet_keys_file(cache_key: str) -> Optional[list[dict[str, str]]]:
+    if not _get_wallet_keys_cache_dir() or not os.path.exists(WALLET_KEYS_CACHE_FILE):
+        return None
+    try:
+        entry = _load_wallet_keys_file().get(cache_key)
+    except (OSError, ValueError, AttributeError) as err:
+        logger.warning(f"Failed to read wallet keys cache {WALLET_KEYS_CACHE_FILE}: {err}")
+        return None
+    if entry is None or time.time() - entry.get("used_at", 0) > WALLET_KEYS_CACHE_TTL:
+        return None
+    return entry["keys"]
+
+
+def _write_wallet_keys_file(cache_key: str, keys: list[dict[str, str]]) -> None:
+    if not _get_wallet_keys_cache_dir():
+        return
+    try:
+        # Exclusive lock on a separate file protects read-modify-write cycle across processes
+        with open(f"{WALLET_KEYS_CACHE_FILE}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            entries = {}
+            if os.path.exists(WALLET_KEYS_CACHE_FILE):
+                try:
+                    entries = _load_wallet_keys_file()
+                except (ValueError, AttributeError) as err:
+                    logger.warning(f"Wallet keys cache {WALLET_KEYS_CACHE_FILE} is reset: {err}")
+            now = time.time()
+            entries[cache_key] = {"keys": keys, "used_at": now}
+            # Expired entries are dropped and only the most recently used entries are kept
+            entries = dict(
+                sorted(
+                    (
+                        (key, entry)
+                        for key, entry in entries.items()
+                        if now - entry.get("used_at", 0) <= WALLET_KEYS_CACHE_TTL
+                    ),
+                    key=lambda item: item[1].get("used_at", 0),
+                    reverse=True,
+                )[:WALLET_KEYS_CACHE_SIZE]
+            )
+
+            temp_file_path = f"{WALLET_KEYS_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(
+                os.open(temp_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w"
+            ) as file:
+                json.dump(entries, file)
+            os.replace(temp_file_path, WALLET_KEYS_CACHE_FILE)
+    except OSError as err:
+        logger.warning(f"Failed to write wallet keys cache {WALLET_KEYS_CACHE_FILE}: {err}")
@@ -1,11 +1,11 @@
 import logging
-from time import sleep
-from typing import Optional
+from typing import Callable, Optional
 
 import allure
-from cluster import Cluster, StorageNode
+from cluster import Cluster, MorphChain, StorageNode
 from common import (
-    MAINNET_BLOCK_TIME,
+    EPOCH_CACHE_TTL,
+    MORPH_BLOCK_TIME,
     NEOFS_ADM_CONFIG_PATH,
     NEOFS_ADM_EXEC,
     NEOFS_CLI_EXEC,
@@ -14,11 +14,19 @@ from common import (
 from neofs_testlib.cli import NeofsAdm, NeofsCli, NeoGo
 from neofs_testlib.shell import Shell
 from neofs_testlib.utils.wallet import get_last_address_from_wallet
-from payment_neogo import get_contract_hash
+from payment_neogo import call_contract, get_contract_hash
+from response_cache import get_cache, invalidate_epoch_caches
+from ssh_pool import ssh_connection_pool
+from test_control import wait_for_convergence
 from utility import parse_time
 
 logger = logging.getLogger("NeoLogger")
 
+# Time in seconds that is added to expected duration of waits for blocks and epochs
+WAIT_TIMEOUT_MARGIN = 30
+# Number of times ticks are resubmitted if chain has not reached the target epoch
+TICK_RETRIES = 2
+
 
 @allure.step("Ensure fresh epoch")
 def ensure_fresh_epoch(
@@ -27,8 +35,7 @@ def ensure_fresh_epoch(
     # ensure new fresh epoch to avoid epoch switch during test session
     alive_node = alive_node if alive_node else cluster.storage_nodes[0]
     current_epoch = get_epoch(shell, cluster, alive_node)
-    tick_epoch(shell, cluster, alive_node)
-    epoch = get_epoch(shell, cluster, alive_node)
+    epoch = tick_epoch(shell, cluster, alive_node)
     assert epoch > current_epoch, "Epoch wasn't ticked"
     return epoch
 
@@ -36,62 +43,245 @@ def ensure_fresh_epoch(
 @allure.step("Get Epoch")
 def get_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode] = None):
     alive_node = alive_node if alive_node else cluster.storage_nodes[0]
+    # Epoch is cached until the next tick, but not longer than EPOCH_CACHE_TTL, as epoch
+    # may also be changed by timer
+    cache = get_cache("epoch", ttl=EPOCH_CACHE_TTL)
+    return cache.get_or_call(
+        cluster.default_rpc_endpoint,
+        lambda: _get_epoch(shell, alive_node, cluster.default_rpc_endpoint),
+    )
+
+
+def _get_epoch(shell: Shell, alive_node: StorageNode, endpoint: str) -> int:
     wallet_path = alive_node.get_wallet_path()
     wallet_config = alive_node.get_wallet_config_path()
 
     cli = NeofsCli(shell=shell, neofs_cli_exec_path=NEOFS_CLI_EXEC, config_file=wallet_config)
 
-    epoch = cli.netmap.epoch(cluster.default_rpc_endpoint, wallet_path)
+    epoch = cli.netmap.epoch(endpoint, wallet_path)
     return int(epoch.stdout)
 
 
 @allure.step("Tick Epoch")
-def tick_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode] = None):
+def tick_epoch(shell: Shell, cluster: Cluster, alive_node: Optional[StorageNode] = None) -> int:
     """
     Tick epoch using neofs-adm or NeoGo if neofs-adm is not available (DevEnv)
     Args:
         shell: local shell to make queries about current epoch. Remote shell will be used to tick new one
         cluster: cluster instance under test
         alive_node: node to send requests to (first node in cluster by default)
+    Returns:
+        new epoch; function returns as soon as the new epoch is visible on the alive node
+    """
+    return _tick_epochs(shell, cluster, 1, alive_node)
+
+
+@allure.step("Tick {epochs} epoch(s)")
+def tick_epochs(
+    shell: Shell, cluster: Cluster, epochs: int, alive_node: Optional[StorageNode] = None
+) -> int:
+    """
+    Tick several epochs: ticks are submitted back-to-back and the function waits only
+    for the final epoch
+    Args:
+        shell: local shell to make queries about current epoch. Remote shell will be used to tick new one
+        cluster: cluster instance under test
+        epochs: number of epochs to tick
+        alive_node: node to send requests to (first node in cluster by default)
+    Returns:
+        new epoch
     """
+    return _tick_epochs(shell, cluster, epochs, alive_node)
+
 
+@allure.step("Advance to epoch {target_epoch}")
+def advance_to_epoch(
+    shell: Shell, cluster: Cluster, target_epoch: int, alive_node: Optional[StorageNode] = None
+) -> int:
+    """
+    Tick epochs until the target epoch is reached (does nothing if it is reached already)
+    Args:
+        shell: local shell to make queries about current epoch. Remote shell will be used to tick new one
+        cluster: cluster instance under test
+        target_epoch: epoch to advance to
+        alive_node: node to send requests to (first node in cluster by default)
+    Returns:
+        new epoch
+    """
+    alive_node = alive_node if alive_node else cluster.storage_nodes[0]
+    morph_chain = cluster.morph_chain_nodes[0]
+    netmap_contract_hash, cur_epoch = _get_chain_epoch(morph_chain)
+    return _advance_to_epoch(
+        shell, cluster, alive_node, netmap_contract_hash, cur_epoch, target_epoch
+    )
+
+
+def _tick_epochs(
+    shell: Shell, cluster: Cluster, epochs: int, alive_node: Optional[StorageNode]
+) -> int:
     alive_node = alive_node if alive_node else cluster.storage_nodes[0]
-    remote_shell = alive_node.host.get_shell()
+    morph_chain = cluster.morph_chain_nodes[0]
+    netmap_contract_hash, cur_epoch = _get_chain_epoch(morph_chain)
+    return _advance_to_epoch(
+        shell, cluster, alive_node, netmap_contract_hash, cur_epoch, cur_epoch + epochs
+    )
+
+
+def _get_chain_epoch(morph_chain: MorphChain) -> tuple[str, int]:
+    """
+    Returns hash of netmap contract and current epoch of morph chain
+    """
+    return call_contract(
+        morph_chain,
+        "netmap.neofs",
+        lambda contract_hash: (contract_hash, morph_chain.epoch_watcher.get_epoch(contract_hash)),
+    )
+
 
+def _advance_to_epoch(
+    shell: Shell,
+    cluster: Cluster,
+    alive_node: StorageNode,
+    netmap_contract_hash: str,
+    cur_epoch: int,
+    target_epoch: int,
+) -> int:
+    """
+    Submits ticks from the current epoch to the target one without waiting for each of them
+    and then waits for the target epoch once.
+
+    Transactions that are sent back-to-back may be reordered in mempool and tick with a lower
+    epoch is rejected then, so the remaining ticks are resubmitted if the chain stops short
+    of the target epoch.
+    """
+    if cur_epoch >= target_epoch:
+        return _wait_for_epoch(shell, cluster, cur_epoch, alive_node, netmap_contract_hash)
+
+    submit_tick = _get_tick_submitter(shell, cluster, alive_node, netmap_contract_hash)
+    watcher = cluster.morph_chain_nodes[0].epoch_watcher
+    timeout = parse_time(MORPH_BLOCK_TIME) * (target_epoch - cur_epoch) + WAIT_TIMEOUT_MARGIN
+    for attempt in range(1 + TICK_RETRIES):
+        for epoch in range(cur_epoch + 1, target_epoch + 1):
+            submit_tick(epoch)
+        try:
+            watcher.wait_for_epoch(netmap_contract_hash, target_epoch, timeout)
+            break
+        except TimeoutError:
+            cur_epoch = watcher.get_epoch(netmap_contract_hash)
+            if attempt == TICK_RETRIES:
+                raise
+            logger.warning(f"Epoch {cur_epoch} is short of {target_epoch}, ticks are resubmitted")
+    return _wait_for_epoch(shell, cluster, target_epoch, alive_node, netmap_contract_hash)
+
+
+def _get_tick_submitter(
+    shell: Shell, cluster: Cluster, alive_node: StorageNode, netmap_contract_hash: str
+) -> Callable[[int], None]:
+    """
+    Returns function that submits tick to the specified epoch using neofs-adm or NeoGo if
+    neofs-adm is not available (DevEnv); credentials are resolved once for all ticks
+    """
     if NEOFS_ADM_EXEC and NEOFS_ADM_CONFIG_PATH:
         # If neofs-adm is available, then we tick epoch with it (to be consistent with UAT tests)
         neofsadm = NeofsAdm(
-            shell=remote_shell,
+            shell=ssh_connection_pool.get_host_shell(alive_node.host),
             neofs_adm_exec_path=NEOFS_ADM_EXEC,
             config_file=NEOFS_ADM_CONFIG_PATH,
         )
-        neofsadm.morph.force_new_epoch()
-        return
+        watcher = cluster.morph_chain_nodes[0].epoch_watcher
 
-    # Otherwise we tick epoch using transaction
-    cur_epoch = get_epoch(shell, cluster)
+        def force_new_epoch(epoch: int) -> None:
+            # neofs-adm always ticks to the next epoch of the chain, so epoch of the chain is
+            # checked before every tick, otherwise slow ticks of the previous attempt that land
+            # after resubmitted ones would move the chain past the target epoch
+            if watcher.get_epoch(netmap_contract_hash) >= epoch:
+                return
+            neofsadm.morph.force_new_epoch()
+
+        return force_new_epoch
 
+    # Otherwise we tick epoch using transaction
     # Use first node by default
     ir_node = cluster.ir_nodes[0]
     # In case if no local_wallet_path is provided, we use wallet_path
     ir_wallet_path = ir_node.get_wallet_path()
     ir_wallet_pass = ir_node.get_wallet_password()
     ir_address = get_last_address_from_wallet(ir_wallet_path, ir_wallet_pass)
+    morph_endpoint = cluster.morph_chain_nodes[0].get_endpoint()
+    neogo = NeoGo(shell, neo_go_exec_path=NEOGO_EXECUTABLE)
 
-    morph_chain = cluster.morph_chain_nodes[0]
-    morph_endpoint = morph_chain.get_endpoint()
+    def submit_tick(epoch: int) -> None:
+        neogo.contract.invokefunction(
+            wallet=ir_wallet_path,
+            wallet_password=ir_wallet_pass,
+            scripthash=netmap_contract_hash,
+            method="newEpoch",
+            arguments=f"int:{epoch}",
+            multisig_hash=f"{ir_address}:Global",
+            address=ir_address,
+            rpc_endpoint=morph_endpoint,
+            force=True,
+            gas=1,
+        )
 
-    neogo = NeoGo(shell, neo_go_exec_path=NEOGO_EXECUTABLE)
-    neogo.contract.invokefunction(
-        wallet=ir_wallet_path,
-        wallet_password=ir_wallet_pass,
-        scripthash=get_contract_hash(morph_chain, "netmap.neofs", shell=shell),
-        method="newEpoch",
-        arguments=f"int:{cur_epoch + 1}",
-        multisig_hash=f"{ir_address}:Global",
-        address=ir_address,
-        rpc_endpoint=morph_endpoint,
-        force=True,
-        gas=1,
+    return submit_tick
+
+
+@allure.step("Wait for epoch {epoch}")
+def wait_for_epoch(
+    shell: Shell, cluster: Cluster, epoch: int, alive_node: Optional[StorageNode] = None
+) -> int:
+    """
+    Waits until the specified epoch is visible on morph chain and on the alive node
+    Args:
+        shell: local shell to make queries about current epoch
+        cluster: cluster instance under test
+        epoch: epoch to wait for
+        alive_node: node to send requests to (first node in cluster by default)
+    Returns:
+        current epoch
+    """
+    alive_node = alive_node if alive_node else cluster.storage_nodes[0]
+    netmap_contract_hash = get_contract_hash(cluster.morph_chain_nodes[0], "netmap.neofs")
+    return _wait_for_epoch(shell, cluster, epoch, alive_node, netmap_contract_hash)
+
+
+@allure.step("Wait for {count} morph chain block(s)")
+def wait_for_morph_blocks(cluster: Cluster, count: int = 1) -> int:
+    """
+    Waits until the specified number of new blocks is added to morph chain
+    Args:
+        cluster: cluster instance under test
+        count: number of blocks to wait for
+    Returns:
+        block count of morph chain after wait
+    """
+    timeout = parse_time(MORPH_BLOCK_TIME) * count + WAIT_TIMEOUT_MARGIN
+    return cluster.morph_chain_nodes[0].epoch_watcher.wait_for_blocks(count, timeout)
+
+
+def _wait_for_epoch(
+    shell: Shell,
+    cluster: Cluster,
+    epoch: int,
+    alive_node: StorageNode,
+    netmap_contract_hash: str,
+) -> int:
+    timeout = parse_time(MORPH_BLOCK_TIME) + WAIT_TIMEOUT_MARGIN
+    watcher = cluster.morph_chain_nodes[0].epoch_watcher
+    watcher.wait_for_epoch(netmap_contract_hash, epoch, timeout)
+
+    # Storage nodes switch to the new epoch after they process the block, so the epoch is
+    # checked on the alive node as well; the node may fail requests while it is switching
+    invalidate_epoch_caches()
+    result = wait_for_convergence(
+        lambda: _get_epoch(shell, alive_node, alive_node.get_rpc_endpoint()),
+        is_converged=lambda node_epoch: node_epoch >= epoch,
+        timeout=timeout,
+        initial_interval=0.2,
+        max_interval=parse_time(MORPH_BLOCK_TIME),
+        ignore_errors=True,
+        description="new epoch on storage node",
     )
-    sleep(parse_time(MAINNET_BLOCK_TIME))
+    invalidate_epoch_caches()
+    return result.value
@@ -1,14 +1,19 @@
 import logging
-from time import sleep
 
 import allure
 from cluster import Cluster, StorageNode
 from neofs_testlib.shell import Shell
-from python_keywords.node_management import storage_node_healthcheck
+from python_keywords.node_management import storage_nodes_healthcheck
 from storage_policy import get_nodes_with_object
+from test_control import ConvergenceTimeoutError, wait_for_convergence
 
 logger = logging.getLogger("NeoLogger")
 
+# Max time in seconds to wait for cluster to recover after failover
+RECOVERY_TIMEOUT = 300
+# Max interval in seconds between checks of cluster state
+RECOVERY_MAX_CHECK_INTERVAL = 15
+
 
 @allure.step("Wait for object replication")
 def wait_object_replication(
@@ -18,37 +23,58 @@ def wait_object_replication(
     shell: Shell,
     nodes: list[StorageNode],
 ) -> list[StorageNode]:
-    sleep_interval, attempts = 15, 20
-    nodes_with_object = []
-    for _ in range(attempts):
-        nodes_with_object = get_nodes_with_object(cid, oid, shell=shell, nodes=nodes)
-        if len(nodes_with_object) >= expected_copies:
-            return nodes_with_object
-        sleep(sleep_interval)
-    raise AssertionError(
-        f"Expected {expected_copies} copies of object, but found {len(nodes_with_object)}. "
-        f"Waiting time {sleep_interval * attempts}"
-    )
+    try:
+        result = wait_for_convergence(
+            lambda: get_nodes_with_object(
+                cid, oid, shell=shell, nodes=nodes, expected_copies=expected_copies
+            ),
+            is_converged=lambda nodes_with_object: len(nodes_with_object) >= expected_copies,
+            timeout=RECOVERY_TIMEOUT,
+            max_interval=RECOVERY_MAX_CHECK_INTERVAL,
+            description="object replication",
+        )
+    except ConvergenceTimeoutError as err:
+        raise AssertionError(
+            f"Expected {expected_copies} copies of object, but found {len(err.last_value or [])}. "
+            f"Waiting time {RECOVERY_TIMEOUT}"
+        ) from err
+    allure.attach(f"{result.elapsed:.1f}s", "Object replication time", allure.attachment_type.TEXT)
+    return result.value
 
 
 @allure.step("Wait for storage nodes returned to cluster")
 def wait_all_storage_nodes_returned(cluster: Cluster) -> None:
-    sleep_interval, attempts = 15, 20
-    for __attempt in range(attempts):
-        if is_all_storage_nodes_returned(cluster):
-            return
-        sleep(sleep_interval)
-    raise AssertionError("Storage node(s) is broken")
+    unhealthy_nodes = cluster.storage_nodes
+
+    def check() -> list[StorageNode]:
+        # Nodes that have already returned are not polled again
+        nonlocal unhealthy_nodes
+        unhealthy_nodes = _get_unhealthy_nodes(unhealthy_nodes)
+        return unhealthy_nodes
+
+    try:
+        result = wait_for_convergence(
+            check,
+            is_converged=lambda nodes: not nodes,
+            timeout=RECOVERY_TIMEOUT,
+            max_interval=RECOVERY_MAX_CHECK_INTERVAL,
+            description="storage nodes return",
+        )
+    except ConvergenceTimeoutError as err:
+        raise AssertionError(f"Storage node(s) is broken: {unhealthy_nodes}") from err
+    allure.attach(
+        f"{result.elapsed:.1f}s", "Storage nodes return time", allure.attachment_type.TEXT
+    )
 
 
 def is_all_storage_nodes_returned(cluster: Cluster) -> bool:
     with allure.step("Run health check for all storage nodes"):
-        for node in cluster.storage_nodes:
-            try:
-                health_check = storage_node_healthcheck(node)
-            except Exception as err:
-                logger.warning(f"Node healthcheck fails with error {err}")
-                return False
-            if health_check.health_status != "READY" or health_check.network_status != "ONLINE":
-                return False
-    return True
+        return not _get_unhealthy_nodes(cluster.storage_nodes)
+
+
+def _get_unhealthy_nodes(nodes: list[StorageNode]) -> list[StorageNode]:
+    results = storage_nodes_healthcheck(nodes)
+    for result in results:
+        if result.error:
+            logger.warning(f"Node {result.node} healthcheck fails with error {result.error}")
+    return [result.node for result in results if not result.is_healthy]
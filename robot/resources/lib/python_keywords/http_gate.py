@@ -16,6 +16,7 @@ from cluster import StorageNode
 from common import SIMPLE_OBJECT_SIZE
 from file_helper import get_file_hash
 from neofs_testlib.shell import Shell
+from perf_stats import measured
 from python_keywords.neofs_verbs import get_object
 from python_keywords.storage_policy import get_nodes_without_object
 
@@ -27,6 +28,7 @@ ASSETS_DIR = os.getenv("ASSETS_DIR", "TemporaryDir/")
 
 
 @allure.step("Get via HTTP Gate")
+@measured(size_of_result=True)
 def get_via_http_gate(cid: str, oid: str, endpoint: str, request_path: Optional[str] = None):
     """
     This function gets given object from HTTP gate
@@ -62,6 +64,7 @@ def get_via_http_gate(cid: str, oid: str, endpoint: str, request_path: Optional[
 
 
 @allure.step("Get via Zip HTTP Gate")
+@measured()
 def get_via_zip_http_gate(cid: str, prefix: str, endpoint: str):
     """
     This function gets given object from HTTP gate
@@ -94,6 +97,7 @@ def get_via_zip_http_gate(cid: str, prefix: str, endpoint: str):
 
 
 @allure.step("Get via HTTP Gate by attribute")
+@measured(size_of_result=True)
 def get_via_http_gate_by_attribute(
     cid: str, attribute: dict, endpoint: str, request_path: Optional[str] = None
 ):
@@ -132,6 +136,7 @@ def get_via_http_gate_by_attribute(
 
 
 @allure.step("Upload via HTTP Gate")
+@measured(size_arg="path")
 def upload_via_http_gate(cid: str, path: str, endpoint: str, headers: dict = None) -> str:
     """
     This function upload given object through HTTP gate
@@ -176,6 +181,7 @@ def is_object_large(filepath: str) -> bool:
 
 
 @allure.step("Upload via HTTP Gate using Curl")
+@measured(size_arg="filepath")
 def upload_via_http_gate_curl(
     cid: str,
     filepath: str,
@@ -223,6 +229,7 @@ def upload_via_http_gate_curl(
 
 
 @allure.step("Get via HTTP Gate using Curl")
+@measured(size_of_result=True)
 def get_via_http_curl(cid: str, oid: str, endpoint: str) -> str:
     """
     This function gets given object from HTTP gate using curl utility.
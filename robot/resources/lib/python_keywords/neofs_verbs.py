@@ -1,19 +1,39 @@
+import itertools
 import json
 import logging
 import os
 import re
+import threading
 import uuid
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
 import allure
 import json_transformers
 from cluster import Cluster
-from common import ASSETS_DIR, NEOFS_CLI_EXEC, WALLET_CONFIG
+from common import (
+    ASSETS_DIR,
+    EPOCH_CACHE_TTL,
+    HEAD_CACHE_ENABLED,
+    HEAD_CACHE_SIZE,
+    NEOFS_CLI_EXEC,
+    PARALLEL_WORKERS,
+    WALLET_CONFIG,
+)
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import Shell
+from parallel import ParallelResult, run_parallel, without_step
+from perf_stats import measured
+from response_cache import ResponseCache, get_cache
 
 logger = logging.getLogger("NeoLogger")
 
+OBJECT_ID_REGEX = re.compile(r"(\w{43,44})")
+NETINFO_PATTERNS = [
+    (re.compile(r"(.*): (\d+)"), int),
+    (re.compile(r"(.*): (false|true)"), bool),
+    (re.compile(r"(.*): (\d+\.\d+)"), float),
+]
+
 
 @allure.step("Get object from random node")
 def get_object_from_random_node(
@@ -48,22 +68,24 @@ def get_object_from_random_node(
         (str): path to downloaded file
     """
     endpoint = cluster.get_random_storage_rpc_endpoint()
-    return get_object(
-        wallet,
-        cid,
-        oid,
-        shell,
-        endpoint,
-        bearer,
-        write_object,
-        xhdr,
-        wallet_config,
-        no_progress,
-        session,
-    )
+    with cluster.endpoint_selector.track(endpoint):
+        return get_object(
+            wallet,
+            cid,
+            oid,
+            shell,
+            endpoint,
+            bearer,
+            write_object,
+            xhdr,
+            wallet_config,
+            no_progress,
+            session,
+        )
 
 
 @allure.step("Get object from {endpoint}")
+@measured(size_of_result=True)
 def get_object(
     wallet: str,
     cid: str,
@@ -117,6 +139,7 @@ def get_object(
 
 
 @allure.step("Get Range Hash from {endpoint}")
+@measured()
 def get_range_hash(
     wallet: str,
     cid: str,
@@ -200,23 +223,25 @@ def put_object_to_random_node(
     """
 
     endpoint = cluster.get_random_storage_rpc_endpoint()
-    return put_object(
-        wallet,
-        path,
-        cid,
-        shell,
-        endpoint,
-        bearer,
-        attributes,
-        xhdr,
-        wallet_config,
-        expire_at,
-        no_progress,
-        session,
-    )
+    with cluster.endpoint_selector.track(endpoint):
+        return put_object(
+            wallet,
+            path,
+            cid,
+            shell,
+            endpoint,
+            bearer,
+            attributes,
+            xhdr,
+            wallet_config,
+            expire_at,
+            no_progress,
+            session,
+        )
 
 
 @allure.step("Put object at {endpoint} in container {cid}")
+@measured(size_arg="path")
 def put_object(
     wallet: str,
     path: str,
@@ -272,6 +297,7 @@ def put_object(
 
 
 @allure.step("Delete object {cid}/{oid} from {endpoint}")
+@measured()
 def delete_object(
     wallet: str,
     cid: str,
@@ -310,6 +336,7 @@ def delete_object(
         xhdr=xhdr,
         session=session,
     )
+    invalidate_head_object_cache(cid)
 
     id_str = result.stdout.split("\n")[1]
     tombstone = id_str.split(":")[1]
@@ -317,6 +344,7 @@ def delete_object(
 
 
 @allure.step("Get Range")
+@measured()
 def get_range(
     wallet: str,
     cid: str,
@@ -367,6 +395,7 @@ def get_range(
 
 
 @allure.step("Lock Object")
+@measured()
 def lock_object(
     wallet: str,
     cid: str,
@@ -417,6 +446,7 @@ def lock_object(
         session=session,
         ttl=ttl,
     )
+    invalidate_head_object_cache(cid)
 
     # splitting CLI output to lines and taking the penultimate line
     id_str = result.stdout.strip().split("\n")[0]
@@ -425,6 +455,7 @@ def lock_object(
 
 
 @allure.step("Search object")
+@measured()
 def search_object(
     wallet: str,
     cid: str,
@@ -460,25 +491,13 @@ def search_object(
         list of found ObjectIDs
     """
 
-    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
-    result = cli.object.search(
-        rpc_endpoint=endpoint,
-        wallet=wallet,
-        cid=cid,
-        bearer=bearer,
-        xhdr=xhdr,
-        filters=[f"{filter_key} EQ {filter_val}" for filter_key, filter_val in filters.items()]
-        if filters
-        else None,
-        session=session,
-        phy=phy,
-        root=root,
+    stdout = _run_search(
+        wallet, cid, shell, endpoint, bearer, filters, wallet_config, xhdr, session, phy, root
     )
-
-    found_objects = re.findall(r"(\w{43,44})", result.stdout)
+    found_objects = [match.group(1) for match in OBJECT_ID_REGEX.finditer(stdout)]
 
     if expected_objects_list:
-        if sorted(found_objects) == sorted(expected_objects_list):
+        if verify_search_result(found_objects, expected_objects_list):
             logger.info(
                 f"Found objects list '{found_objects}' "
                 f"is equal for expected list '{expected_objects_list}'"
@@ -492,7 +511,127 @@ def search_object(
     return found_objects
 
 
+@allure.step("Search objects iteratively")
+def iter_search_object(
+    wallet: str,
+    cid: str,
+    shell: Shell,
+    endpoint: str,
+    bearer: str = "",
+    filters: Optional[dict] = None,
+    shard_filters: Optional[list[dict]] = None,
+    wallet_config: Optional[str] = None,
+    xhdr: Optional[dict] = None,
+    session: Optional[str] = None,
+    phy: bool = False,
+    root: bool = False,
+) -> Iterator[str]:
+    """
+    SEARCH Objects and iterate over found ObjectIDs.
+
+    Object IDs are parsed from the output one by one, so caller may stop iteration as soon
+    as it found what it needs. Huge result sets can be split into shards with additional
+    filters: search for each shard is executed only when iteration reaches it, so only output
+    of one shard is held in memory at a time.
+
+    Args:
+        wallet: wallet on whose behalf SEARCH is done
+        cid: ID of Container where we get the Object from
+        shell: executor for cli command
+        endpoint: NeoFS endpoint to send request to, appends to `--rpc-endpoint` key
+        bearer: path to Bearer Token file, appends to `--bearer` key
+        filters: key=value pairs to filter Objects
+        shard_filters: key=value pairs that are added to `filters` for each shard of
+            the search, shards should not overlap
+        wallet_config: path to the wallet config
+        xhdr: Request X-Headers in form of Key=Value
+        session: path to a JSON-encoded container session token
+        phy: Search physically stored objects.
+        root: Search for user objects.
+
+    Returns:
+        iterator over found ObjectIDs
+    """
+
+    def search_shard(shard_filter: dict) -> Iterator[str]:
+        stdout = _run_search(
+            wallet,
+            cid,
+            shell,
+            endpoint,
+            bearer,
+            {**(filters or {}), **shard_filter},
+            wallet_config,
+            xhdr,
+            session,
+            phy,
+            root,
+        )
+        return (match.group(1) for match in OBJECT_ID_REGEX.finditer(stdout))
+
+    shards = shard_filters or [{}]
+    # Search of the first shard is executed right away, so that errors are raised by this call
+    first_shard_objects = search_shard(shards[0])
+    return itertools.chain(
+        first_shard_objects,
+        itertools.chain.from_iterable(search_shard(shard) for shard in shards[1:]),
+    )
+
+
+def verify_search_result(found_objects: Iterable[str], expected_objects: Iterable[str]) -> bool:
+    """
+    Checks that search found exactly the expected objects.
+
+    Comparison stops at the first unexpected (or duplicated) object, without consuming the rest
+    of found objects.
+
+    Args:
+        found_objects: ObjectIDs found by search, may be an iterator
+        expected_objects: ObjectIDs that should be found
+
+    Returns:
+        True if found objects match expected objects
+    """
+    not_found = set(expected_objects)
+    for oid in found_objects:
+        if oid not in not_found:
+            return False
+        not_found.remove(oid)
+    return not not_found
+
+
+def _run_search(
+    wallet: str,
+    cid: str,
+    shell: Shell,
+    endpoint: str,
+    bearer: str,
+    filters: Optional[dict],
+    wallet_config: Optional[str],
+    xhdr: Optional[dict],
+    session: Optional[str],
+    phy: bool,
+    root: bool,
+) -> str:
+    cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+    result = cli.object.search(
+        rpc_endpoint=endpoint,
+        wallet=wallet,
+        cid=cid,
+        bearer=bearer,
+        xhdr=xhdr,
+        filters=[f"{filter_key} EQ {filter_val}" for filter_key, filter_val in filters.items()]
+        if filters
+        else None,
+        session=session,
+        phy=phy,
+        root=root,
+    )
+    return result.stdout
+
+
 @allure.step("Get netmap netinfo")
+@measured()
 def get_netmap_netinfo(
     wallet: str,
     shell: Shell,
@@ -517,7 +656,30 @@ def get_netmap_netinfo(
     Returns:
         (dict): dict of parsed command output
     """
+    # Network settings are changed only on epoch tick, so they are cached within an epoch
+    cache_key = (
+        endpoint,
+        wallet,
+        wallet_config,
+        address,
+        ttl,
+        tuple(sorted(xhdr.items())) if xhdr else None,
+    )
+    return get_cache("netmap_netinfo").get_or_call(
+        cache_key,
+        lambda: _get_netmap_netinfo(wallet, shell, endpoint, wallet_config, address, ttl, xhdr),
+    )
 
+
+def _get_netmap_netinfo(
+    wallet: str,
+    shell: Shell,
+    endpoint: str,
+    wallet_config: Optional[str],
+    address: Optional[str],
+    ttl: Optional[int],
+    xhdr: Optional[dict],
+) -> dict[str, Any]:
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
     output = cli.netmap.netinfo(
         wallet=wallet,
@@ -529,19 +691,15 @@ def get_netmap_netinfo(
 
     settings = dict()
 
-    patterns = [
-        (re.compile("(.*): (\d+)"), int),
-        (re.compile("(.*): (false|true)"), bool),
-        (re.compile("(.*): (\d+\.\d+)"), float),
-    ]
-    for pattern, func in patterns:
-        for setting, value in re.findall(pattern, output.stdout):
+    for pattern, func in NETINFO_PATTERNS:
+        for setting, value in pattern.findall(output.stdout):
             settings[setting.lower().strip().replace(" ", "_")] = func(value)
 
     return settings
 
 
 @allure.step("Head object")
+@measured()
 def head_object(
     wallet: str,
     cid: str,
@@ -581,7 +739,87 @@ def head_object(
         or
         (str): HEAD response as a plain text
     """
+    cache = _get_head_object_cache()
+
+    def head():
+        return _head_object(
+            wallet,
+            cid,
+            oid,
+            shell,
+            endpoint,
+            bearer,
+            xhdr,
+            json_output,
+            is_raw,
+            is_direct,
+            wallet_config,
+            session,
+        )
+
+    if not cache.enabled:
+        return head()
+
+    # Responses are reused within an epoch if HEAD cache is enabled (see HEAD_CACHE_ENABLED);
+    # they are also dropped by tick_epoch and expire after EPOCH_CACHE_TTL
+    cache_key = (
+        cid,
+        oid,
+        wallet,
+        endpoint,
+        bearer,
+        tuple(sorted(xhdr.items())) if xhdr else None,
+        json_output,
+        is_raw,
+        is_direct,
+        wallet_config,
+        session,
+        _get_endpoint_epoch(wallet, shell, endpoint, wallet_config),
+    )
+    return cache.get_or_call(cache_key, head)
+
+
+def invalidate_head_object_cache(cid: Optional[str] = None) -> None:
+    """
+    Removes cached HEAD responses for objects of the container (or all cached responses).
+    """
+    _get_head_object_cache().invalidate((lambda key: key[0] == cid) if cid else None)
+
 
+def _get_endpoint_epoch(
+    wallet: str, shell: Shell, endpoint: str, wallet_config: Optional[str]
+) -> int:
+    # Epoch cache is shared with epoch.get_epoch, so it is dropped by tick_epoch as well
+    return get_cache("epoch", ttl=EPOCH_CACHE_TTL).get_or_call(
+        endpoint,
+        lambda: int(
+            NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
+            .netmap.epoch(endpoint, wallet)
+            .stdout
+        ),
+    )
+
+
+def _get_head_object_cache() -> ResponseCache:
+    return get_cache(
+        "head_object", max_size=HEAD_CACHE_SIZE, enabled=HEAD_CACHE_ENABLED, ttl=EPOCH_CACHE_TTL
+    )
+
+
+def _head_object(
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    endpoint: str,
+    bearer: str,
+    xhdr: Optional[dict],
+    json_output: bool,
+    is_raw: bool,
+    is_direct: bool,
+    wallet_config: Optional[str],
+    session: Optional[str],
+):
     cli = NeofsCli(shell, NEOFS_CLI_EXEC, wallet_config or WALLET_CONFIG)
     result = cli.object.head(
         rpc_endpoint=endpoint,
@@ -632,3 +870,256 @@ def head_object(
 
     logger.info("decoding simple header")
     return json_transformers.decode_simple_header(decoded)
+
+
+@allure.step("Put objects in container {cid}")
+def put_objects(
+    wallet: str,
+    paths: list[str],
+    cid: str,
+    shell: Shell,
+    endpoint: Union[str, list[str]],
+    bearer: Optional[str] = None,
+    attributes: Optional[list[Optional[dict]]] = None,
+    xhdr: Optional[dict] = None,
+    wallet_config: Optional[str] = None,
+    expire_at: Optional[int] = None,
+    session: Optional[str] = None,
+    max_workers: int = PARALLEL_WORKERS,
+    max_per_endpoint: Optional[int] = None,
+) -> list[ParallelResult]:
+    """
+    PUT of several files concurrently.
+
+    Args:
+        wallet: wallet on whose behalf PUT is done
+        paths: paths to files to be PUT
+        cid: ID of Container where we put the Objects to
+        shell: executor for cli command
+        endpoint: NeoFS endpoint or list of endpoints; objects are distributed
+            between endpoints in round-robin fashion
+        bearer: path to Bearer Token file, appends to `--bearer` key
+        attributes: User attributes of each object, list should be aligned with `paths`
+        xhdr: Request X-Headers in form of Key=Value
+        wallet_config: path to the wallet config
+        expire_at: Last epoch in the life of the objects
+        session: path to a JSON-encoded container session token
+        max_workers: max number of concurrent neofs-cli calls
+        max_per_endpoint: max number of concurrent neofs-cli calls per endpoint
+    Returns:
+        results in the same order as `paths`; result holds ID of uploaded Object or error
+    """
+    attributes = attributes or [None] * len(paths)
+    assert len(attributes) == len(paths), "Attributes should be specified for each path"
+
+    def put(item: tuple[str, Optional[dict]], item_endpoint: str) -> str:
+        path, object_attributes = item
+        return without_step(put_object)(
+            wallet,
+            path,
+            cid,
+            shell,
+            item_endpoint,
+            bearer=bearer,
+            attributes=object_attributes,
+            xhdr=xhdr,
+            wallet_config=wallet_config,
+            expire_at=expire_at,
+            session=session,
+        )
+
+    return _run_bulk(put, list(zip(paths, attributes)), endpoint, max_workers, max_per_endpoint)
+
+
+@allure.step("Get objects from container {cid}")
+def get_objects(
+    wallet: str,
+    cid: str,
+    oids: list[str],
+    shell: Shell,
+    endpoint: Union[str, list[str]],
+    bearer: Optional[str] = None,
+    xhdr: Optional[dict] = None,
+    wallet_config: Optional[str] = None,
+    session: Optional[str] = None,
+    max_workers: int = PARALLEL_WORKERS,
+    max_per_endpoint: Optional[int] = None,
+) -> list[ParallelResult]:
+    """
+    GET of several objects concurrently.
+
+    Args:
+        wallet: wallet on whose behalf GET is done
+        cid: ID of Container where we get the Objects from
+        oids: Object IDs
+        shell: executor for cli command
+        endpoint: NeoFS endpoint or list of endpoints; objects are distributed
+            between endpoints in round-robin fashion
+        bearer: path to Bearer Token file, appends to `--bearer` key
+        xhdr: Request X-Headers in form of Key=Value
+        wallet_config: path to the wallet config
+        session: path to a JSON-encoded container session token
+        max_workers: max number of concurrent neofs-cli calls
+        max_per_endpoint: max number of concurrent neofs-cli calls per endpoint
+    Returns:
+        results in the same order as `oids`; result holds path to downloaded file or error
+    """
+
+    def get(oid: str, item_endpoint: str) -> str:
+        return without_step(get_object)(
+            wallet,
+            cid,
+            oid,
+            shell,
+            item_endpoint,
+            bearer=bearer,
+            xhdr=xhdr,
+            wallet_config=wallet_config,
+            session=session,
+        )
+
+    return _run_bulk(get, oids, endpoint, max_workers, max_per_endpoint)
+
+
+@allure.step("Head objects in container {cid}")
+def head_objects(
+    wallet: str,
+    cid: str,
+    oids: list[str],
+    shell: Shell,
+    endpoint: Union[str, list[str]],
+    bearer: str = "",
+    xhdr: Optional[dict] = None,
+    json_output: bool = True,
+    is_raw: bool = False,
+    is_direct: bool = False,
+    wallet_config: Optional[str] = None,
+    session: Optional[str] = None,
+    max_workers: int = PARALLEL_WORKERS,
+    max_per_endpoint: Optional[int] = None,
+) -> list[ParallelResult]:
+    """
+    HEAD of several objects concurrently.
+
+    Args:
+        wallet: wallet on whose behalf HEAD is done
+        cid: ID of Container where we get the Objects from
+        oids: Object IDs to HEAD
+        shell: executor for cli command
+        endpoint: NeoFS endpoint or list of endpoints; objects are distributed
+            between endpoints in round-robin fashion
+        bearer: path to Bearer Token file, appends to `--bearer` key
+        xhdr: Request X-Headers in form of Key=Value
+        json_output: return responses in JSON format or not
+        is_raw: send "raw" requests or not
+        is_direct: send requests directly to the node or not
+        wallet_config: path to the wallet config
+        session: path to a JSON-encoded container session token
+        max_workers: max number of concurrent neofs-cli calls
+        max_per_endpoint: max number of concurrent neofs-cli calls per endpoint
+    Returns:
+        results in the same order as `oids`; result holds HEAD response or error
+    """
+
+    def head(oid: str, item_endpoint: str):
+        return without_step(head_object)(
+            wallet,
+            cid,
+            oid,
+            shell,
+            item_endpoint,
+            bearer=bearer,
+            xhdr=xhdr,
+            json_output=json_output,
+            is_raw=is_raw,
+            is_direct=is_direct,
+            wallet_config=wallet_config,
+            session=session,
+        )
+
+    return _run_bulk(head, oids, endpoint, max_workers, max_per_endpoint)
+
+
+@allure.step("Delete objects from container {cid}")
+def delete_objects(
+    wallet: str,
+    cid: str,
+    oids: list[str],
+    shell: Shell,
+    endpoint: Union[str, list[str]],
+    bearer: str = "",
+    wallet_config: Optional[str] = None,
+    xhdr: Optional[dict] = None,
+    session: Optional[str] = None,
+    max_workers: int = PARALLEL_WORKERS,
+    max_per_endpoint: Optional[int] = None,
+) -> list[ParallelResult]:
+    """
+    DELETE of several objects concurrently.
+
+    Args:
+        wallet: wallet on whose behalf DELETE is done
+        cid: ID of Container where we delete the Objects from
+        oids: IDs of Objects we are going to delete
+        shell: executor for cli command
+        endpoint: NeoFS endpoint or list of endpoints; objects are distributed
+            between endpoints in round-robin fashion
+        bearer: path to Bearer Token file, appends to `--bearer` key
+        wallet_config: path to the wallet config
+        xhdr: Request X-Headers in form of Key=Value
+        session: path to a JSON-encoded container session token
+        max_workers: max number of concurrent neofs-cli calls
+        max_per_endpoint: max number of concurrent neofs-cli calls per endpoint
+    Returns:
+        results in the same order as `oids`; result holds Tombstone ID or error
+    """
+
+    def delete(oid: str, item_endpoint: str) -> str:
+        return without_step(delete_object)(
+            wallet,
+            cid,
+            oid,
+            shell,
+            item_endpoint,
+            bearer=bearer,
+            wallet_config=wallet_config,
+            xhdr=xhdr,
+            session=session,
+        )
+
+    return _run_bulk(delete, oids, endpoint, max_workers, max_per_endpoint)
+
+
+def _run_bulk(
+    func: Callable[[Any, str], Any],
+    items: list,
+    endpoint: Union[str, list[str]],
+    max_workers: int,
+    max_per_endpoint: Optional[int],
+) -> list[ParallelResult]:
+    endpoints = [endpoint] if isinstance(endpoint, str) else list(endpoint)
+    assert endpoints, "At least one endpoint should be specified"
+    endpoint_limits = {
+        item_endpoint: threading.BoundedSemaphore(max_per_endpoint or max_workers)
+        for item_endpoint in endpoints
+    }
+
+    def call(indexed_item: tuple[int, Any]) -> Any:
+        index, item = indexed_item
+        item_endpoint = endpoints[index % len(endpoints)]
+        with endpoint_limits[item_endpoint]:
+            return func(item, item_endpoint)
+
+    results = run_parallel(call, list(enumerate(items)), max_workers)
+    for result in results:
+        # Replace (index, item) pair with original item
+        result.item = result.item[1]
+
+    failed = [result for result in results if not result.succeeded]
+    summary = "\n".join(
+        f"{result.item}: {result.error if result.error else result.result} ({result.elapsed:.2f}s)"
+        for result in results
+    )
+    logger.info(f"{len(results) - len(failed)} of {len(results)} requests succeeded:\n{summary}")
+    allure.attach(summary, "Results", allure.attachment_type.TEXT)
+    return results
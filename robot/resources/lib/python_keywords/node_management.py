@@ -1,16 +1,23 @@
 import logging
 import random
 import re
+import threading
 import time
 from dataclasses import dataclass
 from typing import Optional
 
 import allure
 from cluster import Cluster, StorageNode
-from common import MORPH_BLOCK_TIME, NEOFS_CLI_EXEC
-from epoch import tick_epoch
+from common import EPOCH_CACHE_TTL, MORPH_BLOCK_TIME, NEOFS_CLI_EXEC, PARALLEL_WORKERS
+from epoch import tick_epoch, wait_for_morph_blocks
 from neofs_testlib.cli import NeofsCli
-from neofs_testlib.shell import Shell
+from neofs_testlib.shell import CommandOptions, Shell
+from neofs_verbs import invalidate_head_object_cache
+from netmap import Netmap
+from parallel import run_parallel
+from perf_stats import measured
+from response_cache import get_cache
+from ssh_pool import ssh_connection_pool
 from utility import parse_time
 
 logger = logging.getLogger("NeoLogger")
@@ -32,6 +39,159 @@ class HealthStatus:
         return HealthStatus(network, health)
 
 
+@dataclass
+class NodeHealthCheckResult:
+    """
+    Result of health check of a single storage node
+
+    Attributes:
+        node: storage node that was checked
+        health_status: status reported by the node (None if health check failed)
+        latency: time of health check request in seconds
+        error: error message if health check failed
+    """
+
+    node: StorageNode
+    health_status: Optional[HealthStatus] = None
+    latency: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def is_healthy(self) -> bool:
+        return (
+            self.health_status is not None
+            and self.health_status.health_status == "READY"
+            and self.health_status.network_status == "ONLINE"
+        )
+
+    def __str__(self) -> str:
+        latency = f"{self.latency:.2f}s" if self.latency is not None else "n/a"
+        status = (
+            f"{self.health_status.health_status}/{self.health_status.network_status}"
+            if self.health_status
+            else f"error: {self.error}"
+        )
+        return f"{self.node}: {status} ({latency})"
+
+
+class StorageNodeControl:
+    """
+    Client for `neofs-cli control` commands of a storage node.
+
+    Client uses pooled shell to the node host, writes wallet config on the host once and can run
+    several control commands in a single remote call.
+
+    Use get_control_client to obtain client that is shared by all keywords for the node.
+    """
+
+    # Marker that separates outputs of commands executed in a batch
+    RC_MARKER = "__NEOFS_CONTROL_RC__"
+
+    def __init__(self, node: StorageNode) -> None:
+        self.node = node
+        self.wallet_path = node.get_remote_wallet_path()
+        self.wallet_password = node.get_wallet_password()
+        self.control_endpoint = node.get_control_endpoint()
+        self.wallet_config_path = f"/tmp/{node.name}-config.yaml"
+        self.cli_exec_path = node.host.get_cli_config("neofs-cli").exec_path
+        self._shell: Optional[Shell] = None
+        self._wallet_config_written = False
+
+    @property
+    def shell(self) -> Shell:
+        if self._shell is None:
+            self._shell = ssh_connection_pool.get_host_shell(self.node.host)
+        return self._shell
+
+    def healthcheck(self) -> HealthStatus:
+        return HealthStatus.from_stdout(self.run("control healthcheck"))
+
+    def set_status(self, status: str) -> str:
+        return self.run(f"control set-status --status {status}")
+
+    def shards_list(self) -> list[str]:
+        return re.findall(r"Shard (.*):", self.run("control shards list"))
+
+    def shards_set_mode(self, shards: list[str], mode: str) -> list[str]:
+        return self.run_batch(
+            [f"control shards set-mode --id {shard} --mode {mode}" for shard in shards]
+        )
+
+    def drop_objects(self, cid: str, oids: list[str]) -> str:
+        addresses = ",".join(f"{cid}/{oid}" for oid in oids)
+        return self.run(f"control drop-objects  -o {addresses}")
+
+    def run(self, command: str) -> str:
+        """
+        Runs single control command.
+        Args:
+            command: control command without endpoint and wallet arguments.
+        Returns:
+            output of the command.
+        """
+        return self.run_batch([command])[0]
+
+    def run_batch(self, commands: list[str]) -> list[str]:
+        """
+        Runs control commands in a single remote call. All commands are executed even if some
+        of them fail; error is raised after that for the first failed command.
+        Args:
+            commands: control commands without endpoint and wallet arguments.
+        Returns:
+            outputs of the commands.
+        """
+        # Wallet config is written by the first call of the client, so that config left on the
+        # host by previous runs is refreshed; later calls only restore it if host was rebooted
+        wallet_config = f'password: "{self.wallet_password}"'
+        write_config = f"echo '{wallet_config}' > {self.wallet_config_path}"
+        if self._wallet_config_written:
+            write_config = f"[ -f {self.wallet_config_path} ] || {write_config}"
+        script_lines = [write_config]
+        for command in commands:
+            # Marker is printed on a separate line, as output of command may not end with newline
+            script_lines.append(
+                f"{self.cli_exec_path} {command} --endpoint {self.control_endpoint} "
+                f"--wallet {self.wallet_path} --config {self.wallet_config_path} 2>&1; "
+                f"printf '\\n%s:%s\\n' {self.RC_MARKER} $?"
+            )
+        result = self.shell.exec("\n".join(script_lines), CommandOptions(check=False))
+        self._wallet_config_written = True
+
+        # Output is split into outputs and return codes of commands: [output, code, output, ...]
+        parts = re.split(rf"(?:^|\n){self.RC_MARKER}:(\d+)(?:\n|$)", result.stdout)
+        outputs = [
+            (output, int(return_code)) for output, return_code in zip(parts[0::2], parts[1::2])
+        ]
+
+        if len(outputs) != len(commands):
+            raise RuntimeError(
+                f"Control commands {commands} were not completed on {self.node}\n"
+                f"Output: {result.stdout}\nError: {result.stderr}"
+            )
+        for command, (output, return_code) in zip(commands, outputs):
+            if return_code != 0:
+                raise RuntimeError(
+                    f"Command: {command}\nreturn code: {return_code}\nOutput: {output}"
+                )
+        return [output for output, _ in outputs]
+
+
+_control_clients: dict[str, StorageNodeControl] = {}
+_control_clients_lock = threading.Lock()
+
+
+def get_control_client(node: StorageNode) -> StorageNodeControl:
+    """
+    Returns control client of the storage node; client is created on first call for the node.
+    """
+    with _control_clients_lock:
+        client = _control_clients.get(node.name)
+        if client is None:
+            client = StorageNodeControl(node)
+            _control_clients[node.name] = client
+        return client
+
+
 @allure.step("Stop random storage nodes")
 def stop_random_storage_nodes(number: int, nodes: list[StorageNode]) -> list[StorageNode]:
     """
@@ -68,6 +228,7 @@ def get_locode_from_random_node(cluster: Cluster) -> str:
 
 
 @allure.step("Healthcheck for storage node {node}")
+@measured(endpoint_arg="node")
 def storage_node_healthcheck(node: StorageNode) -> HealthStatus:
     """
     The function returns storage node's health status.
@@ -76,12 +237,47 @@ def storage_node_healthcheck(node: StorageNode) -> HealthStatus:
     Returns:
         health status as HealthStatus object.
     """
-    command = "control healthcheck"
-    output = _run_control_command_with_retries(node, command)
-    return HealthStatus.from_stdout(output)
+    return get_control_client(node).healthcheck()
+
+
+@allure.step("Healthcheck for storage nodes")
+def storage_nodes_healthcheck(
+    nodes: list[StorageNode],
+    max_workers: int = PARALLEL_WORKERS,
+    deadline: Optional[float] = None,
+) -> list[NodeHealthCheckResult]:
+    """
+    The function requests health status of the given storage nodes concurrently.
+    Args:
+        nodes: storage nodes for which health status should be retrieved.
+        max_workers: max number of concurrent health check requests.
+        deadline: overall time limit in seconds; nodes that did not respond in time
+            are reported as failed.
+    Returns:
+        health check results in the same order as the given nodes.
+    """
+
+    def healthcheck(node: StorageNode) -> HealthStatus:
+        return get_control_client(node).healthcheck()
+
+    results = [
+        NodeHealthCheckResult(
+            node=result.item,
+            health_status=result.result,
+            latency=result.elapsed,
+            error=str(result.error) if result.error else None,
+        )
+        for result in run_parallel(healthcheck, nodes, max_workers, deadline)
+    ]
+
+    summary = "\n".join(str(result) for result in results)
+    logger.info(f"Health check results:\n{summary}")
+    allure.attach(summary, "Health check results", allure.attachment_type.TEXT)
+    return results
 
 
 @allure.step("Set status for {node}")
+@measured(endpoint_arg="node")
 def storage_node_set_status(node: StorageNode, status: str, retries: int = 0) -> None:
     """
     The function sets particular status for given node.
@@ -95,6 +291,7 @@ def storage_node_set_status(node: StorageNode, status: str, retries: int = 0) ->
 
 
 @allure.step("Get netmap snapshot")
+@measured(endpoint_arg="node")
 def get_netmap_snapshot(node: StorageNode, shell: Shell) -> str:
     """
     The function returns string representation of netmap snapshot.
@@ -104,6 +301,24 @@ def get_netmap_snapshot(node: StorageNode, shell: Shell) -> str:
         string representation of netmap
     """
 
+    # Netmap is changed only on epoch tick, so snapshot is cached within an epoch
+    cache = get_cache("netmap_snapshot", ttl=EPOCH_CACHE_TTL)
+    return cache.get_or_call(node.get_rpc_endpoint(), lambda: _get_netmap_snapshot(node, shell))
+
+
+@allure.step("Get netmap")
+def get_netmap(node: StorageNode, shell: Shell) -> Netmap:
+    """
+    The function returns parsed netmap snapshot.
+    Args:
+        node: node from which netmap snapshot should be requested.
+    Returns:
+        netmap with nodes indexed by public key and attributes
+    """
+    return Netmap.from_snapshot(get_netmap_snapshot(node, shell))
+
+
+def _get_netmap_snapshot(node: StorageNode, shell: Shell) -> str:
     storage_wallet_config = node.get_wallet_config_path()
     storage_wallet_path = node.get_wallet_path()
 
@@ -115,6 +330,7 @@ def get_netmap_snapshot(node: StorageNode, shell: Shell) -> str:
 
 
 @allure.step("Get shard list for {node}")
+@measured(endpoint_arg="node")
 def node_shard_list(node: StorageNode) -> list[str]:
     """
     The function returns list of shards for specified storage node.
@@ -123,34 +339,50 @@ def node_shard_list(node: StorageNode) -> list[str]:
     Returns:
         list of shards.
     """
-    command = "control shards list"
-    output = _run_control_command_with_retries(node, command)
-    return re.findall(r"Shard (.*):", output)
+    return get_control_client(node).shards_list()
 
 
 @allure.step("Shard set for {node}")
+@measured(endpoint_arg="node")
 def node_shard_set_mode(node: StorageNode, shard: str, mode: str) -> str:
     """
     The function sets mode for specified shard.
     Args:
         node: node on which shard mode should be set.
     """
-    command = f"control shards set-mode --id {shard} --mode {mode}"
-    return _run_control_command_with_retries(node, command)
+    return get_control_client(node).shards_set_mode([shard], mode)[0]
+
+
+@allure.step("Set mode {mode} for shards of {node}")
+@measured(endpoint_arg="node")
+def node_shards_set_mode(node: StorageNode, shards: list[str], mode: str) -> list[str]:
+    """
+    The function sets mode for several shards in a single remote call.
+    Args:
+        node: node on which shards mode should be set.
+        shards: IDs of shards.
+        mode: mode to set.
+    Returns:
+        outputs of set-mode commands.
+    """
+    return get_control_client(node).shards_set_mode(shards, mode)
 
 
 @allure.step("Drop object from {node}")
+@measured(endpoint_arg="node")
 def drop_object(node: StorageNode, cid: str, oid: str) -> str:
     """
     The function drops object from specified node.
     Args:
         node_id str: node from which object should be dropped.
     """
-    command = f"control drop-objects  -o {cid}/{oid}"
-    return _run_control_command_with_retries(node, command)
+    result = get_control_client(node).drop_objects(cid, [oid])
+    invalidate_head_object_cache(cid)
+    return result
 
 
 @allure.step("Delete data from host for node {node}")
+@measured(endpoint_arg="node")
 def delete_node_data(node: StorageNode) -> None:
     node.stop_service()
     node.host.delete_storage_node_data(node.name)
@@ -168,12 +400,12 @@ def exclude_node_from_network_map(
 
     storage_node_set_status(node_to_exclude, status="offline")
 
-    time.sleep(parse_time(MORPH_BLOCK_TIME))
+    wait_for_morph_blocks(cluster)
     tick_epoch(shell, cluster)
 
-    snapshot = get_netmap_snapshot(node=alive_node, shell=shell)
+    netmap = get_netmap(node=alive_node, shell=shell)
     assert (
-        node_netmap_key not in snapshot
+        node_netmap_key not in netmap
     ), f"Expected node with key {node_netmap_key} to be absent in network map"
 
 
@@ -189,9 +421,9 @@ def include_node_to_network_map(
     # Per suggestion of @fyrchik we need to wait for 2 blocks after we set status and after tick epoch.
     # First sleep can be omitted after https://github.com/nspcc-dev/neofs-node/issues/1790 complete.
 
-    time.sleep(parse_time(MORPH_BLOCK_TIME) * 2)
+    wait_for_morph_blocks(cluster, 2)
     tick_epoch(shell, cluster)
-    time.sleep(parse_time(MORPH_BLOCK_TIME) * 2)
+    wait_for_morph_blocks(cluster, 2)
 
     check_node_in_map(node_to_include, shell, alive_node)
 
@@ -205,9 +437,9 @@ def check_node_in_map(
     node_netmap_key = node.get_wallet_public_key()
     logger.info(f"Node ({node.label}) netmap key: {node_netmap_key}")
 
-    snapshot = get_netmap_snapshot(alive_node, shell)
+    netmap = get_netmap(alive_node, shell)
     assert (
-        node_netmap_key in snapshot
+        node_netmap_key in netmap
     ), f"Expected node with key {node_netmap_key} to be in network map"
 
 
@@ -222,25 +454,5 @@ def _run_control_command_with_retries(node: StorageNode, command: str, retries:
             raise AssertionError(f"Command {command} failed with error {err}") from err
 
 
-def _run_control_command(node: StorageNode, command: str) -> None:
-    host = node.host
-
-    service_config = host.get_service_config(node.name)
-    wallet_path = service_config.attributes["wallet_path"]
-    wallet_password = service_config.attributes["wallet_password"]
-    control_endpoint = service_config.attributes["control_endpoint"]
-
-    shell = host.get_shell()
-    wallet_config_path = f"/tmp/{node.name}-config.yaml"
-    wallet_config = f'password: "{wallet_password}"'
-    shell.exec(f"echo '{wallet_config}' > {wallet_config_path}")
-
-    cli_config = host.get_cli_config("neofs-cli")
-
-    # TODO: implement cli.control
-    # cli = NeofsCli(shell, cli_config.exec_path, wallet_config_path)
-    result = shell.exec(
-        f"{cli_config.exec_path} {command} --endpoint {control_endpoint} "
-        f"--wallet {wallet_path} --config {wallet_config_path}"
-    )
-    return result.stdout
+def _run_control_command(node: StorageNode, command: str) -> str:
+    return get_control_client(node).run(command)
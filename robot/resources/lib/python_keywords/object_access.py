@@ -11,8 +11,8 @@ from python_keywords.neofs_verbs import (
     get_range,
     get_range_hash,
     head_object,
+    iter_search_object,
     put_object_to_random_node,
-    search_object,
 )
 
 OPERATION_ERROR_TYPE = RuntimeError
@@ -216,7 +216,7 @@ def can_search_object(
 ) -> bool:
     with allure.step("Try search object in container"):
         try:
-            oids = search_object(
+            found_oids = iter_search_object(
                 wallet,
                 cid,
                 bearer=bearer,
@@ -231,5 +231,6 @@ def can_search_object(
             ), f"Expected {err} to match {OBJECT_ACCESS_DENIED}"
             return False
         if oid:
-            return oid in oids
+            # Output is parsed only until the object is found
+            return oid in found_oids
     return True
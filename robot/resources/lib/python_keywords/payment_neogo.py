@@ -1,19 +1,20 @@
 import base64
-import json
 import logging
 import re
-import time
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 import allure
+from chain_rpc import ChainRPCClient
 from cluster import MainChain, MorphChain
-from common import GAS_HASH, MAINNET_BLOCK_TIME, NEOFS_CONTRACT, NEOGO_EXECUTABLE
+from common import GAS_HASH, NEOFS_CONTRACT, NEOGO_EXECUTABLE
+from data_formatters import get_wallet_script_hash
 from neo3 import wallet as neo3_wallet
 from neofs_testlib.cli import NeoGo
-from neofs_testlib.shell import Shell
+from neofs_testlib.shell import CommandOptions, InteractiveInput, Shell
 from neofs_testlib.utils.converters import contract_hash_to_address
 from neofs_testlib.utils.wallet import get_last_address_from_wallet
-from utility import parse_time
+from parallel import run_parallel
+from response_cache import get_cache
 
 logger = logging.getLogger("NeoLogger")
 
@@ -23,21 +24,115 @@ ASSET_POWER_MAINCHAIN = 10**8
 ASSET_POWER_SIDECHAIN = 10**12
 
 
+# NNS names of NeoFS contracts in morph chain, they are resolved together on the first lookup
+NEOFS_CONTRACT_NAMES = (
+    "alphabet0.neofs",
+    "audit.neofs",
+    "balance.neofs",
+    "container.neofs",
+    "neofsid.neofs",
+    "netmap.neofs",
+    "proxy.neofs",
+    "reputation.neofs",
+)
+NNS_CONTRACT_ID = 1
+NNS_RECORD_TYPE_TXT = 16
+
+T = TypeVar("T")
+
+
 def get_nns_contract_hash(morph_chain: MorphChain) -> str:
-    return morph_chain.rpc_client.get_contract_state(1)["hash"]
+    return morph_chain.rpc_client.get_contract_state(NNS_CONTRACT_ID)["hash"]
 
 
-def get_contract_hash(morph_chain: MorphChain, resolve_name: str, shell: Shell) -> str:
-    nns_contract_hash = get_nns_contract_hash(morph_chain)
-    neogo = NeoGo(shell=shell, neo_go_exec_path=NEOGO_EXECUTABLE)
-    out = neogo.contract.testinvokefunction(
-        scripthash=nns_contract_hash,
-        method="resolve",
-        arguments=f"string:{resolve_name} int:16",
-        rpc_endpoint=morph_chain.get_endpoint(),
+def get_contract_hash(
+    morph_chain: MorphChain, resolve_name: str, shell: Optional[Shell] = None
+) -> str:
+    """
+    Returns hash of contract registered in NNS of morph chain under the given name.
+
+    Hashes of all NeoFS contracts are resolved with a single batched request on the first
+    lookup and cached for the chain until `invalidate_contract_hashes` is called.
+    Args:
+        morph_chain: Morph chain node to resolve name on.
+        resolve_name: NNS name of the contract, e.g. netmap.neofs.
+        shell: Not used, contract is resolved over JSON-RPC; kept for compatibility.
+    Returns:
+        Hash of the contract.
+    """
+    names = NEOFS_CONTRACT_NAMES if resolve_name in NEOFS_CONTRACT_NAMES else (resolve_name,)
+    contract_hashes = get_cache("nns_contract_hashes", epoch_scoped=False).get_or_call(
+        (morph_chain.get_endpoint(), names),
+        lambda: _resolve_contract_hashes(morph_chain, names),
+    )
+    if resolve_name not in contract_hashes:
+        raise AssertionError(f"Contract {resolve_name} is not registered in NNS")
+    return contract_hashes[resolve_name]
+
+
+def invalidate_contract_hashes(morph_chain: MorphChain) -> None:
+    """
+    Drops resolved contract hashes of the chain, so that they are resolved again on next lookup.
+    """
+    endpoint = morph_chain.get_endpoint()
+    get_cache("nns_contract_hashes", epoch_scoped=False).invalidate(lambda key: key[0] == endpoint)
+
+
+def call_contract(morph_chain: MorphChain, resolve_name: str, call: Callable[[str], T]) -> T:
+    """
+    Calls function with hash of the contract. Contract may be redeployed during the session,
+    so if the call fails, hash is resolved again and the call is retried once. Function
+    should be a read-only call, as it can be executed twice.
+    Args:
+        morph_chain: Morph chain node to resolve name on.
+        resolve_name: NNS name of the contract.
+        call: Function that accepts contract hash.
+    Returns:
+        Result of the call.
+    """
+    contract_hash = get_contract_hash(morph_chain, resolve_name)
+    try:
+        return call(contract_hash)
+    except Exception as err:
+        logger.info(f"Call of contract {resolve_name} ({contract_hash}) failed: {err}")
+        invalidate_contract_hashes(morph_chain)
+        return call(get_contract_hash(morph_chain, resolve_name))
+
+
+def _resolve_contract_hashes(morph_chain: MorphChain, names: tuple[str, ...]) -> dict[str, str]:
+    rpc_client = morph_chain.rpc_client
+    nns_state = rpc_client.call_batch([("getcontractstate", [NNS_CONTRACT_ID])])[0]
+    if "error" in nns_state:
+        raise AssertionError(f"Failed to get NNS contract state: {nns_state['error']}")
+    nns_contract_hash = nns_state["result"]["hash"]
+
+    responses = rpc_client.call_batch(
+        [
+            (
+                "invokefunction",
+                [
+                    nns_contract_hash,
+                    "resolve",
+                    [
+                        {"type": "String", "value": name},
+                        {"type": "Integer", "value": str(NNS_RECORD_TYPE_TXT)},
+                    ],
+                ],
+            )
+            for name in names
+        ]
     )
-    stack_data = json.loads(out.stdout.replace("\n", ""))["stack"][0]["value"]
-    return bytes.decode(base64.b64decode(stack_data[0]["value"]))
+    contract_hashes = {}
+    for name, response in zip(names, responses):
+        result = response.get("result") or {}
+        if result.get("state") != "HALT" or not result["stack"][0].get("value"):
+            # Not every contract is deployed in every network (e.g. audit or reputation)
+            logger.info(f"Failed to resolve {name} in NNS: {response.get('error') or result}")
+            continue
+        stack_data = result["stack"][0]["value"]
+        contract_hashes[name] = bytes.decode(base64.b64decode(stack_data[0]["value"]))
+    logger.info(f"Resolved contract hashes: {contract_hashes}")
+    return contract_hashes
 
 
 @allure.step("Withdraw Mainnet Gas")
@@ -61,7 +156,7 @@ def withdraw_mainnet_gas(shell: Shell, main_chain: MainChain, wlt: str, amount:
     if m is None:
         raise Exception("Can not get Tx.")
     tx = m.group(1)
-    if not transaction_accepted(tx):
+    if not transaction_accepted(main_chain, tx):
         raise AssertionError(f"TX {tx} hasn't been processed")
 
 
@@ -73,18 +168,12 @@ def transaction_accepted(main_chain: MainChain, tx_id: str):
     Returns:
         (bool)
     """
-
     try:
-        for _ in range(0, TX_PERSIST_TIMEOUT):
-            time.sleep(1)
-            resp = main_chain.rpc_client.get_transaction_height(tx_id)
-            if resp is not None:
-                logger.info(f"TX is accepted in block: {resp}")
-                return True
-    except Exception as out:
-        logger.info(f"request failed with error: {out}")
-        raise out
-    return False
+        main_chain.transaction_tracker.wait_for_transactions([tx_id], TX_PERSIST_TIMEOUT)
+    except TimeoutError as out:
+        logger.info(f"TX is not accepted: {out}")
+        return False
+    return True
 
 
 @allure.step("Get NeoFS Balance")
@@ -92,17 +181,40 @@ def get_balance(shell: Shell, morph_chain: MorphChain, wallet_path: str, wallet_
     """
     This function returns NeoFS balance for given wallet.
     """
-    with open(wallet_path) as wallet_file:
-        wallet = neo3_wallet.Wallet.from_json(json.load(wallet_file), password=wallet_password)
-    acc = wallet.accounts[-1]
-    payload = [{"type": "Hash160", "value": str(acc.script_hash)}]
-    try:
-        resp = morph_chain.rpc_client.invoke_function(
-            get_contract_hash(morph_chain, "balance.neofs", shell=shell), "balanceOf", payload
+    return _get_balances(morph_chain, [(wallet_path, wallet_password)])[0]
+
+
+@allure.step("Get NeoFS Balances")
+def get_balances(morph_chain: MorphChain, wallets: list[tuple[str, str]]) -> list[float]:
+    """
+    This function returns NeoFS balances for given wallets, balances are requested
+    with a single batch request.
+    Args:
+        morph_chain: Morph chain node to request balances from.
+        wallets: Paths and passwords of wallets.
+    Returns:
+        Balances in the same order as wallets.
+    """
+    return _get_balances(morph_chain, wallets)
+
+
+def _get_balances(morph_chain: MorphChain, wallets: list[tuple[str, str]]) -> list[float]:
+    # Script hashes are cached by data_formatters, so wallets are not decrypted on every request
+    payloads = [
+        [{"type": "Hash160", "value": get_wallet_script_hash(wallet_path, wallet_password)}]
+        for wallet_path, wallet_password in wallets
+    ]
+
+    def balances_of(contract_hash: str) -> list[int]:
+        responses = morph_chain.rpc_client.invoke_function_batch(
+            [(contract_hash, "balanceOf", payload) for payload in payloads]
         )
-        logger.info(f"Got response \n{resp}")
-        value = int(resp["stack"][0]["value"])
-        return value / ASSET_POWER_SIDECHAIN
+        logger.info(f"Got responses \n{responses}")
+        return [int(resp["stack"][0]["value"]) for resp in responses]
+
+    try:
+        values = call_contract(morph_chain, "balance.neofs", balances_of)
+        return [value / ASSET_POWER_SIDECHAIN for value in values]
     except Exception as out:
         logger.error(f"failed to get wallet balance: {out}")
         raise out
@@ -157,12 +269,119 @@ def transfer_gas(
         token="GAS",
         force=True,
     )
-    txid = out.stdout.strip().split("\n")[-1]
-    if len(txid) != 64:
-        raise Exception("Got no TXID after run the command")
+    txid = _get_txid(out.stdout)
     if not transaction_accepted(main_chain, txid):
         raise AssertionError(f"TX {txid} hasn't been processed")
-    time.sleep(parse_time(MAINNET_BLOCK_TIME))
+
+
+@allure.step("Transfer Gas to several wallets")
+def transfer_gas_to_many(
+    shell: Shell,
+    main_chain: MainChain,
+    amounts: dict[str, float],
+    wallet_from_path: Optional[str] = None,
+    wallet_from_password: Optional[str] = None,
+) -> None:
+    """
+    This function transfers GAS in main chain from mainnet wallet to several
+    addresses with a single multi-recipient transaction.
+    Args:
+        shell: Shell instance.
+        main_chain: Main chain node to send transaction to.
+        amounts: Amounts of gas to transfer by recipient addresses.
+        wallet_from_path: Path to the wallet to transfer assets from (chain node wallet by default).
+        wallet_from_password: Password of the wallet to transfer assets from.
+    """
+    wallet_from_path = wallet_from_path or main_chain.get_wallet_path()
+    wallet_from_password = (
+        wallet_from_password
+        if wallet_from_password is not None
+        else main_chain.get_wallet_password()
+    )
+    address_from = get_last_address_from_wallet(wallet_from_path, wallet_from_password)
+
+    # neo-go expects recipients as positional arguments, so the command is built here
+    # instead of using NeoGo CLI wrapper
+    transfers = " ".join(f"GAS:{address}:{amount}" for address, amount in amounts.items())
+    out = shell.exec(
+        f"{NEOGO_EXECUTABLE} wallet nep17 multitransfer --rpc-endpoint '{main_chain.get_endpoint()}' "
+        f"--wallet '{wallet_from_path}' --from '{address_from}' --force {transfers}",
+        CommandOptions(
+            interactive_inputs=[
+                InteractiveInput(prompt_pattern="assword", input=wallet_from_password)
+            ]
+        ),
+    )
+    wait_for_transactions(main_chain, [_get_txid(out.stdout)])
+
+
+@allure.step("NeoFS Deposit from several wallets")
+def deposit_gas_from_many(
+    shell: Shell,
+    main_chain: MainChain,
+    amount: int,
+    wallets: list[tuple[str, str]],
+) -> None:
+    """
+    Transferring GAS from several wallets to NeoFS contract address. Transactions are
+    sent concurrently and then the function waits for all of them at once.
+    Args:
+        shell: Shell instance.
+        main_chain: Main chain node to send transactions to.
+        amount: Amount of gas to deposit from every wallet.
+        wallets: Paths and passwords of wallets to deposit from.
+    """
+    deposit_addr = contract_hash_to_address(NEOFS_CONTRACT)
+    neogo = NeoGo(shell, neo_go_exec_path=NEOGO_EXECUTABLE)
+
+    def deposit(wallet: tuple[str, str]) -> str:
+        wallet_path, wallet_password = wallet
+        out = neogo.nep17.transfer(
+            rpc_endpoint=main_chain.get_endpoint(),
+            wallet=wallet_path,
+            wallet_password=wallet_password,
+            amount=amount,
+            from_address=get_last_address_from_wallet(wallet_path, wallet_password),
+            to_address=deposit_addr,
+            token="GAS",
+            force=True,
+        )
+        return _get_txid(out.stdout)
+
+    txids = []
+    for result in run_parallel(deposit, wallets):
+        if not result.succeeded:
+            raise result.error
+        txids.append(result.result)
+    wait_for_transactions(main_chain, txids)
+    _wait_for_deposits_processing(main_chain)
+
+
+def wait_for_transactions(main_chain: MainChain, tx_ids: list[str]) -> None:
+    """
+    Waits until all transactions are accepted; transactions are checked together
+    on every new block, so waiting for a batch takes as long as waiting for the slowest one.
+    Args:
+        main_chain: Main chain node to check transactions on.
+        tx_ids: Transaction IDs.
+    """
+    try:
+        main_chain.transaction_tracker.wait_for_transactions(tx_ids, TX_PERSIST_TIMEOUT)
+    except TimeoutError as out:
+        raise AssertionError(f"TX(s) haven't been processed: {out}") from out
+
+
+def _wait_for_deposits_processing(main_chain: MainChain) -> None:
+    # Inner ring mints NeoFS balance in side chain after it handles deposit notification of
+    # the persisted block, so the next main chain block is awaited to give it time to do this
+    main_chain.transaction_tracker.wait_for_blocks(1, TX_PERSIST_TIMEOUT)
+
+
+def _get_txid(output: str) -> str:
+    txid = output.strip().split("\n")[-1]
+    if len(txid) != 64:
+        raise Exception("Got no TXID after run the command")
+    return txid
 
 
 @allure.step("NeoFS Deposit")
@@ -191,23 +410,44 @@ def deposit_gas(
         address_to=deposit_addr,
         address_from=address_from,
     )
+    _wait_for_deposits_processing(main_chain)
 
 
 @allure.step("Get Mainnet Balance")
 def get_mainnet_balance(main_chain: MainChain, address: str):
-    resp = main_chain.rpc_client.get_nep17_balances(address=address)
-    logger.info(f"Got getnep17balances response: {resp}")
-    for balance in resp["balance"]:
-        if balance["assethash"] == GAS_HASH:
-            return float(balance["amount"]) / ASSET_POWER_MAINCHAIN
-    return float(0)
+    return _get_gas_balances(main_chain.rpc_client, [address], ASSET_POWER_MAINCHAIN)[address]
+
+
+@allure.step("Get Mainnet Balances")
+def get_mainnet_balances(main_chain: MainChain, addresses: list[str]) -> dict[str, float]:
+    """
+    This function returns GAS balances of addresses in main chain with a single batch request.
+    """
+    return _get_gas_balances(main_chain.rpc_client, addresses, ASSET_POWER_MAINCHAIN)
 
 
 @allure.step("Get Sidechain Balance")
 def get_sidechain_balance(morph_chain: MorphChain, address: str):
-    resp = morph_chain.rpc_client.get_nep17_balances(address=address)
-    logger.info(f"Got getnep17balances response: {resp}")
-    for balance in resp["balance"]:
-        if balance["assethash"] == GAS_HASH:
-            return float(balance["amount"]) / ASSET_POWER_SIDECHAIN
-    return float(0)
+    return _get_gas_balances(morph_chain.rpc_client, [address], ASSET_POWER_SIDECHAIN)[address]
+
+
+@allure.step("Get Sidechain Balances")
+def get_sidechain_balances(morph_chain: MorphChain, addresses: list[str]) -> dict[str, float]:
+    """
+    This function returns GAS balances of addresses in side chain with a single batch request.
+    """
+    return _get_gas_balances(morph_chain.rpc_client, addresses, ASSET_POWER_SIDECHAIN)
+
+
+def _get_gas_balances(
+    rpc_client: ChainRPCClient, addresses: list[str], asset_power: int
+) -> dict[str, float]:
+    balances = {}
+    for address, resp in rpc_client.get_nep17_balances_batch(addresses).items():
+        logger.info(f"Got getnep17balances response: {resp}")
+        balances[address] = float(0)
+        for balance in resp["balance"]:
+            if balance["assethash"] == GAS_HASH:
+                balances[address] = float(balance["amount"]) / asset_power
+                break
+    return balances
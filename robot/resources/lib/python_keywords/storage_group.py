@@ -8,10 +8,9 @@ from typing import Optional
 import allure
 from cluster import Cluster
 from common import NEOFS_CLI_EXEC, WALLET_CONFIG
-from complex_object_actions import get_link_object
+from complex_object_actions import get_complex_object_children
 from neofs_testlib.cli import NeofsCli
 from neofs_testlib.shell import Shell
-from neofs_verbs import head_object
 
 logger = logging.getLogger("NeoLogger")
 
@@ -209,26 +208,15 @@ def verify_get_storage_group(
     endpoint = cluster.default_rpc_endpoint
     if object_size > max_object_size:
         for obj in obj_list:
-            link_oid = get_link_object(
+            obj_parts = get_complex_object_children(
                 wallet,
                 cid,
                 obj,
                 shell=shell,
                 nodes=cluster.storage_nodes,
-                bearer=bearer,
+                bearer=bearer or "",
                 wallet_config=wallet_config,
             )
-            obj_head = head_object(
-                wallet=wallet,
-                cid=cid,
-                oid=link_oid,
-                shell=shell,
-                endpoint=endpoint,
-                is_raw=True,
-                bearer=bearer,
-                wallet_config=wallet_config,
-            )
-            obj_parts = obj_head["header"]["split"]["children"]
 
     obj_num = len(obj_list)
     storagegroup_data = get_storagegroup(
@@ -6,7 +6,7 @@
 """
 
 import logging
-from typing import List
+from typing import Iterator, List, Optional
 
 import allure
 import complex_object_actions
@@ -14,9 +14,15 @@ import neofs_verbs
 from cluster import StorageNode
 from grpc_responses import OBJECT_NOT_FOUND, error_matches_status
 from neofs_testlib.shell import Shell
+from parallel import ParallelResult, iterate_parallel, without_step
+from placement_policy import PlacementEvaluator, PlacementNode
 
 logger = logging.getLogger("NeoLogger")
 
+# Time limit in seconds for direct HEAD requests that are sent to all nodes concurrently;
+# node that has not responded in time is considered as a node without object
+NODE_HEAD_TIMEOUT = 30
+
 
 @allure.step("Get Object Copies")
 def get_object_copies(
@@ -47,12 +53,18 @@ def get_object_copies(
 
 @allure.step("Get Simple Object Copies")
 def get_simple_object_copies(
-    wallet: str, cid: str, oid: str, shell: Shell, nodes: list[StorageNode]
+    wallet: str,
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    expected_copies: Optional[int] = None,
 ) -> int:
     """
     To figure out the number of a simple object copies, only direct
     HEAD requests should be made to the every node of the container.
     We consider non-empty HEAD response as a stored object copy.
+    Requests are sent to all nodes concurrently.
     Args:
         wallet (str): the path to the wallet on whose behalf the
                             copies are got
@@ -60,21 +72,20 @@ def get_simple_object_copies(
         oid (str): ID of the Object
         shell: executor for cli command
         nodes: nodes to search on
+        expected_copies: if specified, counting stops as soon as this number
+                            of copies is found
     Returns:
         (int): the number of object copies in the container
     """
     copies = 0
-    for node in nodes:
-        try:
-            response = neofs_verbs.head_object(
-                wallet, cid, oid, shell=shell, endpoint=node.get_rpc_endpoint(), is_direct=True
-            )
-            if response:
-                logger.info(f"Found object {oid} on node {node}")
-                copies += 1
-        except Exception:
-            logger.info(f"No {oid} object copy found on {node}, continue")
-            continue
+    for result in _head_object_on_nodes(cid, oid, shell, nodes, wallet):
+        if result.succeeded and result.result:
+            logger.info(f"Found object {oid} on node {result.item}")
+            copies += 1
+            if expected_copies is not None and copies >= expected_copies:
+                break
+        else:
+            logger.info(f"No {oid} object copy found on {result.item}: {result.error}")
     return copies
 
 
@@ -104,41 +115,66 @@ def get_complex_object_copies(
 
 @allure.step("Get Nodes With Object")
 def get_nodes_with_object(
-    cid: str, oid: str, shell: Shell, nodes: list[StorageNode]
+    cid: str,
+    oid: str,
+    shell: Shell,
+    nodes: list[StorageNode],
+    expected_copies: Optional[int] = None,
 ) -> list[StorageNode]:
     """
     The function returns list of nodes which store
-    the given object.
+    the given object. Requests are sent to all nodes concurrently.
     Args:
          cid (str): ID of the container which store the object
          oid (str): object ID
          shell: executor for cli command
          nodes: nodes to find on
+         expected_copies: if specified, search stops as soon as this number
+                     of nodes with object is found
     Returns:
          (list): nodes which store the object
     """
 
-    nodes_list = []
-    for node in nodes:
-        wallet = node.get_wallet_path()
-        wallet_config = node.get_wallet_config_path()
-        try:
-            res = neofs_verbs.head_object(
-                wallet,
-                cid,
-                oid,
-                shell=shell,
-                endpoint=node.get_rpc_endpoint(),
-                is_direct=True,
-                wallet_config=wallet_config,
-            )
-            if res is not None:
-                logger.info(f"Found object {oid} on node {node}")
-                nodes_list.append(node)
-        except Exception:
-            logger.info(f"No {oid} object copy found on {node}, continue")
-            continue
-    return nodes_list
+    results = []
+    for result in _head_object_on_nodes(cid, oid, shell, nodes):
+        if result.succeeded and result.result is not None:
+            logger.info(f"Found object {oid} on node {result.item}")
+            results.append(result)
+            if expected_copies is not None and len(results) >= expected_copies:
+                break
+        else:
+            logger.info(f"No {oid} object copy found on {result.item}: {result.error}")
+    return [result.item for result in sorted(results, key=lambda result: result.index)]
+
+
+@allure.step("Get Expected Nodes With Object")
+def get_expected_nodes_with_object(
+    cid: str,
+    oid: str,
+    placement_rule: str,
+    netmap_nodes: list[PlacementNode],
+    nodes: list[StorageNode],
+) -> list[StorageNode]:
+    """
+    The function computes nodes that should store the given object
+    according to placement policy of the container, without sending
+    any requests to the nodes.
+    Args:
+         cid (str): ID of the container which store the object
+         oid (str): object ID
+         placement_rule (str): placement policy of the container
+         netmap_nodes: nodes of the current network map
+         nodes: storage nodes of the cluster
+    Returns:
+         (list): nodes which should store the object, in order of priority
+    """
+    nodes_by_key = {node.get_wallet_public_key(): node for node in nodes}
+    holders = PlacementEvaluator(netmap_nodes).get_object_holders(placement_rule, cid, oid)
+    missing_keys = [
+        holder.public_key for holder in holders if holder.public_key not in nodes_by_key
+    ]
+    assert not missing_keys, f"Nodes with keys {missing_keys} are not found in the cluster"
+    return [nodes_by_key[holder.public_key] for holder in holders]
 
 
 @allure.step("Get Nodes Without Object")
@@ -147,7 +183,9 @@ def get_nodes_without_object(
 ) -> list[StorageNode]:
     """
     The function returns list of nodes which do not store
-    the given object.
+    the given object. Requests are sent to all nodes concurrently,
+    nodes that do not respond within NODE_HEAD_TIMEOUT are
+    considered as nodes without object.
     Args:
          wallet (str): the path to the wallet on whose behalf
                      we request the nodes
@@ -157,17 +195,44 @@ def get_nodes_without_object(
     Returns:
          (list): nodes which do not store the object
     """
+    results = sorted(
+        _head_object_on_nodes(cid, oid, shell, nodes, wallet), key=lambda result: result.index
+    )
     nodes_list = []
-    for node in nodes:
-        try:
-            res = neofs_verbs.head_object(
-                wallet, cid, oid, shell=shell, endpoint=node.get_rpc_endpoint(), is_direct=True
-            )
-            if res is None:
-                nodes_list.append(node)
-        except Exception as err:
-            if error_matches_status(err, OBJECT_NOT_FOUND):
-                nodes_list.append(node)
-            else:
-                raise Exception(f"Got error {err} on head object command") from err
+    for result in results:
+        if result.succeeded:
+            if result.result is None:
+                nodes_list.append(result.item)
+        elif error_matches_status(result.error, OBJECT_NOT_FOUND):
+            nodes_list.append(result.item)
+        elif isinstance(result.error, TimeoutError):
+            # Node that has not responded within NODE_HEAD_TIMEOUT is considered as a node
+            # without object
+            logger.info(f"No response from {result.item} about object {oid}: {result.error}")
+            nodes_list.append(result.item)
+        else:
+            raise Exception(f"Got error {result.error} on head object command") from result.error
     return nodes_list
+
+
+def _head_object_on_nodes(
+    cid: str, oid: str, shell: Shell, nodes: list[StorageNode], wallet: Optional[str] = None
+) -> Iterator[ParallelResult[StorageNode]]:
+    """
+    Sends direct HEAD request to every node concurrently and yields results as they arrive.
+
+    Requests are made on behalf of the given wallet or on behalf of each node's own wallet.
+    """
+
+    def head(node: StorageNode):
+        return without_step(neofs_verbs.head_object)(
+            wallet or node.get_wallet_path(),
+            cid,
+            oid,
+            shell=shell,
+            endpoint=node.get_rpc_endpoint(),
+            is_direct=True,
+            wallet_config=None if wallet else node.get_wallet_config_path(),
+        )
+
+    return iterate_parallel(head, nodes, max_workers=len(nodes), deadline=NODE_HEAD_TIMEOUT)
@@ -1,8 +1,7 @@
-import json
 import logging
 
 import allure
-from neo3 import wallet
+from data_formatters import get_wallet_address
 from neofs_testlib.shell import Shell
 from neofs_verbs import head_object
 
@@ -21,10 +20,7 @@ def verify_head_tombstone(
 
     assert header["containerID"] == cid, "Tombstone Header CID is wrong"
 
-    with open(wallet_path, "r") as file:
-        wlt_data = json.loads(file.read())
-    wlt = wallet.Wallet.from_json(wlt_data, password="")
-    addr = wlt.accounts[0].address
+    addr = get_wallet_address(wallet_path, wallet_password="", account_index=0)
 
     assert header["ownerID"] == addr, "Tombstone Owner ID is wrong"
     assert header["objectType"] == "TOMBSTONE", "Header Type isn't Tombstone"
@@ -28,6 +28,21 @@ DEVENV_PATH = os.getenv("DEVENV_PATH", os.path.join("..", "neofs-dev-env"))
 WALLET_PASS = os.getenv("WALLET_PASS", "")
 
 
+# File to persist public keys derived from wallets between test sessions (its directory is
+# created accessible to the current user only); set to empty string to keep derived keys in
+# memory only. Entries that have not been used for WALLET_KEYS_CACHE_TTL seconds are removed and
+# at most WALLET_KEYS_CACHE_SIZE most recently used entries are kept
+WALLET_KEYS_CACHE_FILE = os.getenv(
+    "WALLET_KEYS_CACHE_FILE",
+    os.path.join(
+        os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+        "neofs-testcases",
+        "wallet_keys_cache.json",
+    ),
+)
+WALLET_KEYS_CACHE_TTL = float(os.getenv("WALLET_KEYS_CACHE_TTL", str(7 * 24 * 3600)))
+WALLET_KEYS_CACHE_SIZE = int(os.getenv("WALLET_KEYS_CACHE_SIZE", "1000"))
+
 # Paths to CLI executables on machine that runs tests
 NEOGO_EXECUTABLE = os.getenv("NEOGO_EXECUTABLE", "neo-go")
 NEOFS_CLI_EXEC = os.getenv("NEOFS_CLI_EXEC", "neofs-cli")
@@ -38,9 +53,49 @@ NEOFS_ADM_EXEC = os.getenv("NEOFS_ADM_EXEC", "neofs-adm")
 NEOFS_ADM_CONFIG_PATH = os.getenv("NEOFS_ADM_CONFIG_PATH")
 
 FREE_STORAGE = os.getenv("FREE_STORAGE", "false").lower() == "true"
+# Number of funded wallets that are prepared in advance by wallet factory (0 disables the pool)
+WALLET_POOL_SIZE = int(os.getenv("WALLET_POOL_SIZE", "5"))
 BIN_VERSIONS_FILE = os.getenv("BIN_VERSIONS_FILE")
 
 HOSTING_CONFIG_FILE = os.getenv("HOSTING_CONFIG_FILE", ".devenv.hosting.yaml")
+
+# Max number of concurrent requests made by helpers that fan out to multiple nodes
+PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "10"))
+
+# Max number of concurrent commands over a single pooled SSH connection (should not exceed
+# MaxSessions of sshd) and interval of SSH keep-alive packets in seconds
+SSH_MAX_SESSIONS = int(os.getenv("SSH_MAX_SESSIONS", "8"))
+SSH_KEEPALIVE_INTERVAL = int(os.getenv("SSH_KEEPALIVE_INTERVAL", "30"))
+
+# Policy used to pick storage node endpoint for "random node" requests:
+# random, round-robin, least-outstanding or ewma
+STORAGE_ENDPOINT_SELECTION_POLICY = os.getenv("STORAGE_ENDPOINT_SELECTION_POLICY", "random")
+
+# Directory where report with durations of keyword calls is saved at the end of test session
+PERF_REPORT_DIR = os.getenv("PERF_REPORT_DIR", os.path.join(os.getcwd(), "perf-report"))
+
+# Reuse responses to HEAD requests within an epoch (opt-in, as responses of nodes may change
+# within an epoch when nodes are stopped or objects are dropped by tests) and max number of
+# cached responses
+HEAD_CACHE_ENABLED = os.getenv("HEAD_CACHE_ENABLED", "false").lower() == "true"
+HEAD_CACHE_SIZE = int(os.getenv("HEAD_CACHE_SIZE", "1024"))
+
+# Max age in seconds of cached container info: it is invalidated on container deletion, but
+# container may also be changed or removed by other clients
+CONTAINER_CACHE_TTL = float(os.getenv("CONTAINER_CACHE_TTL", "60"))
+
+# Max age in seconds of cached epoch number, netmap snapshots and HEAD responses: they are
+# invalidated by tick_epoch, but epoch may also change by timer and nodes switch to a new epoch
+# asynchronously
+EPOCH_CACHE_TTL = float(os.getenv("EPOCH_CACHE_TTL", "3"))
+
+# Wait for new blocks and epochs by subscribing to morph chain events over WebSocket RPC; if
+# disabled or subscription fails, chain is polled over JSON-RPC with the specified interval
+MORPH_WEBSOCKET_ENABLED = os.getenv("MORPH_WEBSOCKET_ENABLED", "true").lower() == "true"
+EPOCH_POLL_INTERVAL = float(os.getenv("EPOCH_POLL_INTERVAL", "0.5"))
+# Whether main chain transactions are awaited via WebSocket notifications rather than polling
+MAINNET_WEBSOCKET_ENABLED = os.getenv("MAINNET_WEBSOCKET_ENABLED", "true").lower() == "true"
+
 STORAGE_NODE_SERVICE_NAME_REGEX = r"s\d\d"
 HTTP_GATE_SERVICE_NAME_REGEX = r"http-gate\d\d"
 S3_GATE_SERVICE_NAME_REGEX = r"s3-gate\d\d"